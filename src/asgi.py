@@ -0,0 +1,8 @@
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'crime_project.settings')
+
+# Serve with an ASGI server, e.g. uvicorn crime_project.asgi:application
+application = get_asgi_application()
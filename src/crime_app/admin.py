@@ -1,4 +1,9 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Max
+from django.utils.functional import cached_property
 from .models import (
     Person, PropertyDetail, ChildDetail,
     CriminalCase, CriminalMurderHomicide, CriminalTheft, CriminalAssault, CriminalFraud,
@@ -13,22 +18,155 @@ from .models import (
 )
 
 
+def estimated_row_count(queryset):
+    """Cheap row count estimate for a whole table
+
+    The planner's reltuples on PostgreSQL, MAX(pk) elsewhere (an index
+    lookup; overestimates by the number of deleted rows, which
+    EstimatedCountPaginator corrects once it reaches an empty page).
+    """
+    model = queryset.model
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [model._meta.db_table])
+            row = cursor.fetchone()
+        # -1 until the table has been analyzed
+        if row and row[0] >= 0:
+            return row[0]
+    return queryset.model._default_manager.using(queryset.db).aggregate(n=Max('pk'))['n'] or 0
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that never runs an unbounded COUNT(*)
+
+    An unfiltered changelist of a table past `estimate_above` rows uses
+    estimated_row_count(); a filtered one counts at most `count_cap`
+    rows, so it reports (and pages through) no more than that. A page
+    past the end of an overestimated table switches to an exact count
+    and serves the real last page instead.
+    """
+    estimated = False
+
+    def __init__(self, *args, estimate_above=100_000, count_cap=100_000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.estimate_above = estimate_above
+        self.count_cap = count_cap
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimated_row_count(queryset)
+            if estimate > self.estimate_above:
+                self.estimated = True
+                return estimate
+        return queryset.order_by()[:self.count_cap].count()
+
+    def page(self, number):
+        page = super().page(number)
+        # Evaluating the page here caches its rows for the changelist
+        if self.estimated and not page.object_list:
+            self.estimated = False
+            self.__dict__['count'] = self.object_list.order_by().count()
+            self.__dict__.pop('num_pages', None)
+            page = super().page(min(page.number, self.num_pages))
+        return page
+
+
+class CaseChangeList(ChangeList):
+    def __init__(self, request, *args, **kwargs):
+        super().__init__(request, *args, **kwargs)
+        if self.paginator.count != self.result_count:
+            # The paginator replaced an overestimate with the exact count
+            self.result_count = self.paginator.count
+            self.can_show_all = self.result_count <= self.list_max_show_all
+            self.multi_page = self.result_count > self.list_per_page
+            self.page_num = min(self.page_num, self.paginator.num_pages)
+        # Facets are one COUNT per filter option; skip them on big result
+        # sets. >= because a filtered count stops at the paginator's cap
+        if self.result_count >= self.model_admin.max_facet_rows:
+            self.add_facets = False
+            self.is_facets_optional = False
+
+
+class CaseAdmin(admin.ModelAdmin):
+    """Changelist defaults for the (potentially huge) case tables
+
+    - joins the FK/OneToOne columns shown in list_display, nullable ones
+      included (Django's own fallback only follows non-null FKs)
+    - estimated/capped counts instead of COUNT(*) over the whole table
+    - no second "N total" count, and no facets from max_facet_rows on
+    - raw id inputs for the FK/OneToOne fields on the change form
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    max_facet_rows = 100_000
+
+    def __init__(self, model, admin_site):
+        super().__init__(model, admin_site)
+        # Subtype details and people as raw id inputs, not <select>s that
+        # load every row of the related table into the change form
+        if not self.raw_id_fields:
+            self.raw_id_fields = tuple(sorted(self._related_fields()))
+
+    def get_list_select_related(self, request):
+        if self.list_select_related is not False:
+            return self.list_select_related
+        related = tuple(
+            name for name in self.list_display
+            if isinstance(name, str) and name in self._related_fields()
+        )
+        return related or False
+
+    def _related_fields(self):
+        return {
+            field.name for field in self.model._meta.get_fields()
+            if field.many_to_one or (field.one_to_one and field.concrete)
+        }
+
+    def get_changelist(self, request, **kwargs):
+        return CaseChangeList
+
+
+class CaseInline(admin.TabularInline):
+    """Inline whose rows come with their FKs joined and raw id inputs
+
+    Only the FK back to the parent case is left alone, as the formset
+    filters on it.
+    """
+    extra = 1
+
+    def __init__(self, parent_model, admin_site):
+        super().__init__(parent_model, admin_site)
+        self._row_relations = tuple(sorted(
+            field.name for field in self.model._meta.get_fields()
+            if field.many_to_one and field.concrete and field.related_model is not parent_model
+        ))
+        if not self.raw_id_fields:
+            self.raw_id_fields = self._row_relations
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self._row_relations:
+            queryset = queryset.select_related(*self._row_relations)
+        return queryset
+
+
 # Register basic models
 admin.site.register(Person)
 admin.site.register(PropertyDetail)
 admin.site.register(ChildDetail)
 
 # Register Criminal Case models
-class CriminalChargeInline(admin.TabularInline):
+class CriminalChargeInline(CaseInline):
     model = CriminalCharge
-    extra = 1
 
-class CriminalEvidenceInline(admin.TabularInline):
+class CriminalEvidenceInline(CaseInline):
     model = CriminalEvidence
-    extra = 1
 
 @admin.register(CriminalCase)
-class CriminalCaseAdmin(admin.ModelAdmin):
+class CriminalCaseAdmin(CaseAdmin):
     inlines = [CriminalChargeInline, CriminalEvidenceInline]
     list_display = ('fir_number', 'subtype', 'investigation_status', 'chargesheet_filed')
     list_filter = ('subtype', 'investigation_status', 'bail_status')
@@ -41,7 +179,7 @@ admin.site.register(CriminalFraud)
 
 # Register Civil Case models
 @admin.register(CivilCase)
-class CivilCaseAdmin(admin.ModelAdmin):
+class CivilCaseAdmin(CaseAdmin):
     list_display = ('id', 'subtype', 'claim_amount', 'settlement_attempts')
     list_filter = ('subtype', 'settlement_attempts')
     search_fields = ('relief_sought',)
@@ -53,7 +191,7 @@ admin.site.register(CivilTortClaim)
 
 # Register Family Law Case models
 @admin.register(FamilyLawCase)
-class FamilyLawCaseAdmin(admin.ModelAdmin):
+class FamilyLawCaseAdmin(CaseAdmin):
     list_display = ('id', 'subtype', 'marriage_date', 'children_involved')
     list_filter = ('subtype', 'children_involved')
     search_fields = ('marriage_date',)
@@ -65,7 +203,7 @@ admin.site.register(FamilyDomesticViolence)
 
 # Register Property Law Case models
 @admin.register(PropertyLawCase)
-class PropertyLawCaseAdmin(admin.ModelAdmin):
+class PropertyLawCaseAdmin(CaseAdmin):
     list_display = ('id', 'subtype')
     list_filter = ('subtype',)
 
@@ -75,7 +213,7 @@ admin.site.register(PropertyPartitionSuit)
 
 # Register Consumer Dispute Case models
 @admin.register(ConsumerDisputeCase)
-class ConsumerDisputeCaseAdmin(admin.ModelAdmin):
+class ConsumerDisputeCaseAdmin(CaseAdmin):
     list_display = ('id', 'subtype', 'purchase_date', 'compensation_claimed')
     list_filter = ('subtype',)
     search_fields = ('product_service_details',)
@@ -86,7 +224,7 @@ admin.site.register(ConsumerUnfairTradePractice)
 
 # Register Labour Dispute Case models
 @admin.register(LabourDisputeCase)
-class LabourDisputeCaseAdmin(admin.ModelAdmin):
+class LabourDisputeCaseAdmin(CaseAdmin):
     list_display = ('id', 'subtype', 'employee', 'employer_details')
     list_filter = ('subtype',)
     search_fields = ('employer_details',)
@@ -97,7 +235,7 @@ admin.site.register(LabourWorkplaceDiscrimination)
 
 # Register Intellectual Property Case models
 @admin.register(IntellectualPropertyCase)
-class IntellectualPropertyCaseAdmin(admin.ModelAdmin):
+class IntellectualPropertyCaseAdmin(CaseAdmin):
     list_display = ('id', 'subtype', 'ip_owner_details')
     list_filter = ('subtype',)
     search_fields = ('ip_owner_details',)
@@ -108,7 +246,7 @@ admin.site.register(IPCopyright)
 
 # Register Public Law Case models
 @admin.register(PublicLawCase)
-class PublicLawCaseAdmin(admin.ModelAdmin):
+class PublicLawCaseAdmin(CaseAdmin):
     list_display = ('id', 'subtype')
     list_filter = ('subtype',)
 
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 class LegalAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'legal_app'
+
+    def ready(self):
+        # Keep CaseStatsRollup in sync with the case tables
+        from . import signals  # noqa: F401
@@ -0,0 +1,244 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+from .models import CASE_MODELS
+
+# Subtype detail relations (the OneToOne fields) of each case type; the
+# same names key the inline JSON, e.g. {"theft": {"property_type": ...}}
+DETAIL_FIELDS = {
+    case_type: [field.name for field in model._meta.fields if field.one_to_one]
+    for case_type, model in CASE_MODELS.items()
+}
+
+
+def inline_storage():
+    """Whether subtype details live in the cases' JSON column (settings.CASE_DETAIL_STORAGE)"""
+    return getattr(settings, "CASE_DETAIL_STORAGE", "tables") == "inline"
+
+
+class DetailRecords(list):
+    """Child rows of an inline detail; all() mirrors the related manager"""
+
+    def all(self):
+        return self
+
+
+class DetailRecord:
+    """Read-only inline detail with the attributes of its detail model
+
+    Values are converted to the model fields' Python types, FKs (e.g. the
+    murder victim) are nested records and reverse relations (e.g. divorce
+    grounds) are DetailRecords, so code written against the detail
+    models reads both storage modes.
+    """
+
+    def __init__(self, model, values):
+        self._model = model
+        self.__dict__.update(values)
+
+    def __repr__(self):
+        return f"<{self._model.__name__} (inline)>"
+
+
+def _value(field, data):
+    # Missing keys read as the field's default
+    if field.name in data:
+        return data[field.name]
+    return field.get_default() if field.has_default() else None
+
+
+class DetailSchema:
+    """The JSON shape of a detail model, derived from its fields
+
+    Scalar fields are stored as values, FKs as nested objects and reverse
+    FKs from child models as lists of objects. Nested objects only carry
+    their own scalars and FKs, not further children.
+    """
+
+    def __init__(self, model, parent_field=None, children=True):
+        self.model = model
+        self.parent_field = parent_field
+        fields = [
+            field for field in model._meta.concrete_fields
+            if not field.primary_key and field.name != parent_field
+        ]
+        self.values = [field for field in fields if not field.is_relation]
+        self.related = {
+            field.name: DetailSchema(field.related_model, children=False)
+            for field in fields if field.is_relation
+        }
+        self.children = {}
+        if children:
+            for relation in model._meta.related_objects:
+                if relation.one_to_many:
+                    self.children[relation.get_accessor_name()] = DetailSchema(
+                        relation.related_model, parent_field=relation.field.name, children=False,
+                    )
+
+    def dump(self, obj, children_of=None, consumed=None):
+        """JSON-ready dict of a detail instance
+
+        children_of(obj, accessor, child_schema) lists child rows; by
+        default the related manager, which prefetching keeps query-free.
+        Every instance read is added to `consumed` when given.
+        """
+        if consumed is not None:
+            consumed.add(id(obj))
+        data = {field.name: getattr(obj, field.attname) for field in self.values}
+        for name, schema in self.related.items():
+            related = getattr(obj, name)
+            data[name] = schema.dump(related, children_of, consumed) if related is not None else None
+        for accessor, schema in self.children.items():
+            rows = children_of(obj, accessor, schema) if children_of else getattr(obj, accessor).all()
+            data[accessor] = [schema.dump(row, children_of, consumed) for row in rows]
+        return data
+
+    def validate(self, data, path):
+        """Clean `data` against the model fields; raises ValidationError"""
+        if not isinstance(data, dict):
+            raise ValidationError(f"{path}: expected an object")
+        known = {field.name for field in self.values} | set(self.related) | set(self.children)
+        unknown = sorted(set(data) - known)
+        if unknown:
+            raise ValidationError(f"{path}: unknown fields {', '.join(unknown)}")
+
+        cleaned = {}
+        for field in self.values:
+            try:
+                cleaned[field.name] = field.clean(_value(field, data), None)
+            except ValidationError as exc:
+                raise ValidationError(f"{path}.{field.name}: {'; '.join(exc.messages)}") from exc
+        for name, schema in self.related.items():
+            related = data.get(name)
+            if related is None and not self.model._meta.get_field(name).null:
+                raise ValidationError(f"{path}.{name}: this field cannot be null")
+            cleaned[name] = schema.validate(related, f"{path}.{name}") if related is not None else None
+        for accessor, schema in self.children.items():
+            rows = data.get(accessor, [])
+            if not isinstance(rows, list):
+                raise ValidationError(f"{path}.{accessor}: expected a list")
+            cleaned[accessor] = [schema.validate(row, f"{path}.{accessor}[{i}]") for i, row in enumerate(rows)]
+        return cleaned
+
+    def load(self, data):
+        """DetailRecord from stored JSON"""
+        values = {field.name: field.to_python(_value(field, data)) for field in self.values}
+        for name, schema in self.related.items():
+            values[name] = schema.load(data[name]) if data.get(name) is not None else None
+        for accessor, schema in self.children.items():
+            values[accessor] = DetailRecords(schema.load(row) for row in data.get(accessor, []))
+        return DetailRecord(self.model, values)
+
+    def build(self, data, add):
+        """Unsaved instances for stored JSON, passed to add() (e.g. CaseBatch.add)"""
+        obj = self.model(**{field.name: field.to_python(_value(field, data)) for field in self.values})
+        for name, schema in self.related.items():
+            setattr(obj, name, schema.build(data[name], add) if data.get(name) is not None else None)
+        add(obj)
+        for accessor, schema in self.children.items():
+            for row in data.get(accessor, []):
+                child = schema.build(row, add)
+                setattr(child, schema.parent_field, obj)
+        return obj
+
+
+SCHEMAS = {
+    case_type: {
+        name: DetailSchema(model._meta.get_field(name).related_model)
+        for name in DETAIL_FIELDS[case_type]
+    }
+    for case_type, model in CASE_MODELS.items()
+}
+
+
+# (child model, its FK to the detail) for every kind of child row, e.g.
+# (FamilyDivorceGround, "divorce")
+CHILD_RELATIONS = {
+    (child.model, child.parent_field)
+    for schemas in SCHEMAS.values()
+    for schema in schemas.values()
+    for child in schema.children.values()
+}
+
+
+def case_type_of(case):
+    return next(case_type for case_type, model in CASE_MODELS.items() if isinstance(case, model))
+
+
+def validate_details(case_type, details):
+    """Cleaned copy of a case's inline details; raises ValidationError
+
+    At most one subtype detail, named after its OneToOne field.
+    """
+    if details is None:
+        return None
+    if not isinstance(details, dict) or len(details) > 1:
+        raise ValidationError("details: expected an object with at most one subtype detail")
+    schemas = SCHEMAS[case_type]
+    cleaned = {}
+    for name, data in details.items():
+        if name not in schemas:
+            raise ValidationError(f"details: {name} is not a {case_type} subtype detail")
+        cleaned[name] = schemas[name].validate(data, f"details.{name}")
+    return cleaned
+
+
+def set_detail(case, name, data):
+    """Validate and store one subtype detail inline, replacing any other"""
+    case.details = validate_details(case_type_of(case), {name: data})
+
+
+def table_detail(case):
+    """(name, instance) of the case's subtype detail row, or (None, None)"""
+    for name in DETAIL_FIELDS[case_type_of(case)]:
+        detail = getattr(case, name)
+        if detail is not None:
+            return name, detail
+    return None, None
+
+
+def load_details(case):
+    """{name: DetailRecord} from a case's inline JSON"""
+    schemas = SCHEMAS[case_type_of(case)]
+    return {name: schemas[name].load(data) for name, data in (case.details or {}).items()}
+
+
+def subtype_detail(case):
+    """The case's subtype detail wherever it is held, or None"""
+    if case.details is not None:
+        return next(iter(load_details(case).values()), None)
+    return table_detail(case)[1]
+
+
+class InlineCase:
+    """Case proxy whose detail relations read the inline JSON
+
+    Everything else is the case's own attribute, so the per-type
+    serializers run unchanged on either storage mode.
+    """
+
+    def __init__(self, case):
+        self._case = case
+        self._details = load_details(case)
+        self._detail_fields = DETAIL_FIELDS[case_type_of(case)]
+
+    def __getattr__(self, name):
+        if name in self._detail_fields:
+            return self._details.get(name)
+        return getattr(self._case, name)
+
+
+def readable(case):
+    """The case, or an InlineCase when its detail is held inline
+
+    Decided per case rather than by CASE_DETAIL_STORAGE, so cases on the
+    other side of an unfinished convert_case_details run read the same.
+    """
+    return InlineCase(case) if case.details is not None else case
+
+
+def inline_path(case_type, path):
+    """JSON lookup path for a "relation__field" path into a subtype detail"""
+    if path.split("__")[0] in DETAIL_FIELDS[case_type]:
+        return f"details__{path}"
+    return path
@@ -0,0 +1,96 @@
+from django.contrib.contenttypes.models import ContentType
+
+from .models import CASE_MODELS, CaseIndex, CaseTypeEnum
+
+# CaseIndex hot column -> case field it is copied from, per case type
+CASE_INDEX_COLUMNS = {
+    CaseTypeEnum.CRIMINAL: {"status": "investigation_status"},
+    CaseTypeEnum.CIVIL: {"amount": "claim_amount"},
+    CaseTypeEnum.CONSUMER_DISPUTE: {"amount": "compensation_claimed"},
+}
+
+# Fields rewritten when an existing index row is refreshed
+INDEX_FIELDS = ["case_type", "subtype", "created_at", "updated_at", "status", "amount"]
+
+
+def source_fields(case_type):
+    """Case fields an index row is built from"""
+    return ["pk", "subtype", "created_at", "updated_at", *CASE_INDEX_COLUMNS.get(case_type, {}).values()]
+
+
+def index_row(case_type, content_type, values):
+    """Unsaved CaseIndex for a case, from a dict of its source_fields()"""
+    hot = {column: values[field] for column, field in CASE_INDEX_COLUMNS.get(case_type, {}).items()}
+    return CaseIndex(
+        content_type=content_type,
+        object_id=values["pk"],
+        case_type=case_type,
+        subtype=values["subtype"],
+        created_at=values["created_at"],
+        updated_at=values["updated_at"],
+        status=hot.get("status") or "",
+        amount=hot.get("amount"),
+    )
+
+
+def _upsert(rows):
+    CaseIndex.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id"],
+        update_fields=INDEX_FIELDS,
+    )
+
+
+def index_new_cases(case_type, cases):
+    """Index rows for cases just inserted with bulk_create, which sends no signals"""
+    content_type = ContentType.objects.get_for_model(CASE_MODELS[case_type])
+    fields = source_fields(case_type)
+    CaseIndex.objects.bulk_create([
+        index_row(case_type, content_type, {field: getattr(case, field) for field in fields})
+        for case in cases
+    ])
+
+
+def index_case(case_type, case):
+    """Create or refresh the index row of one saved case; returns its id"""
+    content_type = ContentType.objects.get_for_model(case)
+    values = {field: getattr(case, field) for field in source_fields(case_type)}
+    row = index_row(case_type, content_type, values)
+    _upsert([row])
+    if row.pk is None:
+        # Backends that can't return ids from an upsert
+        row.pk = CaseIndex.objects.get(content_type=content_type, object_id=case.pk).pk
+    return row.pk
+
+
+def unindex_case(case):
+    CaseIndex.objects.filter(
+        content_type=ContentType.objects.get_for_model(case), object_id=case.pk,
+    ).delete()
+
+
+def backfill(case_type, batch_size=2000):
+    """Bring the index rows of one case type in line with its table
+
+    Upserts a row for every case, streamed in batches, then drops rows
+    whose case no longer exists. Returns the number of cases indexed.
+    """
+    model = CASE_MODELS[case_type]
+    content_type = ContentType.objects.get_for_model(model)
+    indexed = 0
+    batch = []
+    for values in model.objects.order_by().values(*source_fields(case_type)).iterator(chunk_size=batch_size):
+        batch.append(index_row(case_type, content_type, values))
+        if len(batch) >= batch_size:
+            _upsert(batch)
+            indexed += len(batch)
+            batch = []
+    if batch:
+        _upsert(batch)
+        indexed += len(batch)
+
+    CaseIndex.objects.filter(content_type=content_type).exclude(
+        object_id__in=model.objects.values("pk"),
+    ).delete()
+    return indexed
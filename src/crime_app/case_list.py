@@ -0,0 +1,159 @@
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+
+from .models import CASE_MODELS, CaseIndex, CaseTypeEnum
+from .serializers import serialize_cases
+from .stats import ROLLUP_DIMENSIONS
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Filterable columns: the dashboard dimensions, each of which has a
+# (column, created_at) index from case_indexes()
+LIST_FILTERS = ROLLUP_DIMENSIONS
+
+
+def _pack(keys):
+    payload = json.dumps(keys).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _unpack(cursor, size):
+    keys = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    if not isinstance(keys, list) or len(keys) != size:
+        raise ValueError
+    return keys
+
+
+def encode_cursor(created_at, pk):
+    """Opaque cursor for the position after a case with these keys"""
+    return _pack([created_at, pk])
+
+
+def decode_cursor(cursor):
+    """(created_at, id) from encode_cursor(); ValueError if malformed"""
+    try:
+        created_at, pk = _unpack(cursor, 2)
+        return datetime.fromisoformat(created_at), int(pk)
+    except (TypeError, ValueError, UnicodeDecodeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
+def parse_filters(case_type, params):
+    """Validated queryset filters from query parameters
+
+    Choice fields take one of their values, booleans "true"/"false", and
+    an empty value matches NULL on nullable fields. Raises ValueError.
+    """
+    model = CASE_MODELS[case_type]
+    filters = {}
+    for name in LIST_FILTERS[case_type]:
+        if name not in params:
+            continue
+        raw = params[name]
+        field = model._meta.get_field(name)
+        if raw == "" and field.null:
+            filters[f"{name}__isnull"] = True
+        elif field.get_internal_type() == "BooleanField":
+            if raw.lower() not in ("true", "false"):
+                raise ValueError(f"Invalid {name}: {raw}")
+            filters[name] = raw.lower() == "true"
+        elif raw in [value for value, _label in field.choices]:
+            filters[name] = raw
+        else:
+            raise ValueError(f"Invalid {name}: {raw}")
+    return filters
+
+
+def case_page(case_type, filters=None, cursor=None, limit=PAGE_SIZE):
+    """One page of serialized cases, newest first, and the next page's cursor
+
+    Keyset pagination on (created_at, id): the cursor is turned into a
+    range condition on the (created_at, id) index instead of an OFFSET,
+    so page 1000 costs the same as page 1. The cursor is None on the
+    last page.
+    """
+    queryset = CASE_MODELS[case_type].objects.filter(**(filters or {})).order_by("-created_at", "-id")
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        # The leading created_at bound lets the database seek the index
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk),
+            created_at__lte=created_at,
+        )
+
+    # One extra row tells whether there is a next page
+    results = list(serialize_cases(queryset[:limit + 1]))
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        last = results[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+    return results, next_cursor
+
+
+# Recent cases across all types
+
+FEED_FIELDS = ("id", "case_type", "subtype", "created_at", "updated_at")
+
+
+def encode_feed_cursor(created_at, case_type, pk):
+    return _pack([created_at, case_type, pk])
+
+
+def decode_feed_cursor(cursor):
+    """(created_at, case_type, id) from encode_feed_cursor(); ValueError if malformed"""
+    try:
+        created_at, case_type, pk = _unpack(cursor, 3)
+        return datetime.fromisoformat(created_at), CaseTypeEnum(case_type), int(pk)
+    except (TypeError, ValueError, UnicodeDecodeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
+def _feed_after(cursor):
+    """Condition for index rows that sort after the feed cursor
+
+    The feed is ordered by (created_at, case_type, id), all descending.
+    """
+    created_at, case_type, pk = cursor
+    return (
+        Q(created_at__lt=created_at)
+        | Q(created_at=created_at, case_type__lt=case_type)
+        | Q(created_at=created_at, case_type=case_type, object_id__lt=pk)
+    )
+
+
+def recent_cases(limit=10, cursor=None):
+    """The newest `limit` cases of any type and the cursor for the next page
+
+    A single query on CaseIndex, which holds a narrow row per case of
+    every type, walking its created_at index newest first, so a page
+    reads limit + 1 rows however large the case tables are. Cases are
+    dicts of FEED_FIELDS.
+    """
+    queryset = CaseIndex.objects.order_by("-created_at", "-case_type", "-object_id")
+    if cursor:
+        position = decode_feed_cursor(cursor)
+        # The leading created_at bound lets the database seek the index
+        queryset = queryset.filter(_feed_after(position), created_at__lte=position[0])
+    rows = queryset.values("object_id", "case_type", "subtype", "created_at", "updated_at")[:limit + 1]
+
+    results = [
+        {
+            "id": row["object_id"],
+            "case_type": CaseTypeEnum(row["case_type"]),
+            "subtype": row["subtype"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+        for row in rows
+    ]
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        last = results[-1]
+        next_cursor = encode_feed_cursor(last["created_at"].isoformat(), last["case_type"].value, last["id"])
+    return results, next_cursor
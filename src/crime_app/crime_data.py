@@ -0,0 +1,85 @@
+import csv
+from itertools import groupby
+
+from django.conf import settings
+
+from .models import CRIME_COLUMNS, DistrictCrimeStat
+
+CRIME_FIELDS = list(CRIME_COLUMNS.values())
+
+# Key columns DistrictCrimeStat rows are upserted on
+CRIME_KEY = ("state", "district", "year")
+
+
+def normalize_name(name):
+    """Canonical state/district spelling: the CSV mixes "A&N Islands" and "A & N ISLANDS" """
+    return " ".join(name.replace("&", " & ").split()).upper()
+
+
+def is_total_row(district):
+    # "TOTAL", "ZZ TOTAL" and "DELHI UT TOTAL" are state totals, not districts
+    return district == "TOTAL" or district.endswith(" TOTAL")
+
+
+def read_crime_csv(path=None):
+    """Yield one dict per district-year row of the crime CSV
+
+    Names are normalized and consecutive rows with the same (state,
+    district, year), such as the two J&K railway police rows for 2010,
+    are merged by summing their counts.
+    """
+    with open(path or settings.CRIME_CSV_PATH, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        state_col, district_col, year_col = 0, 1, 2
+        crime_cols = [(header.index(column), field) for column, field in CRIME_COLUMNS.items()]
+
+        def parse(row):
+            district = normalize_name(row[district_col])
+            record = {
+                "state": normalize_name(row[state_col]),
+                "district": district,
+                "year": int(row[year_col]),
+                "is_total": is_total_row(district),
+            }
+            for index, field in crime_cols:
+                record[field] = int(row[index])
+            return record
+
+        records = (parse(row) for row in reader if row)
+        for _key, group in groupby(records, key=lambda record: tuple(record[k] for k in CRIME_KEY)):
+            merged, *duplicates = group
+            for duplicate in duplicates:
+                for field in CRIME_FIELDS:
+                    merged[field] += duplicate[field]
+            yield merged
+
+
+def import_crime_csv(path=None, batch_size=1000):
+    """Upsert the crime CSV into DistrictCrimeStat in batches
+
+    Re-importing the same file updates rows in place, so the import is
+    idempotent. Returns the number of rows written.
+    """
+    written = 0
+    batch = {}
+
+    def flush():
+        DistrictCrimeStat.objects.bulk_create(
+            [DistrictCrimeStat(**record) for record in batch.values()],
+            update_conflicts=True,
+            unique_fields=list(CRIME_KEY),
+            update_fields=["is_total"] + CRIME_FIELDS,
+        )
+        batch.clear()
+
+    for record in read_crime_csv(path):
+        # Keyed so a batch never upserts the same row twice
+        batch[tuple(record[k] for k in CRIME_KEY)] = record
+        if len(batch) >= batch_size:
+            written += len(batch)
+            flush()
+    if batch:
+        written += len(batch)
+        flush()
+    return written
@@ -0,0 +1,261 @@
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+from .crime_data import CRIME_FIELDS, read_crime_csv
+
+# The CSV's own per-row total; shares are taken relative to it
+TOTAL_CRIME = "total_ipc_crimes"
+
+
+class CrimeMatrix:
+    """District x year x crime counts from the crime CSV as one NumPy array
+
+    Districts are ordered by state so per-state figures are a single
+    np.add.reduceat over contiguous district ranges. State "TOTAL" rows
+    are left out; they would double count. District-years missing from
+    the CSV are zero.
+    """
+
+    def __init__(self, counts, districts, years, crimes=CRIME_FIELDS, source=None):
+        self.counts = counts
+        # Fingerprint of the CSV the counts came from, when known
+        self.source = source
+        self.districts = districts
+        self.years = years
+        self.crimes = list(crimes)
+        self.states = sorted({state for state, _district in districts})
+
+        self.year_index = {year: i for i, year in enumerate(years)}
+        self.crime_index = {crime: i for i, crime in enumerate(self.crimes)}
+        self.state_index = {state: i for i, state in enumerate(self.states)}
+
+        district_state = np.array([self.state_index[state] for state, _district in districts])
+        # First district of each state; districts are sorted by state
+        self._state_starts = np.flatnonzero(
+            np.r_[True, district_state[1:] != district_state[:-1]]
+        )
+        self._by_state = None
+
+    @classmethod
+    def from_records(cls, records):
+        records = [record for record in records if not record["is_total"]]
+        districts = sorted({(record["state"], record["district"]) for record in records})
+        years = sorted({record["year"] for record in records})
+
+        district_index = {district: i for i, district in enumerate(districts)}
+        year_index = {year: i for i, year in enumerate(years)}
+        rows = np.array([district_index[(r["state"], r["district"])] for r in records])
+        cols = np.array([year_index[r["year"]] for r in records])
+        values = np.array([[r[field] for field in CRIME_FIELDS] for r in records], dtype=np.int32)
+
+        counts = np.zeros((len(districts), len(years), len(CRIME_FIELDS)), dtype=np.int32)
+        counts[rows, cols] = values
+        return cls(counts, districts, years)
+
+    @classmethod
+    def from_csv(cls, path=None):
+        return cls.from_records(read_crime_csv(path))
+
+    def labels(self):
+        """Label tables for the cache sidecar"""
+        return {
+            "districts": [list(district) for district in self.districts],
+            "years": list(self.years),
+            "crimes": self.crimes,
+        }
+
+    # Lookups
+
+    def crime(self, name):
+        """Index of a crime column; raises KeyError for unknown names"""
+        return self.crime_index[name]
+
+    # Aggregations
+
+    def by_state(self):
+        """(state, year, crime) totals, read-only
+
+        Computed once per matrix, reading the counts in place (a memmap
+        is not copied) and accumulating in int64.
+        """
+        if self._by_state is None:
+            totals = np.add.reduceat(self.counts, self._state_starts, axis=0, dtype=np.int64)
+            totals.flags.writeable = False
+            self._by_state = totals
+        return self._by_state
+
+    def state_year_totals(self, crime=TOTAL_CRIME):
+        """(state, year) totals of one crime"""
+        return self.by_state()[:, :, self.crime(crime)]
+
+    def national_totals(self):
+        """(year, crime) totals over all districts"""
+        return self.counts.sum(axis=0, dtype=np.int64)
+
+    def _shares(self, counts):
+        totals = counts[..., self.crime(TOTAL_CRIME), np.newaxis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(totals > 0, counts / totals, np.nan)
+
+    def shares(self):
+        """(state, year, crime) share of each crime in the state's total IPC crimes"""
+        return self._shares(self.by_state())
+
+    def national_shares(self):
+        """(year, crime) share of each crime in India's total IPC crimes"""
+        return self._shares(self.national_totals())
+
+
+# Year-axis transforms for (..., year) arrays
+
+def yoy_change(values):
+    """Fractional change from the previous year along the last axis
+
+    The result has one fewer year; a previous value of 0 gives NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    previous = values[..., :-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(previous != 0, (values[..., 1:] - previous) / previous, np.nan)
+
+
+def rolling_mean(values, window):
+    """Trailing `window`-year mean along the last axis (window - 1 fewer years)"""
+    values = np.asarray(values, dtype=np.float64)
+    cumulative = np.cumsum(values, axis=-1)
+    cumulative = np.concatenate(
+        [np.zeros(values.shape[:-1] + (1,)), cumulative], axis=-1
+    )
+    return (cumulative[..., window:] - cumulative[..., :-window]) / window
+
+
+def to_json(values):
+    """Nested lists with NaN replaced by None, ready for JsonResponse"""
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+# Binary cache: counts as a .npy next to a JSON sidecar with the labels
+# and the fingerprint of the CSV they were compiled from
+
+def cache_paths(cache_dir=None):
+    cache_dir = Path(cache_dir or settings.CRIME_CACHE_DIR)
+    return cache_dir / "crime.npy", cache_dir / "crime.json"
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_fingerprint(csv_path, sha256=None):
+    stat = os.stat(csv_path)
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": sha256 or _sha256(csv_path),
+    }
+
+
+def _is_fresh(source, csv_path):
+    """Whether a sidecar's source fingerprint still matches the CSV
+
+    An unchanged mtime and size is trusted without reading the file; after
+    a touch or copy the contents are hashed to decide.
+    """
+    stat = os.stat(csv_path)
+    if source["mtime_ns"] == stat.st_mtime_ns and source["size"] == stat.st_size:
+        return True
+    return source["size"] == stat.st_size and source["sha256"] == _sha256(csv_path)
+
+
+def compile_crime_cache(csv_path=None, cache_dir=None):
+    """Parse the CSV and write the binary cache; returns the CrimeMatrix
+
+    Both files are written to temporary names and renamed into place,
+    the sidecar last, so concurrent readers never see a partial cache.
+    """
+    csv_path = Path(csv_path or settings.CRIME_CSV_PATH)
+    npy_path, labels_path = cache_paths(cache_dir)
+    npy_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Fingerprint before parsing so an edit during the compile is seen as stale
+    source = source_fingerprint(csv_path)
+    matrix = CrimeMatrix.from_csv(csv_path)
+    matrix.source = source
+
+    npy_tmp, labels_tmp = (path.with_name(f"{path.name}.{os.getpid()}.tmp") for path in (npy_path, labels_path))
+    with open(npy_tmp, "wb") as f:
+        np.save(f, np.ascontiguousarray(matrix.counts))
+    labels_tmp.write_text(json.dumps({
+        "source": {"path": str(csv_path), **source},
+        "shape": list(matrix.counts.shape),
+        **matrix.labels(),
+    }))
+    os.replace(npy_tmp, npy_path)
+    os.replace(labels_tmp, labels_path)
+    return matrix
+
+
+def load_crime_cache(csv_path=None, cache_dir=None):
+    """Memory-map the compiled cache, or return None if missing or stale
+
+    The counts are a read-only np.memmap, so worker processes share the
+    page cache instead of each holding a parsed copy.
+    """
+    csv_path = Path(csv_path or settings.CRIME_CSV_PATH)
+    npy_path, labels_path = cache_paths(cache_dir)
+    try:
+        labels = json.loads(labels_path.read_text())
+        if labels["source"]["path"] != str(csv_path) or not _is_fresh(labels["source"], csv_path):
+            return None
+        counts = np.load(npy_path, mmap_mode="r")
+    except (OSError, ValueError, KeyError):
+        return None
+    if list(counts.shape) != labels["shape"] or labels["crimes"] != CRIME_FIELDS:
+        return None
+    districts = [tuple(district) for district in labels["districts"]]
+    return CrimeMatrix(counts, districts, labels["years"], labels["crimes"], source=labels["source"])
+
+
+def _file_state(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=1)
+def _crime_matrix(csv_state, cache_state):
+    # Keyed on the files' states so a changed CSV or recompiled cache is
+    # picked up; the arguments themselves are unused
+    matrix = load_crime_cache()
+    if matrix is not None:
+        return matrix
+    try:
+        return compile_crime_cache()
+    except OSError:
+        return CrimeMatrix.from_csv()
+
+
+def get_crime_matrix():
+    """The process-wide CrimeMatrix
+
+    Memory-mapped from the binary cache when it is fresh; otherwise the
+    CSV is parsed and the cache recompiled (best effort, a read-only
+    cache directory just means parsing every time). Reloaded when the
+    CSV or the compiled cache changes, at the cost of two stat() calls
+    per call.
+    """
+    _npy_path, labels_path = cache_paths()
+    return _crime_matrix(_file_state(settings.CRIME_CSV_PATH), _file_state(labels_path))
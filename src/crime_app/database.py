@@ -0,0 +1,12 @@
+def apply_pragmas(sender, connection, **kwargs):
+    """connection_created receiver running the database's PRAGMAS on SQLite
+
+    PRAGMAS is a {name: value} dict next to ENGINE in DATABASES. They go
+    straight to the sqlite3 connection, so they are neither logged nor
+    counted against the query budget of the request that connected.
+    """
+    pragmas = connection.settings_dict.get("PRAGMAS")
+    if connection.vendor != "sqlite" or not pragmas:
+        return
+    for name, value in pragmas.items():
+        connection.connection.execute(f"PRAGMA {name} = {value}")
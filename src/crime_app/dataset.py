@@ -0,0 +1,545 @@
+import random
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+
+import django
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from . import case_details, case_index
+from .models import (
+    CASE_MODELS,
+    AppealStage,
+    BailStatus,
+    CaseStatsRollup,
+    CaseTypeEnum,
+    ChildDetail,
+    CivilCase,
+    CivilCaseSubtype,
+    CivilContractDispute,
+    CivilMoneyRecovery,
+    CivilPropertyDispute,
+    CivilPropertyDisputeDetail,
+    CivilTortClaim,
+    ConsumerDisputeCase,
+    ConsumerDisputeSubtype,
+    ConsumerProductDefect,
+    ConsumerServiceDeficiency,
+    ConsumerUnfairTradePractice,
+    CriminalAssault,
+    CriminalCase,
+    CriminalCaseSubtype,
+    CriminalCharge,
+    CriminalEvidence,
+    CriminalFraud,
+    CriminalMurderHomicide,
+    CriminalTheft,
+    FamilyChildCustody,
+    FamilyChildCustodyDetail,
+    FamilyDivorce,
+    FamilyDivorceGround,
+    FamilyDomesticViolence,
+    FamilyDomesticViolenceType,
+    FamilyLawCase,
+    FamilyLawSubtype,
+    FamilyMaintenance,
+    IntellectualPropertyCase,
+    InvestigationStatus,
+    IPCaseSubtype,
+    IPCopyright,
+    IPPatent,
+    IPTrademark,
+    LabourDiscriminationGround,
+    LabourDisputeCase,
+    LabourDisputeSubtype,
+    LabourWageDispute,
+    LabourWorkplaceDiscrimination,
+    LabourWrongfulTermination,
+    Person,
+    PropertyDetail,
+    PropertyEvictionSuit,
+    PropertyLawCase,
+    PropertyLawCaseProperty,
+    PropertyLawSubtype,
+    PropertyPartitionCoOwner,
+    PropertyPartitionSuit,
+    PropertyTitleDispute,
+    PublicConstitutional,
+    PublicConstitutionalRight,
+    PublicEnvironmental,
+    PublicLawCase,
+    PublicLawSubtype,
+    PublicTaxation,
+    ViolenceType,
+    from_paise,
+)
+
+# Models in the order their rows must be inserted: shared detail rows,
+# subtype details, cases, then rows pointing back at cases or details
+INSERT_ORDER = (
+    Person, PropertyDetail, ChildDetail,
+
+    CriminalMurderHomicide, CriminalTheft, CriminalAssault, CriminalFraud,
+    CivilContractDispute, CivilPropertyDispute, CivilMoneyRecovery, CivilTortClaim,
+    FamilyDivorce, FamilyMaintenance, FamilyChildCustody, FamilyDomesticViolence,
+    PropertyTitleDispute, PropertyEvictionSuit, PropertyPartitionSuit,
+    ConsumerProductDefect, ConsumerServiceDeficiency, ConsumerUnfairTradePractice,
+    LabourWrongfulTermination, LabourWageDispute, LabourWorkplaceDiscrimination,
+    IPPatent, IPTrademark, IPCopyright,
+    PublicConstitutional, PublicTaxation, PublicEnvironmental,
+
+    CriminalCase, CivilCase, FamilyLawCase, PropertyLawCase,
+    ConsumerDisputeCase, LabourDisputeCase, IntellectualPropertyCase, PublicLawCase,
+
+    CriminalCharge, CriminalEvidence, CivilPropertyDisputeDetail,
+    FamilyDivorceGround, FamilyChildCustodyDetail, FamilyDomesticViolenceType,
+    PropertyPartitionCoOwner, PropertyLawCaseProperty,
+    LabourDiscriminationGround, PublicConstitutionalRight,
+)
+
+WORDS = (
+    "notice", "agreement", "property", "payment", "delay", "claim", "party",
+    "order", "hearing", "evidence", "contract", "tenant", "service", "goods",
+    "employer", "wages", "licence", "design", "authority", "complaint",
+)
+NAMES = ("Arjun", "Priya", "Rahul", "Kavya", "Suresh", "Meena", "Imran", "Anita")
+SURNAMES = ("Sharma", "Reddy", "Iyer", "Khan", "Patel", "Nair", "Gowda", "Das")
+CITIES = ("Bengaluru", "Mysuru", "Chennai", "Hyderabad", "Pune", "Kochi")
+
+
+class CaseBatch:
+    """Unsaved rows for a batch of synthetic cases, grouped by model
+
+    Rows may reference other unsaved rows; save() inserts each model with
+    a single bulk_create in INSERT_ORDER so those references resolve, then
+    the cases' CaseIndex rows.
+    With inline storage (default: settings.CASE_DETAIL_STORAGE) subtype
+    details are folded into the cases' JSON column instead of inserted.
+    """
+
+    def __init__(self, rng, inline=None):
+        self.rng = rng
+        self.rows = defaultdict(list)
+        self.inline = case_details.inline_storage() if inline is None else inline
+
+    def add(self, obj):
+        self.rows[type(obj)].append(obj)
+        return obj
+
+    # Random field values
+
+    def maybe(self, value):
+        return value if self.rng.random() < 0.5 else None
+
+    def amount(self, low, high):
+        # Whole paise, as MoneyField stores them
+        return from_paise(self.rng.randint(low * 100, high * 100))
+
+    def sentence(self, words=8):
+        return " ".join(self.rng.choices(WORDS, k=words)).capitalize() + "."
+
+    def date_between(self, days_ago_min, days_ago_max):
+        return date.today() - timedelta(days=self.rng.randint(days_ago_min, days_ago_max))
+
+    def person(self):
+        return self.add(Person(
+            name=f"{self.rng.choice(NAMES)} {self.rng.choice(SURNAMES)}",
+            contact_info=self.maybe(f"+91 {self.rng.randint(6000000000, 9999999999)}"),
+        ))
+
+    def property_detail(self):
+        return self.add(PropertyDetail(
+            address=f"{self.rng.randint(1, 999)}, {self.rng.choice(CITIES)}",
+            value=self.amount(100000, 50000000),
+        ))
+
+    def inline_details(self):
+        """Move each case's subtype detail rows into its details JSON"""
+        children = defaultdict(list)
+        for model, parent_field in case_details.CHILD_RELATIONS:
+            for row in self.rows.get(model, ()):
+                children[(model, id(getattr(row, parent_field)))].append(row)
+
+        def children_of(obj, accessor, schema):
+            return children[(schema.model, id(obj))]
+
+        consumed = set()
+        for case_type, model in CASE_MODELS.items():
+            for case in self.rows.get(model, ()):
+                name, detail = case_details.table_detail(case)
+                if detail is not None:
+                    schema = case_details.SCHEMAS[case_type][name]
+                    case.details = {name: schema.dump(detail, children_of, consumed)}
+                    setattr(case, name, None)
+        for model, rows in self.rows.items():
+            self.rows[model] = [row for row in rows if id(row) not in consumed]
+
+    def save(self):
+        if self.inline:
+            self.inline_details()
+        with transaction.atomic():
+            for model in INSERT_ORDER:
+                if self.rows[model]:
+                    model.objects.bulk_create(self.rows[model])
+            # The cross-type feed and counts read CaseIndex; backends that
+            # don't return ids from bulk_create leave it to backfill_case_index
+            if connections[DEFAULT_DB_ALIAS].features.can_return_rows_from_bulk_insert:
+                for case_type, model in CASE_MODELS.items():
+                    if self.rows[model]:
+                        case_index.index_new_cases(case_type, self.rows[model])
+        self.rows.clear()
+
+    def save_each(self):
+        """Insert the rows one save() at a time, as a form or the admin would
+
+        Slow, but every model signal fires: rollups, CaseIndex, search.
+        """
+        if self.inline:
+            self.inline_details()
+        with transaction.atomic():
+            for model in INSERT_ORDER:
+                for row in self.rows[model]:
+                    row.save()
+        self.rows.clear()
+
+
+# Per-type builders, mirroring main.generate_*_case
+
+def build_criminal_case(batch):
+    rng = batch.rng
+    subtype = rng.choice(CriminalCaseSubtype.values)
+    case = batch.add(CriminalCase(
+        case_type=CaseTypeEnum.CRIMINAL,
+        subtype=subtype,
+        fir_number=f"FIR-{rng.randint(1000, 9999)}/{date.today().year}",
+        police_station=f"{rng.choice(CITIES)} Police Station",
+        arrest_date=batch.maybe(batch.date_between(30, 3000)),
+        bail_status=rng.choice(BailStatus.values),
+        investigation_status=rng.choice(InvestigationStatus.values),
+        chargesheet_filed=rng.random() < 0.5,
+        witness_count=rng.randint(0, 10),
+    ))
+
+    charges = ["Theft", "Assault", "Fraud", "Property Damage", "Disorderly Conduct"]
+    for _ in range(rng.randint(1, 3)):
+        batch.add(CriminalCharge(case=case, charge_name=rng.choice(charges)))
+    evidence = ["Documentary", "Physical", "Digital", "Testimonial"]
+    for _ in range(rng.randint(1, 3)):
+        batch.add(CriminalEvidence(case=case, evidence_type=rng.choice(evidence)))
+
+    if subtype == CriminalCaseSubtype.MURDER_HOMICIDE:
+        case.murder_homicide = batch.add(CriminalMurderHomicide(
+            victim=batch.person(), weapon_used=rng.choice(["Knife", "Firearm", "Blunt object"]),
+        ))
+    elif subtype == CriminalCaseSubtype.THEFT:
+        case.theft = batch.add(CriminalTheft(
+            property_type=rng.choice(["Vehicle", "Jewellery", "Cash", "Electronics"]),
+            estimated_value=batch.amount(1000, 500000),
+        ))
+    elif subtype == CriminalCaseSubtype.ASSAULT:
+        case.assault = batch.add(CriminalAssault(
+            injury_severity=rng.choice(["Minor", "Grievous", "Critical"]),
+            weapon_used=batch.maybe(rng.choice(["Knife", "Stick", "Stone"])),
+        ))
+    elif subtype == CriminalCaseSubtype.FRAUD:
+        case.fraud = batch.add(CriminalFraud(
+            amount_involved=batch.amount(10000, 5000000),
+            fraud_type=rng.choice(["Online", "Banking", "Insurance", "Identity"]),
+        ))
+    else:
+        case.other_details = batch.sentence()
+
+
+def build_civil_case(batch):
+    rng = batch.rng
+    subtype = rng.choice(CivilCaseSubtype.values)
+    case = batch.add(CivilCase(
+        case_type=CaseTypeEnum.CIVIL,
+        subtype=subtype,
+        relief_sought=batch.sentence(),
+        claim_amount=batch.maybe(batch.amount(10000, 1000000)),
+        settlement_attempts=rng.random() < 0.5,
+    ))
+
+    if subtype == CivilCaseSubtype.CONTRACT_DISPUTE:
+        case.contract_dispute = batch.add(CivilContractDispute(
+            contract_type=rng.choice(["Sale", "Lease", "Service", "Employment"]),
+            breach_details=batch.sentence(),
+        ))
+    elif subtype == CivilCaseSubtype.PROPERTY_DISPUTE:
+        dispute = batch.add(CivilPropertyDispute())
+        for _ in range(rng.randint(1, 3)):
+            batch.add(CivilPropertyDisputeDetail(dispute=dispute, property_detail=batch.property_detail()))
+        case.property_dispute = dispute
+    elif subtype == CivilCaseSubtype.MONEY_RECOVERY:
+        case.money_recovery = batch.add(CivilMoneyRecovery(
+            principal_amount=batch.amount(10000, 1000000),
+            debt_documentation=rng.choice(["Promissory note", "Cheque", "Loan agreement"]),
+        ))
+    elif subtype == CivilCaseSubtype.TORT_CLAIM:
+        case.tort_claim = batch.add(CivilTortClaim(
+            tort_type=rng.choice(["Negligence", "Nuisance", "Defamation"]),
+            damages_claimed=batch.amount(10000, 1000000),
+        ))
+    else:
+        case.other_details = batch.sentence()
+
+
+def build_family_law_case(batch):
+    rng = batch.rng
+    subtype = rng.choice(FamilyLawSubtype.values)
+    case = batch.add(FamilyLawCase(
+        case_type=CaseTypeEnum.FAMILY_LAW,
+        subtype=subtype,
+        marriage_date=batch.maybe(batch.date_between(365, 30 * 365)),
+        children_involved=rng.random() < 0.5,
+    ))
+
+    if subtype == FamilyLawSubtype.DIVORCE:
+        divorce = batch.add(FamilyDivorce(divorce_type=rng.choice(["Contested", "Mutual"])))
+        grounds = ["Cruelty", "Desertion", "Adultery", "Mutual Consent"]
+        for _ in range(rng.randint(1, 2)):
+            batch.add(FamilyDivorceGround(divorce=divorce, ground=rng.choice(grounds)))
+        case.divorce = divorce
+    elif subtype == FamilyLawSubtype.MAINTENANCE:
+        case.maintenance = batch.add(FamilyMaintenance(
+            maintenance_for=rng.choice(["Spouse", "Child", "Parent"]),
+            amount_claimed=batch.amount(5000, 100000),
+        ))
+    elif subtype == FamilyLawSubtype.CHILD_CUSTODY:
+        custody = batch.add(FamilyChildCustody(visitation_rights_proposed=batch.sentence()))
+        for _ in range(rng.randint(1, 4)):
+            child = batch.add(ChildDetail(age=rng.randint(0, 17)))
+            batch.add(FamilyChildCustodyDetail(custody=custody, child_detail=child))
+        case.child_custody = custody
+    elif subtype == FamilyLawSubtype.DOMESTIC_VIOLENCE:
+        domestic_violence = batch.add(FamilyDomesticViolence(protection_order_sought=rng.random() < 0.5))
+        for _ in range(rng.randint(1, 3)):
+            batch.add(FamilyDomesticViolenceType(
+                domestic_violence=domestic_violence, violence_type=rng.choice(ViolenceType.values),
+            ))
+        case.domestic_violence = domestic_violence
+    else:
+        case.other_details = batch.sentence()
+
+
+def build_property_law_case(batch):
+    rng = batch.rng
+    subtype = rng.choice(PropertyLawSubtype.values)
+    case = batch.add(PropertyLawCase(case_type=CaseTypeEnum.PROPERTY_LAW, subtype=subtype))
+
+    for _ in range(rng.randint(1, 3)):
+        batch.add(PropertyLawCaseProperty(case=case, property_detail=batch.property_detail()))
+
+    if subtype == PropertyLawSubtype.TITLE_DISPUTE:
+        case.title_dispute = batch.add(PropertyTitleDispute(
+            claim_basis=rng.choice(["Sale deed", "Inheritance", "Gift deed", "Adverse possession"]),
+            possession_status=rng.choice(["In possession", "Dispossessed"]),
+        ))
+    elif subtype == PropertyLawSubtype.EVICTION_SUIT:
+        case.eviction_suit = batch.add(PropertyEvictionSuit(
+            eviction_grounds=rng.choice(["Non-payment of rent", "Bona fide need", "Sub-letting"]),
+            arrears_amount=batch.maybe(batch.amount(10000, 500000)),
+        ))
+    elif subtype == PropertyLawSubtype.PARTITION_SUIT:
+        partition_suit = batch.add(PropertyPartitionSuit(share_claimed=f"1/{rng.randint(2, 6)}"))
+        for _ in range(rng.randint(2, 5)):
+            batch.add(PropertyPartitionCoOwner(partition_suit=partition_suit, person=batch.person()))
+        case.partition_suit = partition_suit
+    else:
+        case.other_details = batch.sentence()
+
+
+def build_consumer_dispute_case(batch):
+    rng = batch.rng
+    subtype = rng.choice(ConsumerDisputeSubtype.values)
+    case = batch.add(ConsumerDisputeCase(
+        case_type=CaseTypeEnum.CONSUMER_DISPUTE,
+        subtype=subtype,
+        product_service_details=batch.sentence(),
+        purchase_date=batch.maybe(batch.date_between(0, 5 * 365)),
+        compensation_claimed=batch.maybe(batch.amount(1000, 500000)),
+    ))
+
+    if subtype == ConsumerDisputeSubtype.PRODUCT_DEFECT:
+        case.product_defect = batch.add(ConsumerProductDefect(
+            product_type=rng.choice(["Appliance", "Vehicle", "Phone", "Furniture"]),
+            defect_nature=rng.choice(["Manufacturing", "Design", "Packaging"]),
+        ))
+    elif subtype == ConsumerDisputeSubtype.SERVICE_DEFICIENCY:
+        case.service_deficiency = batch.add(ConsumerServiceDeficiency(
+            service_type=rng.choice(["Banking", "Insurance", "Telecom", "Travel"]),
+            deficiency_nature=rng.choice(["Delay", "Overcharging", "Non-delivery"]),
+        ))
+    elif subtype == ConsumerDisputeSubtype.UNFAIR_TRADE_PRACTICE:
+        case.unfair_trade_practice = batch.add(ConsumerUnfairTradePractice(
+            practice_type=rng.choice(["Advertising", "Pricing", "Warranty"]),
+            misleading_aspect=batch.sentence(4),
+        ))
+    else:
+        case.other_details = batch.sentence()
+
+
+def build_labour_dispute_case(batch):
+    rng = batch.rng
+    subtype = rng.choice(LabourDisputeSubtype.values)
+    case = batch.add(LabourDisputeCase(
+        case_type=CaseTypeEnum.LABOUR_DISPUTE,
+        subtype=subtype,
+        employee=batch.person(),
+        employer_details=f"{rng.choice(SURNAMES)} {rng.choice(['Industries', 'Textiles', 'Infotech', 'Motors'])}",
+        employment_start_date=batch.maybe(batch.date_between(30, 20 * 365)),
+    ))
+
+    if subtype == LabourDisputeSubtype.WRONGFUL_TERMINATION:
+        case.wrongful_termination = batch.add(LabourWrongfulTermination(
+            termination_date=batch.date_between(0, 2 * 365),
+            termination_reason_stated=batch.sentence(5),
+        ))
+    elif subtype == LabourDisputeSubtype.WAGE_DISPUTE:
+        case.wage_dispute = batch.add(LabourWageDispute(
+            disputed_amount=batch.amount(5000, 500000),
+            wage_dispute_type=rng.choice(["Unpaid wages", "Overtime", "Bonus", "Gratuity"]),
+        ))
+    elif subtype == LabourDisputeSubtype.WORKPLACE_DISCRIMINATION:
+        discrimination = batch.add(LabourWorkplaceDiscrimination(incident_details=batch.sentence()))
+        grounds = ["Gender", "Caste", "Religion", "Disability"]
+        for _ in range(rng.randint(1, 2)):
+            batch.add(LabourDiscriminationGround(discrimination=discrimination, ground=rng.choice(grounds)))
+        case.workplace_discrimination = discrimination
+    else:
+        case.other_details = batch.sentence()
+
+
+def build_intellectual_property_case(batch):
+    rng = batch.rng
+    subtype = rng.choice(IPCaseSubtype.values)
+    case = batch.add(IntellectualPropertyCase(
+        case_type=CaseTypeEnum.INTELLECTUAL_PROPERTY,
+        subtype=subtype,
+        ip_owner_details=batch.maybe(f"{rng.choice(SURNAMES)} Technologies"),
+    ))
+
+    if subtype == IPCaseSubtype.PATENT:
+        case.patent = batch.add(IPPatent(
+            invention_details=batch.sentence(), dispute_type=rng.choice(["Infringement", "Validity"]),
+        ))
+    elif subtype == IPCaseSubtype.TRADEMARK:
+        case.trademark = batch.add(IPTrademark(
+            trademark_description=batch.sentence(), dispute_type=rng.choice(["Infringement", "Passing off"]),
+        ))
+    elif subtype == IPCaseSubtype.COPYRIGHT:
+        case.copyright = batch.add(IPCopyright(
+            work_type=rng.choice(["Literary", "Musical", "Software", "Film"]),
+            infringing_work_details=batch.sentence(),
+        ))
+    else:
+        case.other_details = batch.sentence()
+
+
+def build_public_law_case(batch):
+    rng = batch.rng
+    subtype = rng.choice(PublicLawSubtype.values)
+    case = batch.add(PublicLawCase(case_type=CaseTypeEnum.PUBLIC_LAW, subtype=subtype))
+
+    if subtype == PublicLawSubtype.CONSTITUTIONAL:
+        constitutional = batch.add(PublicConstitutional(government_action_challenged=batch.sentence()))
+        rights = ["Equality", "Freedom of Speech", "Life and Liberty"]
+        for _ in range(rng.randint(1, 2)):
+            batch.add(PublicConstitutionalRight(constitutional=constitutional, right=rng.choice(rights)))
+        case.constitutional = constitutional
+    elif subtype == PublicLawSubtype.TAXATION:
+        year = rng.randint(2005, date.today().year - 1)
+        case.taxation = batch.add(PublicTaxation(
+            assessment_year=f"{year}-{(year + 1) % 100:02d}",
+            disputed_amount=batch.amount(10000, 10000000),
+            tax_authority=rng.choice(["Income Tax Department", "GST Council", "Customs"]),
+            appeal_stage=rng.choice(AppealStage.values),
+        ))
+    elif subtype == PublicLawSubtype.ENVIRONMENTAL:
+        case.environmental = batch.add(PublicEnvironmental(
+            pollution_type=rng.choice(["Air", "Water", "Noise", "Soil"]),
+            regulatory_authority=rng.choice(["CPCB", "KSPCB", "NGT"]),
+            penalty_imposed=batch.maybe(batch.amount(10000, 5000000)),
+        ))
+    else:
+        case.other_details = batch.sentence()
+
+
+CASE_BUILDERS = {
+    CaseTypeEnum.CRIMINAL: build_criminal_case,
+    CaseTypeEnum.CIVIL: build_civil_case,
+    CaseTypeEnum.FAMILY_LAW: build_family_law_case,
+    CaseTypeEnum.PROPERTY_LAW: build_property_law_case,
+    CaseTypeEnum.CONSUMER_DISPUTE: build_consumer_dispute_case,
+    CaseTypeEnum.LABOUR_DISPUTE: build_labour_dispute_case,
+    CaseTypeEnum.INTELLECTUAL_PROPERTY: build_intellectual_property_case,
+    CaseTypeEnum.PUBLIC_LAW: build_public_law_case,
+}
+
+
+def generate_batch(size, seed):
+    """Build and insert one batch of `size` cases from its own seed"""
+    batch = CaseBatch(random.Random(seed))
+    case_types = list(CASE_BUILDERS)
+    for _ in range(size):
+        CASE_BUILDERS[batch.rng.choice(case_types)](batch)
+    batch.save()
+    return size
+
+
+def _batch_plan(count, batch_size, seed):
+    """(size, seed) for every batch; batch seeds derive from the run seed
+
+    Seeding per batch rather than per worker means a given seed and batch
+    size produce the same dataset whatever the number of workers.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    return [
+        (min(batch_size, count - start), f"{seed}:{index}")
+        for index, start in enumerate(range(0, count, batch_size))
+    ]
+
+
+def _init_worker():
+    # Required under the spawn start method; a no-op for forked workers
+    django.setup()
+
+
+def _generate_batch_task(task):
+    return generate_batch(*task)
+
+
+def generate_cases(count, batch_size=1000, seed=None, workers=1, progress=None):
+    """Insert `count` random cases of random types, `batch_size` at a time
+
+    Each batch is built in memory and written with one bulk_create per
+    table. With workers > 1 the batches are spread over a process pool,
+    each worker writing through its own database connection.
+
+    bulk_create does not send signals, so the CaseStatsRollup rows are
+    cleared afterwards rather than left stale: dashboards aggregate the case
+    tables until the rollups are rebuilt, by the rebuild_case_stats command
+    (which the generate_cases command runs) or the next case save.
+    """
+    plan = _batch_plan(count, batch_size, seed)
+    generated = 0
+
+    if workers <= 1:
+        for size, batch_seed in plan:
+            generated += generate_batch(size, batch_seed)
+            if progress:
+                progress(generated)
+    else:
+        # Forked workers must not share the parent's open connections
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [pool.submit(_generate_batch_task, task) for task in plan]
+            for future in as_completed(futures):
+                generated += future.result()
+                if progress:
+                    progress(generated)
+
+    CaseStatsRollup.objects.all().delete()
+    return generated
@@ -0,0 +1,77 @@
+import json
+
+from asgiref.sync import sync_to_async
+
+from .models import CASE_MODELS
+from .serializers import serialize_cases
+
+# Cases fetched (and relations prefetched) per round trip while exporting
+EXPORT_CHUNK_SIZE = 2000
+
+# Serialized output is handed to the writer in pieces of about this size
+WRITE_BUFFER_SIZE = 64 * 1024
+
+EXPORT_FORMATS = ("ndjson", "json")
+
+
+def iter_cases(case_types=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Serialized cases of the given types (default all), table by table
+
+    Each table is read with iterator(chunk_size=...), so only one chunk of
+    cases and their prefetched relations is held in memory at a time.
+    """
+    for case_type, model in CASE_MODELS.items():
+        if case_types and case_type not in case_types:
+            continue
+        yield from serialize_cases(model.objects.order_by("pk"), chunk_size=chunk_size)
+
+
+def _buffered(pieces):
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= WRITE_BUFFER_SIZE:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _ndjson(cases):
+    for case in cases:
+        yield json.dumps(case)
+        yield "\n"
+
+
+def _json_array(cases):
+    yield "["
+    separator = "\n"
+    for case in cases:
+        yield separator
+        yield json.dumps(case)
+        separator = ",\n"
+    yield "\n]\n"
+
+
+def iter_export(export_format="ndjson", case_types=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the export as text chunks: NDJSON lines or one streamed JSON array"""
+    cases = iter_cases(case_types, chunk_size)
+    pieces = _ndjson(cases) if export_format == "ndjson" else _json_array(cases)
+    return _buffered(pieces)
+
+
+async def aiter_export(export_format="ndjson", case_types=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """iter_export() as an async generator, for streaming under ASGI
+
+    Django buffers a sync iterator in full before an ASGI server sends
+    any of it. Here each chunk is pulled through sync_to_async instead;
+    thread-sensitive, so the export's cursor stays on the thread (and
+    connection) that opened it.
+    """
+    chunks = iter_export(export_format, case_types, chunk_size)
+    next_chunk = sync_to_async(next)
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        yield chunk
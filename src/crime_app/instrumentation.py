@@ -0,0 +1,220 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A view ran more SQL queries than its query_budget() allows"""
+
+
+def query_budget(max_queries):
+    """Declare how many SQL queries a view may run
+
+    Counted from the view call to the end of the response phase, so
+    template rendering is included and request middleware is not. Going
+    over is logged, or raises QueryBudgetExceeded when
+    settings.QUERY_BUDGET_STRICT is on, as QueryBudgetTestRunner sets it.
+    """
+    def decorator(view):
+        view.query_budget = max_queries
+        return view
+    return decorator
+
+
+class RequestMetrics:
+    """Per-view totals since process start, for the metrics endpoint"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = defaultdict(lambda: {
+            "requests": 0, "queries": 0, "max_queries": 0, "db_ms": 0.0, "wall_ms": 0.0, "max_wall_ms": 0.0,
+            "slowest_queries": [],
+        })
+
+    def record(self, view_name, queries, db_ms, wall_ms, slow_queries=(), keep=0):
+        with self._lock:
+            totals = self._views[view_name]
+            totals["requests"] += 1
+            totals["queries"] += queries
+            totals["max_queries"] = max(totals["max_queries"], queries)
+            totals["db_ms"] += db_ms
+            totals["wall_ms"] += wall_ms
+            totals["max_wall_ms"] = max(totals["max_wall_ms"], wall_ms)
+            if keep:
+                slowest = totals["slowest_queries"] + [
+                    {"ms": duration * 1000, "sql": sql} for duration, sql in slow_queries
+                ]
+                totals["slowest_queries"] = sorted(slowest, key=lambda query: query["ms"], reverse=True)[:keep]
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                view_name: {
+                    **totals,
+                    "avg_queries": totals["queries"] / totals["requests"],
+                    "avg_db_ms": totals["db_ms"] / totals["requests"],
+                    "avg_wall_ms": totals["wall_ms"] / totals["requests"],
+                }
+                for view_name, totals in sorted(self._views.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+metrics = RequestMetrics()
+
+
+class QueryRecorder:
+    """Times every query run while it is the current request's recorder
+
+    Queries are also added to `parent`, the recorder that was current when
+    this one was made, so e.g. a benchmark's recorder around a request
+    still sees them.
+    """
+
+    def __init__(self, parent=None):
+        self.queries = []
+        self.parent = parent
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            query = (time.perf_counter() - started, sql)
+            recorder = self
+            while recorder is not None:
+                recorder.queries.append(query)
+                recorder = recorder.parent
+
+    def db_ms(self):
+        return sum(duration for duration, _sql in self.queries) * 1000
+
+    def slowest(self, count):
+        return sorted(self.queries, key=lambda query: query[0], reverse=True)[:count]
+
+
+# The recorder of the request being handled. A context variable rather
+# than a per-request execute_wrapper: under ASGI, sync views and a
+# streaming export's chunks run in threads with connections of their own,
+# and asgiref copies the context into them
+_current_recorder = ContextVar("query_recorder", default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    recorder = _current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+@contextmanager
+def recording_queries():
+    """Record the queries run inside the block, on every connection
+
+    Unlike CaptureQueriesContext this includes other threads'
+    connections (e.g. those ASGI runs sync views in), and it works with
+    DEBUG off.
+    """
+    recorder = QueryRecorder(_current_recorder.get())
+    token = _current_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_recorder.reset(token)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created receiver adding record_query to every new connection"""
+    if record_query not in connection.execute_wrappers:
+        # First, so execute_wrapper() blocks still pop their own wrapper
+        connection.execute_wrappers.insert(0, record_query)
+
+
+class RequestMetricsMiddleware:
+    """Record query count, DB time and wall time of every request
+
+    Adds a Server-Timing header (db and total durations), feeds
+    the per-view totals behind metrics_api and enforces query_budget().
+    With settings.REQUEST_METRICS_SLOW_QUERIES = n the n slowest queries
+    of each request are logged at DEBUG and kept per view. Queries run while a streaming
+    response is consumed happen after the middleware and aren't counted.
+    Works under WSGI and ASGI without being adapted to either.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        recorder, token, started = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_recorder.reset(token)
+        return self.finish(request, response, recorder, started)
+
+    async def __acall__(self, request):
+        recorder, token, started = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_recorder.reset(token)
+        return self.finish(request, response, recorder, started)
+
+    def start(self, request):
+        recorder = QueryRecorder(_current_recorder.get())
+        request._query_recorder = recorder
+        return recorder, _current_recorder.set(recorder), time.perf_counter()
+
+    def finish(self, request, response, recorder, started):
+        wall_ms = (time.perf_counter() - started) * 1000
+
+        db_ms = recorder.db_ms()
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={db_ms:.1f};desc="{len(recorder.queries)} queries"',
+            f"total;dur={wall_ms:.1f}",
+        ])
+
+        slow_count = getattr(settings, "REQUEST_METRICS_SLOW_QUERIES", 0)
+        slowest = recorder.slowest(slow_count) if slow_count else []
+        for duration, sql in slowest:
+            logger.debug("%s %.1fms %s", request.path, duration * 1000, sql)
+
+        view_name = getattr(request, "_metrics_view_name", None)
+        if view_name:
+            metrics.record(view_name, len(recorder.queries), db_ms, wall_ms, slowest, keep=slow_count)
+            self.check_budget(request, recorder)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._metrics_view_name = f"{view_func.__module__}.{view_func.__name__}"
+        request._query_budget = getattr(view_func, "query_budget", None)
+        recorder = getattr(request, "_query_recorder", None)
+        request._view_query_start = len(recorder.queries) if recorder else 0
+
+    def check_budget(self, request, recorder):
+        budget = request._query_budget
+        used = len(recorder.queries) - request._view_query_start
+        if budget is None or used <= budget:
+            return
+        message = f"{request._metrics_view_name} ran {used} queries, over its budget of {budget}"
+        if getattr(settings, "QUERY_BUDGET_STRICT", False):
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
@@ -5,7 +5,8 @@ from datetime import datetime
 import random
 import json
 from mixer.backend.django import mixer
-from django.db import transaction
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
 
 # Import our models
 from .models import (
@@ -27,8 +28,9 @@ from .models import (
     IntellectualPropertyCase, IPCaseSubtype, IPPatent, IPTrademark, IPCopyright,
     PublicLawCase, PublicLawSubtype, PublicConstitutional, PublicConstitutionalRight,
     PublicTaxation, PublicEnvironmental, AppealStage,
-    CaseTypeEnum
+    CaseTypeEnum, CASE_MODELS
 )
+from .serializers import serialize_case, serialize_cases
 
 
 # Set up Django environment
@@ -383,7 +385,7 @@ def create_test_dataset(num_cases=10):
             case = generate_legal_case()
             cases.append(case)
             print(f"Created {case.case_type} case")
-        except Exception as e:
+        except (DatabaseError, ValidationError, ValueError) as e:
             print(f"Error creating case: {e}")
     
     print(f"Generated {len(cases)} cases successfully.")
@@ -391,63 +393,18 @@ def create_test_dataset(num_cases=10):
 
 # Helper function to serialize a case to dictionary
 def case_to_dict(case):
-    if case.case_type == CaseTypeEnum.CRIMINAL:
-        result = {
-            'case_type': case.case_type,
-            'subtype': case.subtype,
-            'fir_number': case.fir_number,
-            'police_station': case.police_station,
-            'arrest_date': str(case.arrest_date) if case.arrest_date else None,
-            'bail_status': case.bail_status,
-            'investigation_status': case.investigation_status,
-            'chargesheet_filed': case.chargesheet_filed,
-            'chargesheet_date': str(case.chargesheet_date) if case.chargesheet_date else None,
-            'witness_count': case.witness_count,
-            'charges': [charge.charge_name for charge in case.charges.all()],
-            'evidence_types': [evidence.evidence_type for evidence in case.evidence_types.all()],
-            'other_details': case.other_details,
-        }
-        
-        # Add subtype-specific details
-        if case.murder_homicide:
-            result['murder_homicide'] = {
-                'victim_details': {
-                    'name': case.murder_homicide.victim.name,
-                    'contact_info': case.murder_homicide.victim.contact_info
-                },
-                'weapon_used': case.murder_homicide.weapon_used
-            }
-        elif case.theft:
-            result['theft'] = {
-                'property_type': case.theft.property_type,
-                'estimated_value': case.theft.estimated_value
-            }
-        elif case.assault:
-            result['assault'] = {
-                'injury_severity': case.assault.injury_severity,
-                'weapon_used': case.assault.weapon_used
-            }
-        elif case.fraud:
-            result['fraud'] = {
-                'amount_involved': case.fraud.amount_involved,
-                'fraud_type': case.fraud.fraud_type
-            }
-        
-        return result
-    
-    # Add similar serialization logic for other case types...
-    # For brevity, I'm just returning a basic object for other case types
-    return {
-        'case_type': case.case_type,
-        'id': case.id
-    }
+    return serialize_case(case)
 
 # Main function to run the script
 def main():
     cases = create_test_dataset(5)
     
-    # Convert to dictionaries for JSON serialization
-    case_dicts = [case_to_dict(case) for case in cases]
+    # Convert to dictionaries for JSON serialization, fetching each type's
+    # relations in bulk rather than per case
+    case_dicts = []
+    for model in CASE_MODELS.values():
+        ids = [case.id for case in cases if isinstance(case, model)]
+        case_dicts.extend(serialize_cases(model.objects.filter(id__in=ids)))
     
     # Print or save the output
     print(json.dumps(case_dicts, indent=2))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ... import case_index
+from ...models import CASE_MODELS
+
+
+class Command(BaseCommand):
+    help = "Populate CaseIndex from the case tables (idempotent; also drops stale rows)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        total = 0
+        for case_type in CASE_MODELS:
+            with transaction.atomic():
+                indexed = case_index.backfill(case_type, batch_size=options["batch_size"])
+            self.stdout.write(f"{case_type.label}: {indexed} cases indexed")
+            total += indexed
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} cases"))
@@ -0,0 +1,273 @@
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import UTC, datetime
+
+import django
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, transaction
+from django.test import Client
+from django.urls import reverse
+
+from ... import urls
+from ...dataset import generate_cases
+from ...export import iter_export
+from ...instrumentation import QueryBudgetExceeded, recording_queries
+from ...main import case_to_dict, create_test_dataset
+from ...models import CASE_MODELS, CaseTypeEnum, CriminalCase
+from ...serializers import serialize_cases
+
+# Arguments and query strings for the routes that need them; every
+# other route in crime_app/urls.py is requested bare
+URL_KWARGS = {
+    "case_list_api": {"case_type": CaseTypeEnum.CRIMINAL.value},
+}
+URL_QUERIES = {
+    "search_api": "?q=notice+claim",
+    "crime_state_totals_api": "?window=3",
+}
+
+
+def _consume(response):
+    # Streaming responses do their work as they are iterated
+    if response.streaming:
+        for _chunk in response.streaming_content:
+            pass
+    return response
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway SQLite database at growing sizes and time every "
+        "view, the serializers and the generators, with query counts and "
+        "tracemalloc peaks. Writes JSON and can flag regressions against a "
+        "previous run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", default="10000,100000,1000000",
+            help="Comma-separated case counts to measure at, smallest first",
+        )
+        parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark (median is reported)")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--workers", type=int, default=1, help="Generator processes while seeding")
+        parser.add_argument("--output", default="bench.json", help="Where to write the results")
+        parser.add_argument("--compare", help="Previous results to check for regressions")
+        parser.add_argument(
+            "--threshold", type=float, default=1.25,
+            help="Median slowdown ratio counted as a regression",
+        )
+        parser.add_argument("--fail-on-regression", action="store_true", help="Exit non-zero on regressions")
+        parser.add_argument("--keep-db", action="store_true", help="Keep the seeded database afterwards")
+
+    def handle(self, *args, **options):
+        sizes = sorted({int(size) for size in options["sizes"].split(",")})
+        if connection.vendor != "sqlite":
+            raise CommandError("bench seeds a throwaway SQLite database; run it with the SQLite settings")
+        workers = options["workers"]
+        if workers > 1 and multiprocessing.get_start_method() != "fork":
+            # Spawned workers would re-read settings and write to the real database
+            self.stderr.write("Generator workers need the fork start method; seeding with one process")
+            workers = 1
+
+        # A file, not the in-memory default, so forked workers share it
+        database = os.path.join(tempfile.gettempdir(), f"bench_{os.getpid()}.sqlite3")
+        connection.settings_dict.setdefault("TEST", {})["NAME"] = database
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            results = self.run_sizes(sizes, options["repeat"], options["seed"], workers)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keep_db"])
+
+        report = {
+            "meta": {
+                "created_at": datetime.now(UTC).isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "sqlite": connection.Database.sqlite_version,
+                "cpus": os.cpu_count(),
+                "repeat": options["repeat"],
+                "seed": options["seed"],
+                "workers": workers,
+            },
+            "results": results,
+        }
+        with open(options["output"], "w") as f:
+            json.dump(report, f, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+        if options["compare"]:
+            with open(options["compare"]) as f:
+                regressions = self.compare(json.load(f), report, options["threshold"])
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(f"REGRESSION {regression}"))
+            if not regressions:
+                self.stdout.write(self.style.SUCCESS(f"No regressions against {options['compare']}"))
+            elif options["fail_on_regression"]:
+                raise CommandError(f"{len(regressions)} regressions against {options['compare']}")
+
+    # Seeding and measuring
+
+    def run_sizes(self, sizes, repeat, seed, workers):
+        results = {}
+        seeded = 0
+        for size in sizes:
+            self.stdout.write(f"\n== {size} cases ==")
+            generators = self.seed(size - seeded, f"{seed}:{size}", workers)
+            seeded = size
+            results[str(size)] = {
+                "generators": {**generators, **self.bench_generators(repeat)},
+                "serializers": self.bench_serializers(repeat),
+                "views": self.bench_views(repeat),
+            }
+        return results
+
+    def seed(self, count, seed, workers):
+        """Grow the database by `count` cases, timing each derived-table rebuild"""
+        timings = {}
+        started = time.perf_counter()
+        generate_cases(count, seed=seed, workers=workers)
+        elapsed = time.perf_counter() - started
+        timings["generate_cases"] = {
+            "cases": count,
+            "ms": elapsed * 1000,
+            "cases_per_s": count / elapsed if elapsed else None,
+        }
+        self.stdout.write(f"  generate_cases: {count} cases in {elapsed:.1f}s")
+
+        for command in ("rebuild_case_stats", "backfill_case_index", "rebuild_search_index"):
+            started = time.perf_counter()
+            call_command(command, stdout=io.StringIO())
+            timings[command] = {"ms": (time.perf_counter() - started) * 1000}
+            self.stdout.write(f"  {command}: {timings[command]['ms']:.0f}ms")
+        return timings
+
+    def measure(self, name, run, repeat, setup=None):
+        """Median/min wall time over `repeat` runs, then one run for queries and peak memory"""
+        try:
+            runs = []
+            for _ in range(repeat):
+                if setup:
+                    setup()
+                started = time.perf_counter()
+                run()
+                runs.append((time.perf_counter() - started) * 1000)
+
+            if setup:
+                setup()
+            tracemalloc.start()
+            # On every connection, including other threads' ones
+            with recording_queries() as queries:
+                run()
+            _current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        # A missing table or FTS5, or a view over its query budget, fails
+        # that one measurement; anything else is a bug in the bench
+        except (DatabaseError, QueryBudgetExceeded) as exc:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self.stdout.write(self.style.WARNING(f"  {name}: {type(exc).__name__}: {exc}"))
+            return {"error": f"{type(exc).__name__}: {exc}"}
+
+        result = {
+            "median_ms": statistics.median(runs),
+            "min_ms": min(runs),
+            "queries": len(queries.queries),
+            "peak_kb": peak / 1024,
+        }
+        self.stdout.write(
+            f"  {name:40} {result['median_ms']:9.2f}ms {result['queries']:4} queries "
+            f"{result['peak_kb']:9.0f}KB peak"
+        )
+        return result
+
+    def bench_views(self, repeat):
+        # A host in ALLOWED_HOSTS; the default "testserver" is rejected
+        client = Client(HTTP_HOST="localhost")
+        results = {}
+        for pattern in urls.urlpatterns:
+            name = pattern.name
+            url = reverse(f"{urls.app_name}:{name}", kwargs=URL_KWARGS.get(name)) + URL_QUERIES.get(name, "")
+            # An error page is not a timing of the view
+            status = _consume(client.get(url)).status_code
+            if not 200 <= status < 300:
+                self.stdout.write(self.style.WARNING(f"  {name}: HTTP {status}"))
+                results[name] = {"error": f"HTTP {status}", "status": status}
+                continue
+            # Cold cache every run: the cost of computing the response
+            results[name] = self.measure(name, lambda url=url: _consume(client.get(url)), repeat, setup=cache.clear)
+            results[name]["status"] = status
+        return results
+
+    def bench_serializers(self, repeat):
+        results = {}
+        for case_type, model in CASE_MODELS.items():
+            queryset = model.objects.order_by("pk")[:1000]
+            results[f"serialize_cases[{case_type.value}] x1000"] = self.measure(
+                f"serialize_cases[{case_type.value}]", lambda queryset=queryset: list(serialize_cases(queryset)), repeat,
+            )
+        cases = list(CriminalCase.objects.order_by("pk")[:100])
+        results["case_to_dict[Criminal] x100"] = self.measure(
+            "case_to_dict[Criminal] x100", lambda: [case_to_dict(case) for case in cases], repeat,
+        )
+        results["iter_export[Criminal]"] = self.measure(
+            "iter_export[Criminal]", lambda: list(iter_export("ndjson", [CaseTypeEnum.CRIMINAL])), repeat,
+        )
+        return results
+
+    def bench_generators(self, repeat):
+        def rolled_back(run):
+            # Leave the seeded size unchanged
+            def wrapped():
+                with transaction.atomic():
+                    run()
+                    transaction.set_rollback(True)
+            return wrapped
+
+        def mixer_dataset():
+            with contextlib.redirect_stdout(io.StringIO()):
+                create_test_dataset(20)
+
+        return {
+            "generate_cases x1000": self.measure(
+                "generate_cases x1000", rolled_back(lambda: generate_cases(1000, seed="bench")), repeat,
+            ),
+            "create_test_dataset x20": self.measure(
+                "create_test_dataset x20", rolled_back(mixer_dataset), repeat,
+            ),
+        }
+
+    # Comparing runs
+
+    def compare(self, previous, current, threshold):
+        regressions = []
+        for size, groups in current["results"].items():
+            for group, entries in groups.items():
+                for name, entry in entries.items():
+                    old = previous.get("results", {}).get(size, {}).get(group, {}).get(name)
+                    if not old or "median_ms" not in old:
+                        continue
+                    if "error" in entry:
+                        regressions.append(f"{size} {group} {name}: now fails with {entry['error']}")
+                        continue
+                    ratio = entry["median_ms"] / max(old["median_ms"], 1e-3)
+                    if ratio > threshold:
+                        regressions.append(
+                            f"{size} {group} {name}: {old['median_ms']:.2f}ms -> "
+                            f"{entry['median_ms']:.2f}ms ({ratio:.2f}x)"
+                        )
+                    if entry["queries"] > old["queries"]:
+                        regressions.append(
+                            f"{size} {group} {name}: {old['queries']} -> {entry['queries']} queries"
+                        )
+        return regressions
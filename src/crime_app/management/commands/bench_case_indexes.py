@@ -0,0 +1,135 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Avg, Count
+
+from ...models import (
+    BailStatus,
+    CaseTypeEnum,
+    CivilCase,
+    CivilCaseSubtype,
+    CriminalCase,
+    CriminalCaseSubtype,
+    InvestigationStatus,
+)
+
+# Dashboard-style queries whose plans should change once the indexes exist
+QUERIES = {
+    "criminal by subtype": lambda: list(
+        CriminalCase.objects.order_by().values("subtype").annotate(count=Count("id"))
+    ),
+    "criminal by investigation status": lambda: list(
+        CriminalCase.objects.order_by().values("investigation_status").annotate(count=Count("id"))
+    ),
+    "criminal bail granted": lambda: CriminalCase.objects.filter(bail_status=BailStatus.GRANTED).count(),
+    "criminal recent": lambda: list(CriminalCase.objects.order_by("-created_at")[:5]),
+    "civil avg claim": lambda: CivilCase.objects.filter(claim_amount__isnull=False).aggregate(Avg("claim_amount")),
+    "civil settlement attempted": lambda: CivilCase.objects.filter(settlement_attempts=True).count(),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed throwaway criminal/civil rows and compare query plans and "
+        "timings with and without the case table indexes. All changes are "
+        "rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000, help="Rows per case table")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per query")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        with transaction.atomic():
+            self.seed(options["rows"], options["batch_size"])
+            indexed = self.measure("with indexes", options["repeat"])
+            self.drop_indexes()
+            unindexed = self.measure("without indexes", options["repeat"])
+            transaction.set_rollback(True)
+
+        self.stdout.write("\nMedian seconds (without -> with indexes)")
+        for name in QUERIES:
+            self.stdout.write(
+                f"  {name:36} {unindexed[name]:.4f} -> {indexed[name]:.4f}"
+                f"  ({unindexed[name] / max(indexed[name], 1e-9):.1f}x)"
+            )
+
+    def seed(self, rows, batch_size):
+        self.stdout.write(f"Seeding {rows} criminal and {rows} civil cases...")
+        criminal_subtypes = CriminalCaseSubtype.values
+        statuses = InvestigationStatus.values
+        bail_statuses = BailStatus.values + [None]
+        civil_subtypes = CivilCaseSubtype.values
+
+        for start in range(0, rows, batch_size):
+            size = min(batch_size, rows - start)
+            CriminalCase.objects.bulk_create([
+                CriminalCase(
+                    case_type=CaseTypeEnum.CRIMINAL,
+                    subtype=random.choice(criminal_subtypes),
+                    fir_number=f"FIR-{start + i}",
+                    investigation_status=random.choice(statuses),
+                    bail_status=random.choice(bail_statuses),
+                    chargesheet_filed=random.random() < 0.5,
+                )
+                for i in range(size)
+            ])
+            CivilCase.objects.bulk_create([
+                CivilCase(
+                    case_type=CaseTypeEnum.CIVIL,
+                    subtype=random.choice(civil_subtypes),
+                    relief_sought="",
+                    claim_amount=round(random.uniform(10000, 1000000), 2) if random.random() < 0.5 else None,
+                    settlement_attempts=random.random() < 0.5,
+                )
+                for _ in range(size)
+            ])
+
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+
+    def drop_indexes(self):
+        with connection.cursor() as cursor:
+            for model in (CriminalCase, CivilCase):
+                for index in model._meta.indexes:
+                    cursor.execute(f"DROP INDEX {connection.ops.quote_name(index.name)}")
+
+    def last_query(self, run):
+        statements = []
+
+        def capture(execute, sql, params, many, context):
+            statements.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(capture):
+            run()
+        return statements[-1]
+
+    def explain(self, sql, params, label):
+        prefix = "EXPLAIN QUERY PLAN " if connection.vendor == "sqlite" else "EXPLAIN "
+        with connection.cursor() as cursor:
+            # The label keeps SQLite from reusing the plan cached before DROP INDEX
+            cursor.execute(f"{prefix}{sql} /* {label} */", params)
+            return "\n".join(f"  {row[-1]}" for row in cursor.fetchall())
+
+    def measure(self, label, repeat):
+        self.stdout.write(f"\n== {label} ==")
+        timings = {}
+        for name, run in QUERIES.items():
+            sql, params = self.last_query(run)
+            self.stdout.write(f"-- {name}\n{self.explain(sql, params, label)}")
+
+            runs = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                run()
+                runs.append(time.perf_counter() - started)
+            timings[name] = statistics.median(runs)
+        return timings
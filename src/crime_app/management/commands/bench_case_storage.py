@@ -0,0 +1,146 @@
+import io
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, reset_queries, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from ...dataset import CASE_BUILDERS, CaseBatch, generate_cases
+from ...models import CASE_MODELS
+from ...serializers import serialize_case, serialize_cases
+
+MODES = ("tables", "inline")
+
+
+def _save_one(seed):
+    # A random case, written with save() so the rollup, CaseIndex and
+    # search signals run as they do for a form save
+    batch = CaseBatch(random.Random(seed))
+    batch.rng.choice(list(CASE_BUILDERS.values()))(batch)
+    batch.save_each()
+
+
+def _rolled_back(run):
+    # Leave the seeded database unchanged
+    def wrapped():
+        with transaction.atomic():
+            run()
+            transaction.set_rollback(True)
+    return wrapped
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the two CASE_DETAIL_STORAGE modes on throwaway SQLite "
+        "databases: bulk and single-case write throughput, list and point "
+        "read times with their query counts, and database size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--cases", type=int, default=20000, help="Cases to seed each database with")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (median is reported)")
+        parser.add_argument("--output", help="Write the results as JSON")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("bench_case_storage seeds throwaway SQLite databases; run it with the SQLite settings")
+
+        results = {}
+        for mode in MODES:
+            self.stdout.write(f"\n== {mode} ==")
+            database = os.path.join(tempfile.gettempdir(), f"bench_storage_{mode}_{os.getpid()}.sqlite3")
+            connection.settings_dict.setdefault("TEST", {})["NAME"] = database
+            old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            try:
+                with override_settings(CASE_DETAIL_STORAGE=mode):
+                    results[mode] = self.bench_mode(options["cases"], options["repeat"])
+                results[mode]["database_kb"] = os.path.getsize(database) / 1024
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        self.report(results)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def measure(self, name, run, repeat):
+        """Median wall time over `repeat` runs, then one run for the query count"""
+        runs = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            runs.append((time.perf_counter() - started) * 1000)
+        # With DEBUG the query log fills up and stops counting
+        reset_queries()
+        with CaptureQueriesContext(connection) as queries:
+            run()
+        result = {"median_ms": statistics.median(runs), "queries": len(queries.captured_queries)}
+        self.stdout.write(f"  {name:32} {result['median_ms']:9.2f}ms {result['queries']:5} queries")
+        return result
+
+    def bench_mode(self, cases, repeat):
+        started = time.perf_counter()
+        generate_cases(cases, seed=f"bench_storage:{cases}")
+        elapsed = time.perf_counter() - started
+        result = {"bulk_cases_per_s": cases / elapsed}
+        self.stdout.write(f"  generate_cases: {cases} cases in {elapsed:.1f}s ({result['bulk_cases_per_s']:.0f}/s)")
+        # generate_cases clears the rollups; single writes update built ones
+        call_command("rebuild_case_stats", stdout=io.StringIO())
+        call_command("rebuild_search_index", stdout=io.StringIO())
+
+        # One case per transaction, as a form save would write it
+        single = self.measure(
+            "write x100 (one at a time)",
+            _rolled_back(lambda: [_save_one(f"bench_storage:{i}") for i in range(100)]),
+            repeat,
+        )
+        result["single_writes_per_s"] = 100 / (single["median_ms"] / 1000)
+        result["single_write_queries"] = single["queries"] / 100
+
+        list_reads = {}
+        point_reads = {}
+        for case_type, model in CASE_MODELS.items():
+            queryset = model.objects.order_by("pk")[:1000]
+            list_reads[case_type.value] = self.measure(
+                f"serialize_cases[{case_type.value}]", lambda queryset=queryset: list(serialize_cases(queryset)), repeat,
+            )
+            # Cases fetched and serialized one by one, relations read lazily
+            pks = list(model.objects.order_by("pk").values_list("pk", flat=True)[:100])
+            point_reads[case_type.value] = self.measure(
+                f"serialize_case[{case_type.value}] x100",
+                lambda model=model, pks=pks: [serialize_case(model.objects.get(pk=pk)) for pk in pks],
+                repeat,
+            )
+        result["list_reads"] = list_reads
+        result["point_reads"] = point_reads
+        result["list_read_ms"] = sum(entry["median_ms"] for entry in list_reads.values())
+        result["list_read_queries"] = sum(entry["queries"] for entry in list_reads.values())
+        result["point_read_ms"] = sum(entry["median_ms"] for entry in point_reads.values())
+        result["point_read_queries"] = sum(entry["queries"] for entry in point_reads.values())
+        return result
+
+    def report(self, results):
+        columns = (
+            ("bulk_cases_per_s", "bulk/s"),
+            ("single_writes_per_s", "single/s"),
+            ("single_write_queries", "q/write"),
+            ("list_read_ms", "list ms"),
+            ("list_read_queries", "list q"),
+            ("point_read_ms", "point ms"),
+            ("point_read_queries", "point q"),
+            ("database_kb", "db KB"),
+        )
+        self.stdout.write("\n" + f"{'storage':10}" + "".join(f"{label:>11}" for _key, label in columns))
+        for mode, result in results.items():
+            cells = "".join(
+                f"{result[key]:>11.1f}" if isinstance(result[key], float) else f"{result[key]:>11}"
+                for key, _label in columns
+            )
+            self.stdout.write(f"{mode:10}{cells}")
@@ -0,0 +1,209 @@
+import contextlib
+import copy
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from ...case_list import recent_cases
+from ...dataset import generate_cases
+from ...models import CaseTypeEnum
+from ...stats import case_breakdown, case_counts, compute_rollups
+
+
+def _dashboard_request():
+    # One request's worth of the reads behind home and a dashboard, inside
+    # the request signals that open, reuse or close connections per CONN_MAX_AGE
+    request_started.send(sender=Command)
+    try:
+        case_counts()
+        recent_cases(limit=10)
+        case_breakdown(CaseTypeEnum.CRIMINAL)
+    finally:
+        request_finished.send(sender=Command)
+
+
+def _percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))] if samples else None
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare settings.DATABASE_PROFILES on throwaway test databases: "
+        "per-request connection overhead, and dashboard reads while a "
+        "generator writes concurrently."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profiles", default="development,production",
+            help="Comma-separated DATABASE_PROFILES names (postgres needs a reachable server)",
+        )
+        parser.add_argument("--cases", type=int, default=5000, help="Cases to seed each database with")
+        parser.add_argument("--requests", type=int, default=300, help="Sequential requests timed per profile")
+        parser.add_argument("--readers", type=int, default=4, help="Reader threads during the mixed load")
+        parser.add_argument("--seconds", type=float, default=10, help="Duration of the mixed load")
+        parser.add_argument("--output", help="Write the results as JSON")
+
+    def handle(self, *args, **options):
+        names = options["profiles"].split(",")
+        unknown = [name for name in names if name not in settings.DATABASE_PROFILES]
+        if unknown:
+            raise CommandError(f"Unknown database profiles: {', '.join(unknown)}")
+
+        results = {}
+        for name in names:
+            self.stdout.write(f"\n== {name} ==")
+            try:
+                with self.use_profile(name):
+                    results[name] = self.bench_profile(name, options)
+            except (DatabaseError, ImproperlyConfigured) as exc:
+                # Typically postgres without a server or driver
+                self.stdout.write(self.style.WARNING(f"  skipped: {exc}"))
+                results[name] = {"error": str(exc)}
+
+        self.report(results)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    @contextlib.contextmanager
+    def use_profile(self, name):
+        """Point the default connection, in every thread, at a test database for a profile"""
+        profile = copy.deepcopy(settings.DATABASE_PROFILES[name])
+        if profile["ENGINE"].endswith("sqlite3"):
+            # A file, so the reader and writer threads share it
+            profile["TEST"] = {"NAME": os.path.join(tempfile.gettempdir(), f"bench_db_{name}_{os.getpid()}.sqlite3")}
+
+        original_settings = connections.settings
+        original_name = settings.DATABASES[DEFAULT_DB_ALIAS]["NAME"]
+        connections.close_all()
+        connections.settings = connections.configure_settings({DEFAULT_DB_ALIAS: profile})
+        with contextlib.suppress(AttributeError):
+            del connections[DEFAULT_DB_ALIAS]
+        old_name = None
+        try:
+            connection = connections[DEFAULT_DB_ALIAS]
+            old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            yield connection
+        finally:
+            if old_name is not None:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+            connections.close_all()
+            connections.settings = original_settings
+            settings.DATABASES[DEFAULT_DB_ALIAS]["NAME"] = original_name
+            with contextlib.suppress(AttributeError):
+                del connections[DEFAULT_DB_ALIAS]
+
+    def bench_profile(self, name, options):
+        generate_cases(options["cases"], seed=f"bench_db:{name}")
+        compute_rollups(CaseTypeEnum.CRIMINAL)
+        connections.close_all()
+
+        timings = []
+        for _ in range(options["requests"]):
+            started = time.perf_counter()
+            _dashboard_request()
+            timings.append((time.perf_counter() - started) * 1000)
+        result = {
+            "request_median_ms": statistics.median(timings),
+            "request_p95_ms": _percentile(timings, 0.95),
+        }
+        self.stdout.write(
+            f"  sequential requests: {result['request_median_ms']:.2f}ms median, "
+            f"{result['request_p95_ms']:.2f}ms p95"
+        )
+        result.update(self.mixed_load(name, options["readers"], options["seconds"]))
+        return result
+
+    def mixed_load(self, name, readers, seconds):
+        """Reader threads serving dashboard requests while one thread generates cases"""
+        stop = threading.Event()
+        lock = threading.Lock()
+        reads, read_errors, written, write_errors = [], [], [0], []
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    started = time.perf_counter()
+                    try:
+                        _dashboard_request()
+                    except DatabaseError as exc:
+                        with lock:
+                            read_errors.append(str(exc))
+                        continue
+                    with lock:
+                        reads.append((time.perf_counter() - started) * 1000)
+            finally:
+                connections.close_all()
+
+        def writer():
+            batch = 0
+            try:
+                while not stop.is_set():
+                    batch += 1
+                    try:
+                        generate_cases(100, batch_size=100, seed=f"bench_db:{name}:{batch}")
+                    except DatabaseError as exc:
+                        write_errors.append(str(exc))
+                        continue
+                    written[0] += 100
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads.append(threading.Thread(target=writer))
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        result = {
+            "reads_per_s": len(reads) / elapsed,
+            "read_median_ms": statistics.median(reads) if reads else None,
+            "read_p95_ms": _percentile(reads, 0.95),
+            "read_errors": len(read_errors),
+            "cases_written_per_s": written[0] / elapsed,
+            "write_errors": len(write_errors),
+            "errors": sorted(set(read_errors + write_errors)),
+        }
+        self.stdout.write(
+            f"  mixed load: {result['reads_per_s']:.0f} reads/s "
+            f"(p95 {result['read_p95_ms'] or 0:.1f}ms, {result['read_errors']} errors), "
+            f"{result['cases_written_per_s']:.0f} cases written/s ({result['write_errors']} errors)"
+        )
+        return result
+
+    def report(self, results):
+        columns = (
+            ("request_median_ms", "req ms"),
+            ("read_p95_ms", "read p95 ms"),
+            ("reads_per_s", "reads/s"),
+            ("read_errors", "read errs"),
+            ("cases_written_per_s", "writes/s"),
+            ("write_errors", "write errs"),
+        )
+        self.stdout.write("\n" + f"{'profile':14}" + "".join(f"{label:>13}" for _key, label in columns))
+        for name, result in results.items():
+            if "error" in result:
+                self.stdout.write(f"{name:14}  {result['error']}")
+                continue
+            cells = "".join(
+                f"{result[key]:>13.1f}" if isinstance(result[key], float) else f"{result[key]!s:>13}"
+                for key, _label in columns
+            )
+            self.stdout.write(f"{name:14}{cells}")
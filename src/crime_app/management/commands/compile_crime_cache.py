@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...crime_matrix import cache_paths, compile_crime_cache, load_crime_cache
+
+
+class Command(BaseCommand):
+    help = "Compile data/crime.csv into the memory-mapped binary cache the crime APIs load"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", default=settings.CRIME_CSV_PATH, help="CSV file to compile")
+        parser.add_argument("--force", action="store_true", help="Recompile even if the cache is fresh")
+
+    def handle(self, *args, **options):
+        npy_path, _labels_path = cache_paths()
+        if not options["force"] and load_crime_cache(options["path"]) is not None:
+            self.stdout.write(f"{npy_path} is up to date")
+            return
+        matrix = compile_crime_cache(options["path"])
+        districts, years, crimes = matrix.counts.shape
+        self.stdout.write(self.style.SUCCESS(
+            f"Compiled {districts} districts x {years} years x {crimes} crimes to {npy_path}"
+        ))
@@ -0,0 +1,105 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from ... import view_cache
+from ...case_details import DETAIL_FIELDS, SCHEMAS, table_detail
+from ...dataset import CaseBatch
+from ...models import CASE_MODELS, CaseTypeEnum
+from ...serializers import with_relations
+
+
+class Command(BaseCommand):
+    help = (
+        "Move case subtype details between the detail tables and the cases' "
+        "inline JSON column. Set CASE_DETAIL_STORAGE to match afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--to", required=True, choices=("inline", "tables"))
+        parser.add_argument(
+            "--case-type", action="append", dest="case_types",
+            help="Only this case type (repeatable), e.g. --case-type Criminal",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        case_types = list(CASE_MODELS)
+        if options["case_types"]:
+            try:
+                case_types = [CaseTypeEnum(value) for value in options["case_types"]]
+            except ValueError as exc:
+                raise CommandError(str(exc)) from exc
+
+        convert = self.to_inline if options["to"] == "inline" else self.to_tables
+        total = 0
+        for case_type in case_types:
+            converted = convert(case_type, options["batch_size"])
+            self.stdout.write(f"{case_type.label}: {converted} cases converted")
+            total += converted
+
+        # bulk_update() skips the save signals that bump the dashboard caches
+        view_cache.bump_versions(*case_types)
+        self.stdout.write(self.style.SUCCESS(f"Moved {total} subtype details to {options['to']} storage"))
+
+    def batches(self, queryset, batch_size):
+        """Lists of cases by ascending pk; safe while the batches are being updated"""
+        last_pk = 0
+        while True:
+            cases = list(queryset.filter(pk__gt=last_pk).order_by("pk")[:batch_size])
+            if not cases:
+                return
+            yield cases
+            last_pk = cases[-1].pk
+
+    def to_inline(self, case_type, batch_size):
+        """Dump each detail row into its case's JSON, then delete the rows
+
+        Shared rows the details pointed at (Person, PropertyDetail,
+        ChildDetail) are copied into the JSON but left in place.
+        """
+        model = CASE_MODELS[case_type]
+        detail_fields = DETAIL_FIELDS[case_type]
+        queryset = with_relations(model.objects.filter(details__isnull=True), inline=False)
+        converted = 0
+        for cases in self.batches(queryset, batch_size):
+            updated, detail_ids = [], {name: [] for name in detail_fields}
+            for case in cases:
+                name, detail = table_detail(case)
+                if detail is None:
+                    continue
+                case.details = {name: SCHEMAS[case_type][name].dump(detail)}
+                setattr(case, name, None)
+                updated.append(case)
+                detail_ids[name].append(detail.pk)
+
+            with transaction.atomic():
+                model.objects.bulk_update(updated, ["details", *detail_fields])
+                for name, ids in detail_ids.items():
+                    if ids:
+                        # Deleting a detail cascades to its child rows
+                        model._meta.get_field(name).related_model.objects.filter(pk__in=ids).delete()
+            converted += len(updated)
+        return converted
+
+    def to_tables(self, case_type, batch_size):
+        """Insert detail rows for each case's JSON and point the case at them"""
+        model = CASE_MODELS[case_type]
+        detail_fields = DETAIL_FIELDS[case_type]
+        queryset = model.objects.filter(details__isnull=False)
+        converted = 0
+        for cases in self.batches(queryset, batch_size):
+            batch = CaseBatch(None, inline=False)
+            built = []
+            for case in cases:
+                for name, data in (case.details or {}).items():
+                    built.append((case, name, SCHEMAS[case_type][name].build(data, batch.add)))
+
+            with transaction.atomic():
+                batch.save()
+                for case, name, detail in built:
+                    setattr(case, name, detail)
+                for case in cases:
+                    case.details = None
+                model.objects.bulk_update(cases, ["details", *detail_fields])
+            converted += len(built)
+        return converted
@@ -0,0 +1,32 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from ...export import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, iter_export
+from ...models import CaseTypeEnum
+
+
+class Command(BaseCommand):
+    help = "Stream every case to a file as NDJSON or a JSON array"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default="legal_cases.ndjson", help="File to write, or - for stdout")
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+        parser.add_argument(
+            "--case-type", action="append", choices=CaseTypeEnum.values, dest="case_types",
+            help="Only export this case type (repeatable)",
+        )
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        chunks = iter_export(options["format"], options["case_types"], options["chunk_size"])
+
+        if options["output"] == "-":
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+            return
+
+        with open(options["output"], "w") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        self.stdout.write(self.style.SUCCESS(f"Cases exported to {options['output']}"))
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from ...dataset import generate_cases
+
+
+class Command(BaseCommand):
+    help = "Bulk-insert synthetic cases of every type"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, required=True, help="Number of cases to generate")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Cases built and inserted per batch")
+        parser.add_argument("--seed", type=int, default=None, help="Seed for a reproducible dataset")
+        parser.add_argument("--workers", type=int, default=1, help="Generator processes to run in parallel")
+        parser.add_argument(
+            "--skip-stats", action="store_true",
+            help=(
+                "Do not rebuild CaseStatsRollup, CaseIndex and the search index afterwards "
+                "(the rollups are cleared, and rebuilt on the next case save)"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+
+        def progress(generated):
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"{generated}/{options['count']} cases ({generated / elapsed:.0f}/s)")
+
+        generated = generate_cases(
+            options["count"],
+            batch_size=options["batch_size"],
+            seed=options["seed"],
+            workers=options["workers"],
+            progress=progress,
+        )
+
+        # bulk_create bypasses the rollup, case index and search signals
+        if not options["skip_stats"]:
+            call_command("rebuild_case_stats", stdout=self.stdout)
+            call_command("backfill_case_index", stdout=self.stdout)
+            call_command("rebuild_search_index", stdout=self.stdout)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Generated {generated} cases in {elapsed:.1f}s"))
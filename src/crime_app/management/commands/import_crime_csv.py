@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ...crime_data import import_crime_csv
+
+
+class Command(BaseCommand):
+    help = "Load district crime statistics from data/crime.csv (idempotent upsert)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", default=settings.CRIME_CSV_PATH, help="CSV file to import")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            written = import_crime_csv(options["path"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Imported {written} district crime rows from {options['path']}"))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ... import stats, view_cache
+from ...models import CASE_MODELS, CaseStatsRollup
+
+
+class Command(BaseCommand):
+    help = "Rebuild the CaseStatsRollup table from scratch"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            CaseStatsRollup.objects.all().delete()
+            for case_type in CASE_MODELS:
+                rows = stats.rebuild_rollups(case_type)
+                self.stdout.write(f"{case_type.label}: {len(rows)} rollup rows")
+        # Bulk writes bypass the signals that normally invalidate cached dashboards
+        view_cache.bump_versions()
+
+        self.stdout.write(self.style.SUCCESS("Case statistics rebuilt"))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ... import search
+from ...models import CASE_MODELS
+
+
+class Command(BaseCommand):
+    help = "Reindex the free text of every case for /api/search/ (run after backfill_case_index)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        backend = search.get_backend()
+        total = 0
+        # One transaction, so searches never see a half-built index
+        with transaction.atomic():
+            backend.clear()
+            for case_type in CASE_MODELS:
+                indexed = search.rebuild(case_type, batch_size=options["batch_size"])
+                self.stdout.write(f"{case_type.label}: {indexed} cases indexed")
+                total += indexed
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} cases with the {backend.name} backend"))
@@ -0,0 +1,508 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChildDetail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('age', models.IntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CivilContractDispute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contract_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('breach_details', models.TextField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CivilMoneyRecovery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('principal_amount', models.FloatField(blank=True, null=True)),
+                ('debt_documentation', models.CharField(blank=True, max_length=255, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CivilPropertyDispute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CivilTortClaim',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tort_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('damages_claimed', models.FloatField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ConsumerProductDefect',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('product_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('defect_nature', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ConsumerServiceDeficiency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('service_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('deficiency_nature', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ConsumerUnfairTradePractice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('practice_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('misleading_aspect', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CriminalAssault',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('injury_severity', models.CharField(blank=True, max_length=100, null=True)),
+                ('weapon_used', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CriminalFraud',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount_involved', models.FloatField(blank=True, null=True)),
+                ('fraud_type', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CriminalMurderHomicide',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weapon_used', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CriminalTheft',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('property_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('estimated_value', models.FloatField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FamilyChildCustody',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('visitation_rights_proposed', models.TextField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FamilyDivorce',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('divorce_type', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FamilyDomesticViolence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('protection_order_sought', models.BooleanField(default=False)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FamilyMaintenance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('maintenance_for', models.CharField(blank=True, max_length=100, null=True)),
+                ('amount_claimed', models.FloatField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='IPCopyright',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('work_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('infringing_work_details', models.TextField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='IPPatent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('invention_details', models.TextField(blank=True, null=True)),
+                ('dispute_type', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='IPTrademark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trademark_description', models.TextField(blank=True, null=True)),
+                ('dispute_type', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LabourWageDispute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('disputed_amount', models.FloatField(blank=True, null=True)),
+                ('wage_dispute_type', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LabourWorkplaceDiscrimination',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('incident_details', models.TextField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LabourWrongfulTermination',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('termination_date', models.DateField(blank=True, null=True)),
+                ('termination_reason_stated', models.CharField(blank=True, max_length=255, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Person',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('contact_info', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PropertyDetail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('address', models.CharField(blank=True, max_length=255, null=True)),
+                ('value', models.FloatField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PropertyEvictionSuit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('eviction_grounds', models.CharField(blank=True, max_length=100, null=True)),
+                ('arrears_amount', models.FloatField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PropertyPartitionSuit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('share_claimed', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PropertyTitleDispute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('claim_basis', models.CharField(blank=True, max_length=100, null=True)),
+                ('possession_status', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PublicConstitutional',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('government_action_challenged', models.TextField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PublicEnvironmental',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pollution_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('regulatory_authority', models.CharField(blank=True, max_length=100, null=True)),
+                ('penalty_imposed', models.FloatField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PublicTaxation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('assessment_year', models.CharField(blank=True, max_length=20, null=True)),
+                ('disputed_amount', models.FloatField(blank=True, null=True)),
+                ('tax_authority', models.CharField(blank=True, max_length=100, null=True)),
+                ('appeal_stage', models.CharField(blank=True, choices=[('FirstAppeal', 'First Appeal'), ('Tribunal', 'Tribunal'), ('HighCourt', 'High Court'), ('SupremeCourt', 'Supreme Court')], max_length=20, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CaseStatsRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('case_type', models.CharField(choices=[('Criminal', 'Criminal'), ('Civil', 'Civil'), ('FamilyLaw', 'Family Law'), ('PropertyLaw', 'Property Law'), ('ConsumerDispute', 'Consumer Dispute'), ('LabourDispute', 'Labour Dispute'), ('IntellectualProperty', 'Intellectual Property'), ('PublicLaw', 'Public Law')], max_length=30)),
+                ('dimension', models.CharField(max_length=50)),
+                ('value', models.CharField(blank=True, max_length=50)),
+                ('count', models.BigIntegerField(default=0)),
+                ('measure_count', models.BigIntegerField(default=0)),
+                ('measure_sum', models.FloatField(default=0)),
+                ('measure_sum_sq', models.FloatField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('case_type', 'dimension', 'value'), name='unique_case_stats_rollup')],
+            },
+        ),
+        migrations.CreateModel(
+            name='CivilCase',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('case_type', models.CharField(choices=[('Criminal', 'Criminal'), ('Civil', 'Civil'), ('FamilyLaw', 'Family Law'), ('PropertyLaw', 'Property Law'), ('ConsumerDispute', 'Consumer Dispute'), ('LabourDispute', 'Labour Dispute'), ('IntellectualProperty', 'Intellectual Property'), ('PublicLaw', 'Public Law')], max_length=30)),
+                ('subtype', models.CharField(choices=[('ContractDispute', 'Contract Dispute'), ('PropertyDispute', 'Property Dispute'), ('MoneyRecovery', 'Money Recovery'), ('TortClaim', 'Tort Claim'), ('Other', 'Other')], max_length=30)),
+                ('relief_sought', models.TextField()),
+                ('claim_amount', models.FloatField(blank=True, null=True)),
+                ('settlement_attempts', models.BooleanField(default=False)),
+                ('other_details', models.TextField(blank=True, null=True)),
+                ('contract_dispute', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.civilcontractdispute')),
+                ('money_recovery', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.civilmoneyrecovery')),
+                ('property_dispute', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.civilpropertydispute')),
+                ('tort_claim', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.civiltortclaim')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ConsumerDisputeCase',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('case_type', models.CharField(choices=[('Criminal', 'Criminal'), ('Civil', 'Civil'), ('FamilyLaw', 'Family Law'), ('PropertyLaw', 'Property Law'), ('ConsumerDispute', 'Consumer Dispute'), ('LabourDispute', 'Labour Dispute'), ('IntellectualProperty', 'Intellectual Property'), ('PublicLaw', 'Public Law')], max_length=30)),
+                ('subtype', models.CharField(choices=[('ProductDefect', 'Product Defect'), ('ServiceDeficiency', 'Service Deficiency'), ('UnfairTradePractice', 'Unfair Trade Practice'), ('Other', 'Other')], max_length=30)),
+                ('product_service_details', models.TextField()),
+                ('purchase_date', models.DateField(blank=True, null=True)),
+                ('compensation_claimed', models.FloatField(blank=True, null=True)),
+                ('other_details', models.TextField(blank=True, null=True)),
+                ('product_defect', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.consumerproductdefect')),
+                ('service_deficiency', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.consumerservicedeficiency')),
+                ('unfair_trade_practice', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.consumerunfairtradepractice')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='CriminalCase',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('case_type', models.CharField(choices=[('Criminal', 'Criminal'), ('Civil', 'Civil'), ('FamilyLaw', 'Family Law'), ('PropertyLaw', 'Property Law'), ('ConsumerDispute', 'Consumer Dispute'), ('LabourDispute', 'Labour Dispute'), ('IntellectualProperty', 'Intellectual Property'), ('PublicLaw', 'Public Law')], max_length=30)),
+                ('subtype', models.CharField(choices=[('MurderHomicide', 'Murder/Homicide'), ('Theft', 'Theft'), ('Assault', 'Assault'), ('Fraud', 'Fraud'), ('Other', 'Other')], max_length=30)),
+                ('fir_number', models.CharField(max_length=20)),
+                ('police_station', models.CharField(blank=True, max_length=100, null=True)),
+                ('arrest_date', models.DateField(blank=True, null=True)),
+                ('bail_status', models.CharField(blank=True, choices=[('NotApplied', 'Not Applied'), ('Applied', 'Applied'), ('Granted', 'Granted'), ('Rejected', 'Rejected')], max_length=20, null=True)),
+                ('investigation_status', models.CharField(choices=[('Ongoing', 'Ongoing'), ('Completed', 'Completed'), ('Closed', 'Closed')], max_length=20)),
+                ('chargesheet_filed', models.BooleanField(default=False)),
+                ('chargesheet_date', models.DateField(blank=True, null=True)),
+                ('witness_count', models.IntegerField(default=0)),
+                ('other_details', models.TextField(blank=True, null=True)),
+                ('assault', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.criminalassault')),
+                ('fraud', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.criminalfraud')),
+                ('murder_homicide', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.criminalmurderhomicide')),
+                ('theft', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.criminaltheft')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='CriminalCharge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('charge_name', models.CharField(max_length=100)),
+                ('case', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='charges', to='legal_app.criminalcase')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CriminalEvidence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('evidence_type', models.CharField(max_length=100)),
+                ('case', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='evidence_types', to='legal_app.criminalcase')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FamilyChildCustodyDetail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('child_detail', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='legal_app.childdetail')),
+                ('custody', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='children', to='legal_app.familychildcustody')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FamilyDivorceGround',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ground', models.CharField(max_length=100)),
+                ('divorce', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='grounds', to='legal_app.familydivorce')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FamilyDomesticViolenceType',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('violence_type', models.CharField(choices=[('Physical', 'Physical'), ('Emotional', 'Emotional'), ('Sexual', 'Sexual'), ('Financial', 'Financial'), ('Verbal', 'Verbal'), ('Other', 'Other')], max_length=20)),
+                ('domestic_violence', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='violence_types', to='legal_app.familydomesticviolence')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FamilyLawCase',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('case_type', models.CharField(choices=[('Criminal', 'Criminal'), ('Civil', 'Civil'), ('FamilyLaw', 'Family Law'), ('PropertyLaw', 'Property Law'), ('ConsumerDispute', 'Consumer Dispute'), ('LabourDispute', 'Labour Dispute'), ('IntellectualProperty', 'Intellectual Property'), ('PublicLaw', 'Public Law')], max_length=30)),
+                ('subtype', models.CharField(choices=[('Divorce', 'Divorce'), ('Maintenance', 'Maintenance'), ('ChildCustody', 'Child Custody'), ('DomesticViolence', 'Domestic Violence'), ('Other', 'Other')], max_length=30)),
+                ('marriage_date', models.DateField(blank=True, null=True)),
+                ('children_involved', models.BooleanField(default=False)),
+                ('other_details', models.TextField(blank=True, null=True)),
+                ('child_custody', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.familychildcustody')),
+                ('divorce', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.familydivorce')),
+                ('domestic_violence', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.familydomesticviolence')),
+                ('maintenance', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.familymaintenance')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='IntellectualPropertyCase',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('case_type', models.CharField(choices=[('Criminal', 'Criminal'), ('Civil', 'Civil'), ('FamilyLaw', 'Family Law'), ('PropertyLaw', 'Property Law'), ('ConsumerDispute', 'Consumer Dispute'), ('LabourDispute', 'Labour Dispute'), ('IntellectualProperty', 'Intellectual Property'), ('PublicLaw', 'Public Law')], max_length=30)),
+                ('subtype', models.CharField(choices=[('Patent', 'Patent'), ('Trademark', 'Trademark'), ('Copyright', 'Copyright'), ('Other', 'Other')], max_length=30)),
+                ('ip_owner_details', models.CharField(blank=True, max_length=255, null=True)),
+                ('other_details', models.TextField(blank=True, null=True)),
+                ('copyright', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.ipcopyright')),
+                ('patent', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.ippatent')),
+                ('trademark', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.iptrademark')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='LabourDiscriminationGround',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ground', models.CharField(max_length=100)),
+                ('discrimination', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='grounds', to='legal_app.labourworkplacediscrimination')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LabourDisputeCase',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('case_type', models.CharField(choices=[('Criminal', 'Criminal'), ('Civil', 'Civil'), ('FamilyLaw', 'Family Law'), ('PropertyLaw', 'Property Law'), ('ConsumerDispute', 'Consumer Dispute'), ('LabourDispute', 'Labour Dispute'), ('IntellectualProperty', 'Intellectual Property'), ('PublicLaw', 'Public Law')], max_length=30)),
+                ('subtype', models.CharField(choices=[('WrongfulTermination', 'Wrongful Termination'), ('WageDispute', 'Wage Dispute'), ('WorkplaceDiscrimination', 'Workplace Discrimination'), ('Other', 'Other')], max_length=30)),
+                ('employer_details', models.CharField(blank=True, max_length=255, null=True)),
+                ('employment_start_date', models.DateField(blank=True, null=True)),
+                ('other_details', models.TextField(blank=True, null=True)),
+                ('wage_dispute', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.labourwagedispute')),
+                ('workplace_discrimination', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.labourworkplacediscrimination')),
+                ('wrongful_termination', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.labourwrongfultermination')),
+                ('employee', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='labour_cases_as_employee', to='legal_app.person')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='criminalmurderhomicide',
+            name='victim',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='murder_victim', to='legal_app.person'),
+        ),
+        migrations.CreateModel(
+            name='CivilPropertyDisputeDetail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dispute', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='properties', to='legal_app.civilpropertydispute')),
+                ('property_detail', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='legal_app.propertydetail')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PropertyLawCase',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('case_type', models.CharField(choices=[('Criminal', 'Criminal'), ('Civil', 'Civil'), ('FamilyLaw', 'Family Law'), ('PropertyLaw', 'Property Law'), ('ConsumerDispute', 'Consumer Dispute'), ('LabourDispute', 'Labour Dispute'), ('IntellectualProperty', 'Intellectual Property'), ('PublicLaw', 'Public Law')], max_length=30)),
+                ('subtype', models.CharField(choices=[('TitleDispute', 'Title Dispute'), ('EvictionSuit', 'Eviction Suit'), ('PartitionSuit', 'Partition Suit'), ('Other', 'Other')], max_length=30)),
+                ('other_details', models.TextField(blank=True, null=True)),
+                ('eviction_suit', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.propertyevictionsuit')),
+                ('partition_suit', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.propertypartitionsuit')),
+                ('title_dispute', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.propertytitledispute')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PropertyLawCaseProperty',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('case', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='properties', to='legal_app.propertylawcase')),
+                ('property_detail', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='legal_app.propertydetail')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PropertyPartitionCoOwner',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='legal_app.person')),
+                ('partition_suit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='co_owners', to='legal_app.propertypartitionsuit')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PublicConstitutionalRight',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('right', models.CharField(max_length=100)),
+                ('constitutional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fundamental_rights', to='legal_app.publicconstitutional')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PublicLawCase',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('case_type', models.CharField(choices=[('Criminal', 'Criminal'), ('Civil', 'Civil'), ('FamilyLaw', 'Family Law'), ('PropertyLaw', 'Property Law'), ('ConsumerDispute', 'Consumer Dispute'), ('LabourDispute', 'Labour Dispute'), ('IntellectualProperty', 'Intellectual Property'), ('PublicLaw', 'Public Law')], max_length=30)),
+                ('subtype', models.CharField(choices=[('Constitutional', 'Constitutional'), ('Taxation', 'Taxation'), ('Environmental', 'Environmental'), ('Other', 'Other')], max_length=30)),
+                ('other_details', models.TextField(blank=True, null=True)),
+                ('constitutional', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.publicconstitutional')),
+                ('environmental', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.publicenvironmental')),
+                ('taxation', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='legal_app.publictaxation')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('legal_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='civilcase',
+            index=models.Index(fields=['created_at', 'id'], name='civil_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='civilcase',
+            index=models.Index(fields=['subtype', 'created_at'], name='civil_subtype_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='civilcase',
+            index=models.Index(fields=['settlement_attempts', 'created_at'], name='civil_settlement_attempts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='civilcase',
+            index=models.Index(condition=models.Q(('claim_amount__isnull', False)), fields=['claim_amount'], name='civil_claim_nn_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consumerdisputecase',
+            index=models.Index(fields=['created_at', 'id'], name='consumer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consumerdisputecase',
+            index=models.Index(fields=['subtype', 'created_at'], name='consumer_subtype_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consumerdisputecase',
+            index=models.Index(condition=models.Q(('compensation_claimed__isnull', False)), fields=['compensation_claimed'], name='consumer_compensation_nn_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='criminalcase',
+            index=models.Index(fields=['created_at', 'id'], name='crim_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='criminalcase',
+            index=models.Index(fields=['subtype', 'created_at'], name='crim_subtype_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='criminalcase',
+            index=models.Index(fields=['investigation_status', 'created_at'], name='crim_investigation_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='criminalcase',
+            index=models.Index(fields=['bail_status', 'created_at'], name='crim_bail_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='criminalcase',
+            index=models.Index(fields=['chargesheet_filed', 'created_at'], name='crim_chargesheet_filed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='familylawcase',
+            index=models.Index(fields=['created_at', 'id'], name='family_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='familylawcase',
+            index=models.Index(fields=['subtype', 'created_at'], name='family_subtype_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='familylawcase',
+            index=models.Index(fields=['children_involved', 'created_at'], name='family_children_involved_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='intellectualpropertycase',
+            index=models.Index(fields=['created_at', 'id'], name='ip_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='intellectualpropertycase',
+            index=models.Index(fields=['subtype', 'created_at'], name='ip_subtype_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='labourdisputecase',
+            index=models.Index(fields=['created_at', 'id'], name='labour_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='labourdisputecase',
+            index=models.Index(fields=['subtype', 'created_at'], name='labour_subtype_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertylawcase',
+            index=models.Index(fields=['created_at', 'id'], name='prop_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertylawcase',
+            index=models.Index(fields=['subtype', 'created_at'], name='prop_subtype_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publiclawcase',
+            index=models.Index(fields=['created_at', 'id'], name='public_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publiclawcase',
+            index=models.Index(fields=['subtype', 'created_at'], name='public_subtype_idx'),
+        ),
+    ]
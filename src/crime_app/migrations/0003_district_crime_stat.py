@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('legal_app', '0002_case_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DistrictCrimeStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('state', models.CharField(max_length=50)),
+                ('district', models.CharField(max_length=100)),
+                ('year', models.PositiveSmallIntegerField()),
+                ('is_total', models.BooleanField(default=False)),
+                ('murder', models.PositiveIntegerField(default=0)),
+                ('attempt_to_murder', models.PositiveIntegerField(default=0)),
+                ('culpable_homicide', models.PositiveIntegerField(default=0)),
+                ('rape', models.PositiveIntegerField(default=0)),
+                ('custodial_rape', models.PositiveIntegerField(default=0)),
+                ('other_rape', models.PositiveIntegerField(default=0)),
+                ('kidnapping_abduction', models.PositiveIntegerField(default=0)),
+                ('kidnapping_abduction_women_girls', models.PositiveIntegerField(default=0)),
+                ('kidnapping_abduction_others', models.PositiveIntegerField(default=0)),
+                ('dacoity', models.PositiveIntegerField(default=0)),
+                ('dacoity_preparation', models.PositiveIntegerField(default=0)),
+                ('robbery', models.PositiveIntegerField(default=0)),
+                ('burglary', models.PositiveIntegerField(default=0)),
+                ('theft', models.PositiveIntegerField(default=0)),
+                ('auto_theft', models.PositiveIntegerField(default=0)),
+                ('other_theft', models.PositiveIntegerField(default=0)),
+                ('riots', models.PositiveIntegerField(default=0)),
+                ('criminal_breach_of_trust', models.PositiveIntegerField(default=0)),
+                ('cheating', models.PositiveIntegerField(default=0)),
+                ('counterfeiting', models.PositiveIntegerField(default=0)),
+                ('arson', models.PositiveIntegerField(default=0)),
+                ('hurt', models.PositiveIntegerField(default=0)),
+                ('dowry_deaths', models.PositiveIntegerField(default=0)),
+                ('assault_on_women', models.PositiveIntegerField(default=0)),
+                ('insult_to_modesty', models.PositiveIntegerField(default=0)),
+                ('cruelty_by_husband_or_relatives', models.PositiveIntegerField(default=0)),
+                ('importation_of_girls', models.PositiveIntegerField(default=0)),
+                ('death_by_negligence', models.PositiveIntegerField(default=0)),
+                ('other_ipc_crimes', models.PositiveIntegerField(default=0)),
+                ('total_ipc_crimes', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['state', 'year'], name='crimestat_state_year_idx'), models.Index(fields=['year', 'state'], name='crimestat_year_state_idx')],
+                'constraints': [models.UniqueConstraint(fields=('state', 'district', 'year'), name='unique_district_crime_stat')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('legal_app', '0003_district_crime_stat'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CaseIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('case_type', models.CharField(choices=[('Criminal', 'Criminal'), ('Civil', 'Civil'), ('FamilyLaw', 'Family Law'), ('PropertyLaw', 'Property Law'), ('ConsumerDispute', 'Consumer Dispute'), ('LabourDispute', 'Labour Dispute'), ('IntellectualProperty', 'Intellectual Property'), ('PublicLaw', 'Public Law')], max_length=30)),
+                ('subtype', models.CharField(max_length=30)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('status', models.CharField(blank=True, max_length=30)),
+                ('amount', models.FloatField(blank=True, null=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['created_at', 'id'], name='caseindex_created_idx'), models.Index(fields=['updated_at'], name='caseindex_updated_idx'), models.Index(fields=['case_type', 'created_at'], name='caseindex_type_idx'), models.Index(fields=['status', 'created_at'], name='caseindex_status_idx')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id'), name='unique_case_index')],
+            },
+        ),
+    ]
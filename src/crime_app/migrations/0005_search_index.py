@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+FTS_TABLE = 'legal_app_case_search'
+
+
+def create_fts_table(apps, schema_editor):
+    # FTS5 is SQLite only; other databases use the SearchPosting table
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+        "USING fts5(case_type UNINDEXED, body, tokenize = 'unicode61')"
+    )
+
+
+def drop_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('legal_app', '0004_case_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.FloatField()),
+                ('case', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='legal_app.caseindex')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('term', 'case'), name='unique_search_posting')],
+            },
+        ),
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:43
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Round
+
+# Columns that become integer paise: (model, field). Money inside the
+# cases' inline details JSON stays in rupees and needs no conversion.
+# MoneyField deconstructs to BigIntegerField, so this migration and the
+# historical models it runs with don't depend on the current model code.
+MONEY_COLUMNS = [
+    ('caseindex', 'amount'),
+    ('casestatsrollup', 'measure_sum'),
+    ('civilcase', 'claim_amount'),
+    ('civilmoneyrecovery', 'principal_amount'),
+    ('civiltortclaim', 'damages_claimed'),
+    ('consumerdisputecase', 'compensation_claimed'),
+    ('criminalfraud', 'amount_involved'),
+    ('criminaltheft', 'estimated_value'),
+    ('familymaintenance', 'amount_claimed'),
+    ('labourwagedispute', 'disputed_amount'),
+    ('propertydetail', 'value'),
+    ('propertyevictionsuit', 'arrears_amount'),
+    ('publicenvironmental', 'penalty_imposed'),
+    ('publictaxation', 'disputed_amount'),
+]
+
+
+def rupees_to_paise(apps, schema_editor):
+    # Runs while the columns are still floats; AlterField then casts the
+    # whole numbers to integers
+    for model_name, field in MONEY_COLUMNS:
+        model = apps.get_model('legal_app', model_name)
+        model.objects.filter(**{f'{field}__isnull': False}).update(**{field: Round(F(field) * 100)})
+
+
+def paise_to_rupees(apps, schema_editor):
+    # Runs after the columns are floats again
+    for model_name, field in MONEY_COLUMNS:
+        model = apps.get_model('legal_app', model_name)
+        model.objects.filter(**{f'{field}__isnull': False}).update(**{field: F(field) / 100.0})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('legal_app', '0006_case_details'),
+    ]
+
+    operations = [
+        migrations.RunPython(rupees_to_paise, paise_to_rupees),
+        migrations.RemoveField(
+            model_name='casestatsrollup',
+            name='measure_sum_sq',
+        ),
+        migrations.AlterField(
+            model_name='caseindex',
+            name='amount',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='casestatsrollup',
+            name='measure_sum',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='civilcase',
+            name='claim_amount',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='civilmoneyrecovery',
+            name='principal_amount',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='civiltortclaim',
+            name='damages_claimed',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='consumerdisputecase',
+            name='compensation_claimed',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='criminalfraud',
+            name='amount_involved',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='criminaltheft',
+            name='estimated_value',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='familymaintenance',
+            name='amount_claimed',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='labourwagedispute',
+            name='disputed_amount',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='propertydetail',
+            name='value',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='propertyevictionsuit',
+            name='arrears_amount',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='publicenvironmental',
+            name='penalty_imposed',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='publictaxation',
+            name='disputed_amount',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('legal_app', '0007_money_paise'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='caseindex',
+            name='caseindex_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='caseindex',
+            index=models.Index(fields=['created_at', 'case_type', 'object_id'], name='caseindex_feed_idx'),
+        ),
+    ]
@@ -1,5 +1,10 @@
 from django.db import models
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from datetime import datetime, date
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 import json
 from mixer.backend.django import mixer
 from enum import Enum
@@ -32,6 +37,62 @@ class CaseTypeEnum(models.TextChoices):
     INTELLECTUAL_PROPERTY = "IntellectualProperty", "Intellectual Property"
     PUBLIC_LAW = "PublicLaw", "Public Law"
 
+# Money
+def to_paise(amount):
+    """Integer paise for an amount in rupees (Decimal, int, float or str)"""
+    if amount is None:
+        return None
+    if not isinstance(amount, Decimal):
+        # Via str() so a float like 0.1 converts as written
+        amount = Decimal(str(amount))
+    return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_paise(paise):
+    """Decimal rupees for integer paise"""
+    return None if paise is None else Decimal(paise).scaleb(-2)
+
+
+class MoneyField(models.BigIntegerField):
+    """An amount in rupees, stored as integer paise
+
+    Values are Decimals with two places, and lookups and saves take rupees.
+    Sum() over the column is exact and comes back in rupees; Avg() would be
+    a float of paise, so divide a Sum by a Count instead. Aggregates that
+    must stay in paise (e.g. running totals) can set output_field to a
+    plain BigIntegerField.
+    """
+
+    def from_db_value(self, value, expression, connection):
+        return from_paise(value)
+
+    def to_python(self, value):
+        if value is None or value == "":
+            return None
+        try:
+            return from_paise(to_paise(value))
+        except (InvalidOperation, ValueError, TypeError):
+            raise ValidationError(f"'{value}' is not a valid amount", code="invalid")
+
+    def get_prep_value(self, value):
+        if hasattr(value, "resolve_expression"):
+            return value
+        return to_paise(self.to_python(value))
+
+    def deconstruct(self):
+        # Migrations see the plain column, so they never import this module
+        name, _path, args, kwargs = super().deconstruct()
+        return name, "django.db.models.BigIntegerField", args, kwargs
+
+    def formfield(self, **kwargs):
+        from django import forms
+        return super().formfield(**{
+            "form_class": forms.DecimalField,
+            "decimal_places": 2,
+            **kwargs,
+        })
+
+
 # Person model
 class Person(models.Model):
     name = models.CharField(max_length=100)
@@ -43,7 +104,7 @@ class Person(models.Model):
 # Property Detail model
 class PropertyDetail(models.Model):
     address = models.CharField(max_length=255, null=True, blank=True)
-    value = models.FloatField(null=True, blank=True)
+    value = MoneyField(null=True, blank=True)
 
     def __str__(self):
         return self.address or "Unnamed Property"
@@ -63,10 +124,46 @@ class Case(models.Model):
         max_length=30,
         choices=CaseTypeEnum.choices,
     )
+    # Subtype detail held inline, e.g. {"theft": {"property_type": ...}},
+    # when settings.CASE_DETAIL_STORAGE is "inline" (see case_details.py)
+    details = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
     
     class Meta:
         abstract = True
 
+    def clean(self):
+        super().clean()
+        # case_details imports this module
+        from .case_details import case_type_of, validate_details
+        self.details = validate_details(case_type_of(self), self.details)
+
+    @property
+    def detail(self):
+        """The subtype detail: a detail row, or an inline DetailRecord"""
+        from .case_details import subtype_detail
+        return subtype_detail(self)
+
+def case_indexes(prefix, dimensions=(), amounts=()):
+    """Indexes for a concrete case table
+
+    A (created_at, id) index for recency ordering, a (dimension, created_at)
+    index per dashboard grouping column (the TextChoices/boolean fields),
+    and partial indexes over nullable amounts so Avg/Sum skip NULL rows.
+    """
+    indexes = [models.Index(fields=["created_at", "id"], name=f"{prefix}_created_idx")]
+    for dimension in dimensions:
+        indexes.append(models.Index(
+            fields=[dimension, "created_at"],
+            name=f"{prefix}_{dimension}_idx",
+        ))
+    for amount, name in amounts:
+        indexes.append(models.Index(
+            fields=[amount],
+            name=f"{prefix}_{name}_nn_idx",
+            condition=models.Q(**{f"{amount}__isnull": False}),
+        ))
+    return indexes
+
 # Criminal Case Models
 class CriminalCaseSubtype(models.TextChoices):
     MURDER_HOMICIDE = "MurderHomicide", "Murder/Homicide"
@@ -92,14 +189,14 @@ class CriminalMurderHomicide(models.Model):
 
 class CriminalTheft(models.Model):
     property_type = models.CharField(max_length=100, null=True, blank=True)
-    estimated_value = models.FloatField(null=True, blank=True)
+    estimated_value = MoneyField(null=True, blank=True)
 
 class CriminalAssault(models.Model):
     injury_severity = models.CharField(max_length=100, null=True, blank=True)
     weapon_used = models.CharField(max_length=100, null=True, blank=True)
 
 class CriminalFraud(models.Model):
-    amount_involved = models.FloatField(null=True, blank=True)
+    amount_involved = MoneyField(null=True, blank=True)
     fraud_type = models.CharField(max_length=100, null=True, blank=True)
 
 class CriminalCase(Case):
@@ -151,6 +248,12 @@ class CriminalCase(Case):
     )
     other_details = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = case_indexes(
+            "crim",
+            dimensions=("subtype", "investigation_status", "bail_status", "chargesheet_filed"),
+        )
+
 class CriminalCharge(models.Model):
     case = models.ForeignKey(CriminalCase, on_delete=models.CASCADE, related_name="charges")
     charge_name = models.CharField(max_length=100)
@@ -180,12 +283,12 @@ class CivilPropertyDisputeDetail(models.Model):
     property_detail = models.ForeignKey(PropertyDetail, on_delete=models.CASCADE)
 
 class CivilMoneyRecovery(models.Model):
-    principal_amount = models.FloatField(null=True, blank=True)
+    principal_amount = MoneyField(null=True, blank=True)
     debt_documentation = models.CharField(max_length=255, null=True, blank=True)
 
 class CivilTortClaim(models.Model):
     tort_type = models.CharField(max_length=100, null=True, blank=True)
-    damages_claimed = models.FloatField(null=True, blank=True)
+    damages_claimed = MoneyField(null=True, blank=True)
 
 class CivilCase(Case):
     subtype = models.CharField(
@@ -193,7 +296,7 @@ class CivilCase(Case):
         choices=CivilCaseSubtype.choices,
     )
     relief_sought = models.TextField()
-    claim_amount = models.FloatField(null=True, blank=True)
+    claim_amount = MoneyField(null=True, blank=True)
     settlement_attempts = models.BooleanField(default=False)
     
     # Foreign key relationships to subtype-specific details
@@ -223,6 +326,13 @@ class CivilCase(Case):
     )
     other_details = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = case_indexes(
+            "civil",
+            dimensions=("subtype", "settlement_attempts"),
+            amounts=(("claim_amount", "claim"),),
+        )
+
 # Family Law Case Models
 class FamilyLawSubtype(models.TextChoices):
     DIVORCE = "Divorce", "Divorce"
@@ -240,7 +350,7 @@ class FamilyDivorceGround(models.Model):
 
 class FamilyMaintenance(models.Model):
     maintenance_for = models.CharField(max_length=100, null=True, blank=True)
-    amount_claimed = models.FloatField(null=True, blank=True)
+    amount_claimed = MoneyField(null=True, blank=True)
 
 class FamilyChildCustody(models.Model):
     visitation_rights_proposed = models.TextField(null=True, blank=True)
@@ -294,6 +404,12 @@ class FamilyLawCase(Case):
     )
     other_details = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = case_indexes(
+            "family",
+            dimensions=("subtype", "children_involved"),
+        )
+
 # Property Law Case Models
 class PropertyLawSubtype(models.TextChoices):
     TITLE_DISPUTE = "TitleDispute", "Title Dispute"
@@ -307,7 +423,7 @@ class PropertyTitleDispute(models.Model):
 
 class PropertyEvictionSuit(models.Model):
     eviction_grounds = models.CharField(max_length=100, null=True, blank=True)
-    arrears_amount = models.FloatField(null=True, blank=True)
+    arrears_amount = MoneyField(null=True, blank=True)
 
 class PropertyPartitionSuit(models.Model):
     share_claimed = models.CharField(max_length=100, null=True, blank=True)
@@ -343,6 +459,9 @@ class PropertyLawCase(Case):
     )
     other_details = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = case_indexes("prop", dimensions=("subtype",))
+
 class PropertyLawCaseProperty(models.Model):
     case = models.ForeignKey(PropertyLawCase, on_delete=models.CASCADE, related_name="properties")
     property_detail = models.ForeignKey(PropertyDetail, on_delete=models.CASCADE)
@@ -373,7 +492,7 @@ class ConsumerDisputeCase(Case):
     )
     product_service_details = models.TextField()
     purchase_date = models.DateField(null=True, blank=True)
-    compensation_claimed = models.FloatField(null=True, blank=True)
+    compensation_claimed = MoneyField(null=True, blank=True)
     
     # Foreign key relationships to subtype-specific details
     product_defect = models.OneToOneField(
@@ -396,6 +515,13 @@ class ConsumerDisputeCase(Case):
     )
     other_details = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = case_indexes(
+            "consumer",
+            dimensions=("subtype",),
+            amounts=(("compensation_claimed", "compensation"),),
+        )
+
 # Labour Dispute Case Models
 class LabourDisputeSubtype(models.TextChoices):
     WRONGFUL_TERMINATION = "WrongfulTermination", "Wrongful Termination"
@@ -408,7 +534,7 @@ class LabourWrongfulTermination(models.Model):
     termination_reason_stated = models.CharField(max_length=255, null=True, blank=True)
 
 class LabourWageDispute(models.Model):
-    disputed_amount = models.FloatField(null=True, blank=True)
+    disputed_amount = MoneyField(null=True, blank=True)
     wage_dispute_type = models.CharField(max_length=100, null=True, blank=True)
 
 class LabourWorkplaceDiscrimination(models.Model):
@@ -448,6 +574,9 @@ class LabourDisputeCase(Case):
     )
     other_details = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = case_indexes("labour", dimensions=("subtype",))
+
 # Intellectual Property Case Models
 class IPCaseSubtype(models.TextChoices):
     PATENT = "Patent", "Patent"
@@ -495,6 +624,9 @@ class IntellectualPropertyCase(Case):
     )
     other_details = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = case_indexes("ip", dimensions=("subtype",))
+
 # Public Law Case Models
 class PublicLawSubtype(models.TextChoices):
     CONSTITUTIONAL = "Constitutional", "Constitutional"
@@ -511,7 +643,7 @@ class PublicConstitutionalRight(models.Model):
 
 class PublicTaxation(models.Model):
     assessment_year = models.CharField(max_length=20, null=True, blank=True)
-    disputed_amount = models.FloatField(null=True, blank=True)
+    disputed_amount = MoneyField(null=True, blank=True)
     tax_authority = models.CharField(max_length=100, null=True, blank=True)
     appeal_stage = models.CharField(
         max_length=20,
@@ -523,7 +655,7 @@ class PublicTaxation(models.Model):
 class PublicEnvironmental(models.Model):
     pollution_type = models.CharField(max_length=100, null=True, blank=True)
     regulatory_authority = models.CharField(max_length=100, null=True, blank=True)
-    penalty_imposed = models.FloatField(null=True, blank=True)
+    penalty_imposed = MoneyField(null=True, blank=True)
 
 class PublicLawCase(Case):
     subtype = models.CharField(
@@ -551,3 +683,193 @@ class PublicLawCase(Case):
         blank=True
     )
     other_details = models.TextField(null=True, blank=True)
+
+    class Meta:
+        indexes = case_indexes("public", dimensions=("subtype",))
+
+
+# Concrete case models keyed by their top-level case type
+CASE_MODELS = {
+    CaseTypeEnum.CRIMINAL: CriminalCase,
+    CaseTypeEnum.CIVIL: CivilCase,
+    CaseTypeEnum.FAMILY_LAW: FamilyLawCase,
+    CaseTypeEnum.PROPERTY_LAW: PropertyLawCase,
+    CaseTypeEnum.CONSUMER_DISPUTE: ConsumerDisputeCase,
+    CaseTypeEnum.LABOUR_DISPUTE: LabourDisputeCase,
+    CaseTypeEnum.INTELLECTUAL_PROPERTY: IntellectualPropertyCase,
+    CaseTypeEnum.PUBLIC_LAW: PublicLawCase,
+}
+
+
+# Pre-aggregated dashboard statistics, kept current by signals.py
+class CaseStatsRollup(models.Model):
+    case_type = models.CharField(
+        max_length=30,
+        choices=CaseTypeEnum.choices,
+    )
+    dimension = models.CharField(max_length=50)
+    value = models.CharField(max_length=50, blank=True)
+    count = models.BigIntegerField(default=0)
+
+    # Running count and sum of the case type's money measure (e.g.
+    # claim_amount), the sum in integer paise so it stays exact
+    measure_count = models.BigIntegerField(default=0)
+    measure_sum = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["case_type", "dimension", "value"],
+                name="unique_case_stats_rollup",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.case_type} {self.dimension}={self.value}: {self.count}"
+
+
+# One narrow row per case of any type, kept in sync by signals, so
+# cross-type listing, counting and filtering is a single indexed query
+class CaseIndex(models.Model):
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    case = GenericForeignKey("content_type", "object_id")
+
+    case_type = models.CharField(
+        max_length=30,
+        choices=CaseTypeEnum.choices,
+    )
+    subtype = models.CharField(max_length=30)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    # Hot filter columns copied from the case tables (see CASE_INDEX_COLUMNS)
+    status = models.CharField(max_length=30, blank=True)
+    amount = MoneyField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id"],
+                name="unique_case_index",
+            ),
+        ]
+        indexes = [
+            # The cross-type feed's order (case_list.recent_cases)
+            models.Index(fields=["created_at", "case_type", "object_id"], name="caseindex_feed_idx"),
+            models.Index(fields=["updated_at"], name="caseindex_updated_idx"),
+            models.Index(fields=["case_type", "created_at"], name="caseindex_type_idx"),
+            models.Index(fields=["status", "created_at"], name="caseindex_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.case_type} #{self.object_id} ({self.subtype})"
+
+
+# Portable inverted index over the case free-text fields, used by
+# search.py when SQLite FTS5 is not available
+class SearchPosting(models.Model):
+    term = models.CharField(max_length=64)
+    case = models.ForeignKey(CaseIndex, on_delete=models.CASCADE, related_name="postings")
+    # Length-normalized log term frequency, (1 + ln tf) / sqrt(terms in case)
+    weight = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["term", "case"],
+                name="unique_search_posting",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.term} -> {self.case_id} ({self.weight:.3f})"
+
+
+# District-level IPC crime statistics, loaded from data/crime.csv
+# CSV header -> DistrictCrimeStat field for each crime count column
+CRIME_COLUMNS = {
+    "MURDER": "murder",
+    "ATTEMPT TO MURDER": "attempt_to_murder",
+    "CULPABLE HOMICIDE NOT AMOUNTING TO MURDER": "culpable_homicide",
+    "RAPE": "rape",
+    "CUSTODIAL RAPE": "custodial_rape",
+    "OTHER RAPE": "other_rape",
+    "KIDNAPPING & ABDUCTION": "kidnapping_abduction",
+    "KIDNAPPING AND ABDUCTION OF WOMEN AND GIRLS": "kidnapping_abduction_women_girls",
+    "KIDNAPPING AND ABDUCTION OF OTHERS": "kidnapping_abduction_others",
+    "DACOITY": "dacoity",
+    "PREPARATION AND ASSEMBLY FOR DACOITY": "dacoity_preparation",
+    "ROBBERY": "robbery",
+    "BURGLARY": "burglary",
+    "THEFT": "theft",
+    "AUTO THEFT": "auto_theft",
+    "OTHER THEFT": "other_theft",
+    "RIOTS": "riots",
+    "CRIMINAL BREACH OF TRUST": "criminal_breach_of_trust",
+    "CHEATING": "cheating",
+    "COUNTERFIETING": "counterfeiting",
+    "ARSON": "arson",
+    "HURT/GREVIOUS HURT": "hurt",
+    "DOWRY DEATHS": "dowry_deaths",
+    "ASSAULT ON WOMEN WITH INTENT TO OUTRAGE HER MODESTY": "assault_on_women",
+    "INSULT TO MODESTY OF WOMEN": "insult_to_modesty",
+    "CRUELTY BY HUSBAND OR HIS RELATIVES": "cruelty_by_husband_or_relatives",
+    "IMPORTATION OF GIRLS FROM FOREIGN COUNTRIES": "importation_of_girls",
+    "CAUSING DEATH BY NEGLIGENCE": "death_by_negligence",
+    "OTHER IPC CRIMES": "other_ipc_crimes",
+    "TOTAL IPC CRIMES": "total_ipc_crimes",
+}
+
+class DistrictCrimeStat(models.Model):
+    state = models.CharField(max_length=50)
+    district = models.CharField(max_length=100)
+    year = models.PositiveSmallIntegerField()
+    # State-level "TOTAL" rows published alongside the districts
+    is_total = models.BooleanField(default=False)
+
+    murder = models.PositiveIntegerField(default=0)
+    attempt_to_murder = models.PositiveIntegerField(default=0)
+    culpable_homicide = models.PositiveIntegerField(default=0)
+    rape = models.PositiveIntegerField(default=0)
+    custodial_rape = models.PositiveIntegerField(default=0)
+    other_rape = models.PositiveIntegerField(default=0)
+    kidnapping_abduction = models.PositiveIntegerField(default=0)
+    kidnapping_abduction_women_girls = models.PositiveIntegerField(default=0)
+    kidnapping_abduction_others = models.PositiveIntegerField(default=0)
+    dacoity = models.PositiveIntegerField(default=0)
+    dacoity_preparation = models.PositiveIntegerField(default=0)
+    robbery = models.PositiveIntegerField(default=0)
+    burglary = models.PositiveIntegerField(default=0)
+    theft = models.PositiveIntegerField(default=0)
+    auto_theft = models.PositiveIntegerField(default=0)
+    other_theft = models.PositiveIntegerField(default=0)
+    riots = models.PositiveIntegerField(default=0)
+    criminal_breach_of_trust = models.PositiveIntegerField(default=0)
+    cheating = models.PositiveIntegerField(default=0)
+    counterfeiting = models.PositiveIntegerField(default=0)
+    arson = models.PositiveIntegerField(default=0)
+    hurt = models.PositiveIntegerField(default=0)
+    dowry_deaths = models.PositiveIntegerField(default=0)
+    assault_on_women = models.PositiveIntegerField(default=0)
+    insult_to_modesty = models.PositiveIntegerField(default=0)
+    cruelty_by_husband_or_relatives = models.PositiveIntegerField(default=0)
+    importation_of_girls = models.PositiveIntegerField(default=0)
+    death_by_negligence = models.PositiveIntegerField(default=0)
+    other_ipc_crimes = models.PositiveIntegerField(default=0)
+    total_ipc_crimes = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["state", "district", "year"],
+                name="unique_district_crime_stat",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["state", "year"], name="crimestat_state_year_idx"),
+            models.Index(fields=["year", "state"], name="crimestat_year_state_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.district}, {self.state} ({self.year})"
@@ -0,0 +1,245 @@
+import math
+import re
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, Count, F, FloatField, Max, Sum, When
+
+from . import case_details
+from .models import CASE_MODELS, CaseIndex, CaseTypeEnum, SearchPosting
+
+# Free-text fields indexed for each case type; "relation__field" paths
+# read the field from the case's subtype detail
+SEARCH_FIELDS = {
+    CaseTypeEnum.CRIMINAL: ("other_details",),
+    CaseTypeEnum.CIVIL: ("relief_sought", "other_details", "contract_dispute__breach_details"),
+    CaseTypeEnum.FAMILY_LAW: ("other_details", "child_custody__visitation_rights_proposed"),
+    CaseTypeEnum.PROPERTY_LAW: ("other_details",),
+    CaseTypeEnum.CONSUMER_DISPUTE: ("product_service_details", "other_details"),
+    CaseTypeEnum.LABOUR_DISPUTE: ("other_details", "workplace_discrimination__incident_details"),
+    CaseTypeEnum.INTELLECTUAL_PROPERTY: (
+        "other_details",
+        "patent__invention_details",
+        "trademark__trademark_description",
+        "copyright__infringing_work_details",
+    ),
+    CaseTypeEnum.PUBLIC_LAW: ("other_details", "constitutional__government_action_challenged"),
+}
+
+FTS_TABLE = "legal_app_case_search"
+
+TOKEN_RE = re.compile(r"\w+")
+MAX_TERM_LENGTH = 64
+
+
+def tokenize(text):
+    """Lowercased word tokens, the same way for documents and queries"""
+    return [token for token in TOKEN_RE.findall(text.lower()) if len(token) <= MAX_TERM_LENGTH]
+
+
+def document_text(case_type, values):
+    """Searchable text of a case from a dict of its SEARCH_FIELDS"""
+    return "\n".join(values[field] for field in SEARCH_FIELDS[case_type] if values[field])
+
+
+class Fts5Index:
+    """SQLite FTS5 virtual table keyed by CaseIndex id, ranked with bm25()"""
+
+    name = "fts5"
+
+    def index(self, documents):
+        """Replace the indexed text of (case index id, case type, text) documents"""
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid = %s",
+                [(case_id,) for case_id, _case_type, _text in documents],
+            )
+            cursor.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, case_type, body) VALUES (%s, %s, %s)",
+                documents,
+            )
+
+    def remove(self, case_ids):
+        with connection.cursor() as cursor:
+            cursor.executemany(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [(case_id,) for case_id in case_ids])
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+
+    def search(self, terms, case_type=None, limit=20):
+        # Quoted terms, implicitly ANDed; tokenize() output has no FTS syntax
+        match = " ".join(f'"{term}"' for term in terms)
+        sql = f"SELECT rowid, -bm25({FTS_TABLE}) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s"
+        params = [match]
+        if case_type:
+            sql += " AND case_type = %s"
+            params.append(case_type)
+        sql += f" ORDER BY bm25({FTS_TABLE}) LIMIT %s"
+        params.append(limit)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+
+class PostingsIndex:
+    """Inverted index in the SearchPosting table, tokenized in Python
+
+    Works on any database. Cases must contain every query term and are
+    ranked by the sum of posting weight x idf over the terms.
+    """
+
+    name = "postings"
+
+    def index(self, documents):
+        case_ids = [case_id for case_id, _case_type, _text in documents]
+        SearchPosting.objects.filter(case_id__in=case_ids).delete()
+
+        postings = []
+        for case_id, _case_type, text in documents:
+            counts = Counter(tokenize(text))
+            norm = math.sqrt(sum(counts.values())) or 1
+            postings.extend(
+                SearchPosting(term=term, case_id=case_id, weight=(1 + math.log(tf)) / norm)
+                for term, tf in counts.items()
+            )
+        SearchPosting.objects.bulk_create(postings, batch_size=5000)
+
+    def remove(self, case_ids):
+        SearchPosting.objects.filter(case_id__in=case_ids).delete()
+
+    def clear(self):
+        SearchPosting.objects.all().delete()
+
+    def search(self, terms, case_type=None, limit=20):
+        terms = sorted(set(terms))
+        document_freq = dict(
+            SearchPosting.objects.filter(term__in=terms)
+            .values("term").annotate(df=Count("id")).values_list("term", "df")
+        )
+        if len(document_freq) < len(terms):
+            return []
+
+        # The highest CaseIndex id stands in for the document count
+        documents = CaseIndex.objects.aggregate(n=Max("id"))["n"] or 1
+        idf = {term: math.log(1 + documents / df) for term, df in document_freq.items()}
+
+        postings = SearchPosting.objects.filter(term__in=terms)
+        if case_type:
+            postings = postings.filter(case__case_type=case_type)
+        ranked = (
+            postings.values("case_id")
+            .annotate(
+                matched=Count("id"),
+                score=Sum(Case(
+                    *[When(term=term, then=F("weight") * idf[term]) for term in terms],
+                    output_field=FloatField(),
+                )),
+            )
+            .filter(matched=len(terms))
+            .order_by("-score")[:limit]
+        )
+        return [(row["case_id"], row["score"]) for row in ranked]
+
+
+# Names of databases seen with the FTS table. Only hits are remembered:
+# migrate may create the table after a miss
+_fts_databases = set()
+
+
+def _has_fts_table(database):
+    if database not in _fts_databases and FTS_TABLE in connection.introspection.table_names():
+        _fts_databases.add(database)
+    return database in _fts_databases
+
+
+def forget_fts_tables(**kwargs):
+    """post_migrate receiver: a migration may have dropped the FTS table"""
+    _fts_databases.clear()
+
+
+def fts5_available():
+    return connection.vendor == "sqlite" and _has_fts_table(str(connection.settings_dict["NAME"]))
+
+
+def get_backend():
+    """Search backend per settings.CASE_SEARCH_BACKEND ("auto", "fts5" or "postings")
+
+    "auto" uses FTS5 when running on SQLite with the FTS table migrated.
+    """
+    choice = getattr(settings, "CASE_SEARCH_BACKEND", "auto")
+    if choice == "fts5" or (choice == "auto" and fts5_available()):
+        return Fts5Index()
+    return PostingsIndex()
+
+
+# Index maintenance
+
+def _documents(case_type, case_ids):
+    """(case index id, case type, text) for a {case pk: case index id} mapping"""
+    fields = SEARCH_FIELDS[case_type]
+    # Detail paths are read from both the inline JSON and the detail
+    # tables: during a convert_case_details run cases use either
+    inline = {field: case_details.inline_path(case_type, field) for field in fields}
+    paths = set(fields) | set(inline.values())
+    values = CASE_MODELS[case_type].objects.filter(pk__in=list(case_ids)).values("pk", *paths)
+    return [
+        (case_ids[row["pk"]], case_type, document_text(case_type, {
+            field: row[field] if row[inline[field]] is None else row[inline[field]] for field in fields
+        }))
+        for row in values
+    ]
+
+
+def index_case(case_type, case_pk, case_index_id):
+    """Reindex one case after it or one of its subtype details changed"""
+    get_backend().index(_documents(case_type, {case_pk: case_index_id}))
+
+
+def remove_cases(case_index_ids):
+    get_backend().remove(case_index_ids)
+
+
+def rebuild(case_type, batch_size=2000):
+    """(Re)index every case of one type from CaseIndex; returns the count"""
+    backend = get_backend()
+    entries = CaseIndex.objects.filter(case_type=case_type).order_by("id").values_list("object_id", "id")
+    indexed = 0
+    batch = {}
+    for object_id, case_index_id in entries.iterator(chunk_size=batch_size):
+        batch[object_id] = case_index_id
+        if len(batch) >= batch_size:
+            backend.index(_documents(case_type, batch))
+            indexed += len(batch)
+            batch = {}
+    if batch:
+        backend.index(_documents(case_type, batch))
+        indexed += len(batch)
+    return indexed
+
+
+# Queries
+
+def search(query, case_type=None, limit=20):
+    """Cases matching every word of `query`, best match first
+
+    Returns CaseIndex values (case_type, object_id, subtype, created_at)
+    with a relevance score; higher is better.
+    """
+    terms = tokenize(query)
+    if not terms:
+        return []
+    ranked = get_backend().search(terms, case_type=case_type, limit=limit)
+    rows = CaseIndex.objects.in_bulk([case_id for case_id, _score in ranked])
+    return [
+        {
+            "case_type": rows[case_id].case_type,
+            "id": rows[case_id].object_id,
+            "subtype": rows[case_id].subtype,
+            "created_at": rows[case_id].created_at,
+            "score": score,
+        }
+        for case_id, score in ranked
+        if case_id in rows
+    ]
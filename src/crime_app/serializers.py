@@ -0,0 +1,337 @@
+from decimal import Decimal
+
+from django.db.models import Prefetch
+
+from . import case_details
+from .models import (
+    CASE_MODELS,
+    CaseTypeEnum,
+    CivilPropertyDisputeDetail,
+    FamilyChildCustodyDetail,
+    PropertyLawCaseProperty,
+    PropertyPartitionCoOwner,
+)
+
+# Relations each case type's serializer reads: OneToOne/FK paths are
+# joined in with select_related, reverse relations are prefetched (with
+# their own FKs joined in, rather than prefetched as a further level).
+# With inline detail storage the subtype detail paths are skipped
+CASE_RELATIONS = {
+    CaseTypeEnum.CRIMINAL: (
+        ('murder_homicide__victim', 'theft', 'assault', 'fraud'),
+        ('charges', 'evidence_types'),
+    ),
+    CaseTypeEnum.CIVIL: (
+        ('contract_dispute', 'property_dispute', 'money_recovery', 'tort_claim'),
+        (
+            Prefetch('property_dispute__properties', CivilPropertyDisputeDetail.objects.select_related('property_detail')),
+        ),
+    ),
+    CaseTypeEnum.FAMILY_LAW: (
+        ('divorce', 'maintenance', 'child_custody', 'domestic_violence'),
+        (
+            'divorce__grounds',
+            Prefetch('child_custody__children', FamilyChildCustodyDetail.objects.select_related('child_detail')),
+            'domestic_violence__violence_types',
+        ),
+    ),
+    CaseTypeEnum.PROPERTY_LAW: (
+        ('title_dispute', 'eviction_suit', 'partition_suit'),
+        (
+            Prefetch('properties', PropertyLawCaseProperty.objects.select_related('property_detail')),
+            Prefetch('partition_suit__co_owners', PropertyPartitionCoOwner.objects.select_related('person')),
+        ),
+    ),
+    CaseTypeEnum.CONSUMER_DISPUTE: (
+        ('product_defect', 'service_deficiency', 'unfair_trade_practice'),
+        (),
+    ),
+    CaseTypeEnum.LABOUR_DISPUTE: (
+        ('employee', 'wrongful_termination', 'wage_dispute', 'workplace_discrimination'),
+        ('workplace_discrimination__grounds',),
+    ),
+    CaseTypeEnum.INTELLECTUAL_PROPERTY: (
+        ('patent', 'trademark', 'copyright'),
+        (),
+    ),
+    CaseTypeEnum.PUBLIC_LAW: (
+        ('constitutional', 'taxation', 'environmental'),
+        ('constitutional__fundamental_rights',),
+    ),
+}
+
+CASE_TYPES = {model: case_type for case_type, model in CASE_MODELS.items()}
+
+
+def _value(value):
+    # Dates become ISO strings and money (Decimal rupees) a number, which
+    # for two decimal places prints back exactly; everything else is
+    # already JSON-friendly
+    if isinstance(value, Decimal):
+        return float(value)
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def _fields(obj, *names):
+    return {name: _value(getattr(obj, name)) for name in names}
+
+
+def _person(person):
+    if person is None:
+        return None
+    return {'name': person.name, 'contact_info': person.contact_info}
+
+
+def _property(property_detail):
+    return {'address': property_detail.address, 'value': _value(property_detail.value)}
+
+
+def _base(case, *names):
+    return {
+        'id': case.id,
+        'case_type': case.case_type,
+        'subtype': case.subtype,
+        **_fields(case, *names),
+        'created_at': _value(case.created_at),
+        'updated_at': _value(case.updated_at),
+    }
+
+
+# Per-type serializers; they only read relations listed in CASE_RELATIONS
+
+def _criminal(case):
+    result = _base(
+        case, 'fir_number', 'police_station', 'arrest_date', 'bail_status',
+        'investigation_status', 'chargesheet_filed', 'chargesheet_date', 'witness_count',
+    )
+    result['charges'] = [charge.charge_name for charge in case.charges.all()]
+    result['evidence_types'] = [evidence.evidence_type for evidence in case.evidence_types.all()]
+    result['other_details'] = case.other_details
+
+    if case.murder_homicide:
+        result['murder_homicide'] = {
+            'victim_details': _person(case.murder_homicide.victim),
+            'weapon_used': case.murder_homicide.weapon_used,
+        }
+    elif case.theft:
+        result['theft'] = _fields(case.theft, 'property_type', 'estimated_value')
+    elif case.assault:
+        result['assault'] = _fields(case.assault, 'injury_severity', 'weapon_used')
+    elif case.fraud:
+        result['fraud'] = _fields(case.fraud, 'amount_involved', 'fraud_type')
+    return result
+
+
+def _civil(case):
+    result = _base(case, 'relief_sought', 'claim_amount', 'settlement_attempts', 'other_details')
+
+    if case.contract_dispute:
+        result['contract_dispute'] = _fields(case.contract_dispute, 'contract_type', 'breach_details')
+    elif case.property_dispute:
+        result['property_dispute'] = {
+            'properties': [
+                _property(detail.property_detail)
+                for detail in case.property_dispute.properties.all()
+            ],
+        }
+    elif case.money_recovery:
+        result['money_recovery'] = _fields(case.money_recovery, 'principal_amount', 'debt_documentation')
+    elif case.tort_claim:
+        result['tort_claim'] = _fields(case.tort_claim, 'tort_type', 'damages_claimed')
+    return result
+
+
+def _family_law(case):
+    result = _base(case, 'marriage_date', 'children_involved', 'other_details')
+
+    if case.divorce:
+        result['divorce'] = {
+            'divorce_type': case.divorce.divorce_type,
+            'grounds': [ground.ground for ground in case.divorce.grounds.all()],
+        }
+    elif case.maintenance:
+        result['maintenance'] = _fields(case.maintenance, 'maintenance_for', 'amount_claimed')
+    elif case.child_custody:
+        result['child_custody'] = {
+            'visitation_rights_proposed': case.child_custody.visitation_rights_proposed,
+            'children': [
+                {'age': detail.child_detail.age}
+                for detail in case.child_custody.children.all()
+            ],
+        }
+    elif case.domestic_violence:
+        result['domestic_violence'] = {
+            'protection_order_sought': case.domestic_violence.protection_order_sought,
+            'violence_types': [
+                violence.violence_type
+                for violence in case.domestic_violence.violence_types.all()
+            ],
+        }
+    return result
+
+
+def _property_law(case):
+    result = _base(case, 'other_details')
+    result['properties'] = [_property(prop.property_detail) for prop in case.properties.all()]
+
+    if case.title_dispute:
+        result['title_dispute'] = _fields(case.title_dispute, 'claim_basis', 'possession_status')
+    elif case.eviction_suit:
+        result['eviction_suit'] = _fields(case.eviction_suit, 'eviction_grounds', 'arrears_amount')
+    elif case.partition_suit:
+        result['partition_suit'] = {
+            'share_claimed': case.partition_suit.share_claimed,
+            'co_owners': [_person(owner.person) for owner in case.partition_suit.co_owners.all()],
+        }
+    return result
+
+
+def _consumer_dispute(case):
+    result = _base(
+        case, 'product_service_details', 'purchase_date', 'compensation_claimed', 'other_details',
+    )
+
+    if case.product_defect:
+        result['product_defect'] = _fields(case.product_defect, 'product_type', 'defect_nature')
+    elif case.service_deficiency:
+        result['service_deficiency'] = _fields(
+            case.service_deficiency, 'service_type', 'deficiency_nature',
+        )
+    elif case.unfair_trade_practice:
+        result['unfair_trade_practice'] = _fields(
+            case.unfair_trade_practice, 'practice_type', 'misleading_aspect',
+        )
+    return result
+
+
+def _labour_dispute(case):
+    result = _base(case, 'employer_details', 'employment_start_date', 'other_details')
+    result['employee'] = _person(case.employee)
+
+    if case.wrongful_termination:
+        result['wrongful_termination'] = _fields(
+            case.wrongful_termination, 'termination_date', 'termination_reason_stated',
+        )
+    elif case.wage_dispute:
+        result['wage_dispute'] = _fields(case.wage_dispute, 'disputed_amount', 'wage_dispute_type')
+    elif case.workplace_discrimination:
+        result['workplace_discrimination'] = {
+            'incident_details': case.workplace_discrimination.incident_details,
+            'grounds': [ground.ground for ground in case.workplace_discrimination.grounds.all()],
+        }
+    return result
+
+
+def _intellectual_property(case):
+    result = _base(case, 'ip_owner_details', 'other_details')
+
+    if case.patent:
+        result['patent'] = _fields(case.patent, 'invention_details', 'dispute_type')
+    elif case.trademark:
+        result['trademark'] = _fields(case.trademark, 'trademark_description', 'dispute_type')
+    elif case.copyright:
+        result['copyright'] = _fields(case.copyright, 'work_type', 'infringing_work_details')
+    return result
+
+
+def _public_law(case):
+    result = _base(case, 'other_details')
+
+    if case.constitutional:
+        result['constitutional'] = {
+            'government_action_challenged': case.constitutional.government_action_challenged,
+            'fundamental_rights': [
+                right.right for right in case.constitutional.fundamental_rights.all()
+            ],
+        }
+    elif case.taxation:
+        result['taxation'] = _fields(
+            case.taxation, 'assessment_year', 'disputed_amount', 'tax_authority', 'appeal_stage',
+        )
+    elif case.environmental:
+        result['environmental'] = _fields(
+            case.environmental, 'pollution_type', 'regulatory_authority', 'penalty_imposed',
+        )
+    return result
+
+
+CASE_SERIALIZERS = {
+    CaseTypeEnum.CRIMINAL: _criminal,
+    CaseTypeEnum.CIVIL: _civil,
+    CaseTypeEnum.FAMILY_LAW: _family_law,
+    CaseTypeEnum.PROPERTY_LAW: _property_law,
+    CaseTypeEnum.CONSUMER_DISPUTE: _consumer_dispute,
+    CaseTypeEnum.LABOUR_DISPUTE: _labour_dispute,
+    CaseTypeEnum.INTELLECTUAL_PROPERTY: _intellectual_property,
+    CaseTypeEnum.PUBLIC_LAW: _public_law,
+}
+
+
+def _relation_root(relation):
+    path = relation.prefetch_through if isinstance(relation, Prefetch) else relation
+    return path.split('__')[0]
+
+
+def _path_models(model, path):
+    models = []
+    for name in path.split('__'):
+        model = model._meta.get_field(name).related_model
+        models.append(model)
+    return models
+
+
+def related_models(case_type):
+    """Models besides the case table that serializing a case type reads"""
+    model = CASE_MODELS[case_type]
+    select, prefetch = CASE_RELATIONS[case_type]
+    found = set()
+    for relation in (*select, *prefetch):
+        if isinstance(relation, Prefetch):
+            found.update(_path_models(model, relation.prefetch_through))
+            joined = relation.queryset.query.select_related
+            for name in joined if isinstance(joined, dict) else ():
+                found.update(_path_models(relation.queryset.model, name))
+        else:
+            found.update(_path_models(model, relation))
+    return found
+
+
+def with_relations(queryset, inline=None):
+    """Add the select_related/prefetch_related a case queryset needs to serialize
+
+    `inline` overrides settings.CASE_DETAIL_STORAGE.
+    """
+    case_type = CASE_TYPES[queryset.model]
+    select, prefetch = CASE_RELATIONS[case_type]
+    if case_details.inline_storage() if inline is None else inline:
+        detail_fields = case_details.DETAIL_FIELDS[case_type]
+        select = [relation for relation in select if _relation_root(relation) not in detail_fields]
+        prefetch = [relation for relation in prefetch if _relation_root(relation) not in detail_fields]
+    if select:
+        # select_related() without fields would follow every FK
+        queryset = queryset.select_related(*select)
+    return queryset.prefetch_related(*prefetch)
+
+
+def serialize_case(case):
+    """Serialize a single case instance of any type
+
+    Reads relations lazily, so prefer serialize_cases() for more than one case.
+    """
+    serializer = CASE_SERIALIZERS[CASE_TYPES[type(case)]]
+    return serializer(case_details.readable(case))
+
+
+def serialize_cases(queryset, chunk_size=None):
+    """Yield a dict per case in `queryset` with a constant number of queries
+
+    One query for the cases and their subtype details plus one per
+    prefetched relation (with inline storage the details come with the
+    case row, and cases not converted yet load theirs lazily). With chunk_size the cases are streamed with iterator(),
+    prefetching per chunk.
+    """
+    serializer = CASE_SERIALIZERS[CASE_TYPES[queryset.model]]
+    queryset = with_relations(queryset)
+    cases = queryset.iterator(chunk_size=chunk_size) if chunk_size else queryset
+    for case in cases:
+        yield serializer(case_details.readable(case))
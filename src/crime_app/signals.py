@@ -0,0 +1,172 @@
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+
+from . import (
+    case_index,
+    database,
+    instrumentation,
+    search,
+    serializers,
+    stats,
+    view_cache,
+)
+from .models import CASE_MODELS, CaseIndex, CaseStatsRollup
+
+
+def _rollup_values(case_type, instance):
+    return {field: getattr(instance, field) for field in stats.rollup_fields(case_type)}
+
+
+def _connect(signal, receiver, sender, name):
+    signal.connect(receiver, sender=sender, dispatch_uid=f"{name}:{sender._meta.label}")
+
+
+# CaseStatsRollup maintenance
+
+def rollup_capture_previous(case_type):
+    def receiver(sender, instance, **kwargs):
+        """Remember the stored values of a case that is about to be updated"""
+        instance._rollup_previous = None
+        if not instance._state.adding and instance.pk is not None:
+            instance._rollup_previous = (
+                sender.objects.filter(pk=instance.pk)
+                .values(*stats.rollup_fields(case_type))
+                .first()
+            )
+    return receiver
+
+
+def rollup_on_save(case_type):
+    def receiver(sender, instance, created, **kwargs):
+        previous = None if created else getattr(instance, "_rollup_previous", None)
+        instance._rollup_previous = None
+        deltas = stats.rollup_delta(
+            case_type, old=previous, new=_rollup_values(case_type, instance)
+        )
+        stats.apply_rollup_delta(case_type, deltas)
+    return receiver
+
+
+def rollup_on_delete(case_type):
+    def receiver(sender, instance, **kwargs):
+        deltas = stats.rollup_delta(case_type, old=_rollup_values(case_type, instance))
+        stats.apply_rollup_delta(case_type, deltas)
+    return receiver
+
+
+def rollup_related(case_type, relation, sign):
+    def receiver(sender, created=True, **kwargs):
+        if created:
+            stats.apply_rollup_delta(case_type, {(relation, ""): [sign, 0, 0]})
+    return receiver
+
+
+def build_missing_rollups(sender, **kwargs):
+    """Build the rollups of case types that have none, e.g. after the first migrate"""
+    if sender.label != CaseStatsRollup._meta.app_label:
+        return
+    executor = MigrationExecutor(connection)
+    if executor.migration_plan(executor.loader.graph.leaf_nodes()):
+        # Migrated to an older state, where the models don't match the tables
+        return
+    for case_type in CASE_MODELS:
+        if not stats.rollups_built(case_type):
+            stats.rebuild_rollups(case_type)
+
+
+def connect_rollup_signals():
+    post_migrate.connect(build_missing_rollups, dispatch_uid="build_missing_rollups")
+    for case_type, model in CASE_MODELS.items():
+        _connect(pre_save, rollup_capture_previous(case_type), model, "rollup")
+        _connect(post_save, rollup_on_save(case_type), model, "rollup")
+        _connect(post_delete, rollup_on_delete(case_type), model, "rollup")
+
+        for relation in stats.ROLLUP_RELATED.get(case_type, ()):
+            related_model = model._meta.get_field(relation).related_model
+            _connect(post_save, rollup_related(case_type, relation, 1), related_model, "rollup")
+            _connect(post_delete, rollup_related(case_type, relation, -1), related_model, "rollup")
+
+
+# Cached dashboard invalidation
+
+def bump_view_cache(case_type):
+    def receiver(sender, **kwargs):
+        view_cache.bump_versions(case_type)
+    return receiver
+
+
+def connect_cache_signals():
+    for case_type, model in CASE_MODELS.items():
+        _connect(post_save, bump_view_cache(case_type), model, "view_cache")
+        _connect(post_delete, bump_view_cache(case_type), model, "view_cache")
+
+        # Detail and child rows (including the rollups' related counts):
+        # cached views and export ETags of the type cover them too. Shared
+        # models such as Person serve several types, hence the per-type uid
+        for related_model in serializers.related_models(case_type):
+            _connect(post_save, bump_view_cache(case_type), related_model, f"view_cache:{case_type.value}")
+            _connect(post_delete, bump_view_cache(case_type), related_model, f"view_cache:{case_type.value}")
+
+
+# CaseIndex and search index maintenance (queryset.update() and
+# bulk_create() bypass these; run backfill_case_index and
+# rebuild_search_index after bulk writes)
+
+def index_on_save(case_type):
+    def receiver(sender, instance, **kwargs):
+        case_index_id = case_index.index_case(case_type, instance)
+        search.index_case(case_type, instance.pk, case_index_id)
+    return receiver
+
+
+def index_on_delete(sender, instance, **kwargs):
+    case_index.unindex_case(instance)
+
+
+def search_on_detail_save(case_type, relation):
+    def receiver(sender, instance, created, **kwargs):
+        """Reindex the case whose subtype detail text changed"""
+        if created:
+            # A new detail is indexed when the case pointing at it is saved
+            return
+        model = CASE_MODELS[case_type]
+        for pk in model.objects.filter(**{relation: instance}).values_list("pk", flat=True):
+            entry = CaseIndex.objects.filter(case_type=case_type, object_id=pk).values_list("pk", flat=True).first()
+            if entry is not None:
+                search.index_case(case_type, pk, entry)
+    return receiver
+
+
+def search_on_index_delete(sender, instance, **kwargs):
+    search.remove_cases([instance.pk])
+
+
+def connect_index_signals():
+    for case_type, model in CASE_MODELS.items():
+        _connect(post_save, index_on_save(case_type), model, "case_index")
+        _connect(post_delete, index_on_delete, model, "case_index")
+
+        relations = {path.split("__")[0] for path in search.SEARCH_FIELDS[case_type] if "__" in path}
+        for relation in relations:
+            detail_model = model._meta.get_field(relation).related_model
+            _connect(post_save, search_on_detail_save(case_type, relation), detail_model, f"search:{relation}")
+
+    _connect(post_delete, search_on_index_delete, CaseIndex, "search")
+    post_migrate.connect(search.forget_fts_tables, dispatch_uid="forget_fts_tables")
+
+
+# New connections: SQLite pragmas from the database profile, and query
+# counting for request metrics, including on the connections of the
+# threads ASGI runs sync views in
+
+def connect_connection_signals():
+    connection_created.connect(database.apply_pragmas, dispatch_uid="apply_pragmas")
+    connection_created.connect(instrumentation.install_query_recorder, dispatch_uid="install_query_recorder")
+
+
+connect_rollup_signals()
+connect_cache_signals()
+connect_index_signals()
+connect_connection_signals()
@@ -0,0 +1,305 @@
+import hashlib
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import BigIntegerField, Count, F, Max, Q, Sum
+
+from . import view_cache
+from .models import (
+    CASE_MODELS,
+    CaseIndex,
+    CaseStatsRollup,
+    CaseTypeEnum,
+    from_paise,
+    to_paise,
+)
+
+# Columns each case type's dashboard breaks its cases down by
+ROLLUP_DIMENSIONS = {
+    CaseTypeEnum.CRIMINAL: (
+        "subtype",
+        "investigation_status",
+        "bail_status",
+        "chargesheet_filed",
+    ),
+    CaseTypeEnum.CIVIL: ("subtype", "settlement_attempts"),
+    CaseTypeEnum.FAMILY_LAW: ("subtype", "children_involved"),
+    CaseTypeEnum.PROPERTY_LAW: ("subtype",),
+    CaseTypeEnum.CONSUMER_DISPUTE: ("subtype",),
+    CaseTypeEnum.LABOUR_DISPUTE: ("subtype",),
+    CaseTypeEnum.INTELLECTUAL_PROPERTY: ("subtype",),
+    CaseTypeEnum.PUBLIC_LAW: ("subtype",),
+}
+
+# Money column whose count and sum (in paise) are kept per bucket
+ROLLUP_MEASURES = {
+    CaseTypeEnum.CIVIL: "claim_amount",
+    CaseTypeEnum.CONSUMER_DISPUTE: "compensation_claimed",
+}
+
+# Reverse relations whose row counts are kept (e.g. properties per property case)
+ROLLUP_RELATED = {
+    CaseTypeEnum.PROPERTY_LAW: ("properties",),
+}
+
+# Bucket holding the per-type totals
+TOTAL_DIMENSION = "*"
+
+
+def case_counts():
+    """Count cases of every type in one GROUP BY over CaseIndex
+
+    CaseIndex holds a row per case of any type, so this is one scan of
+    its (case_type, created_at) index rather than a COUNT per table.
+    Returns a dict keyed by case type label ("Criminal", "Family Law", ...)
+    in CaseTypeEnum order. Types with no cases are reported as 0.
+    """
+    rows = CaseIndex.objects.order_by().values("case_type").annotate(count=Count("pk"))
+    counts = {case_type.label: 0 for case_type in CASE_MODELS}
+    for row in rows:
+        counts[CaseTypeEnum(row["case_type"]).label] = row["count"]
+    return counts
+
+
+def case_fingerprint(case_types=None):
+    """ETag for the cases of these types and what serializing them reads
+
+    MAX(updated_at) and COUNT(*) over CaseIndex (an edit moves the former,
+    a delete changes the latter); for all types these are an index seek
+    on caseindex_updated_idx and a count of it rather than a scan of every
+    case table. Plus the types' view cache versions, which signals bump on
+    saves and deletes of their detail and child rows too. Those rows carry
+    no timestamps, so without a shared cache (settings.CACHE_BACKEND) an
+    edit to one of them is only seen by the process that made it.
+    """
+    case_types = sorted(case_types or CASE_MODELS)
+    rows = CaseIndex.objects.order_by()
+    if len(case_types) < len(CASE_MODELS):
+        rows = rows.filter(case_type__in=case_types)
+
+    # Two queries: SQLite only optimizes a lone MAX() or COUNT(*)
+    state = (rows.aggregate(last_modified=Max("updated_at"))["last_modified"], rows.count())
+    versions = view_cache.case_versions(case_types)
+    return hashlib.md5(repr((case_types, state, versions)).encode()).hexdigest()
+
+
+# Rollup maintenance
+
+def rollup_fields(case_type):
+    """Case fields that determine which rollup buckets a case contributes to"""
+    fields = list(ROLLUP_DIMENSIONS[case_type])
+    if case_type in ROLLUP_MEASURES:
+        fields.append(ROLLUP_MEASURES[case_type])
+    return fields
+
+
+def _encode(value):
+    return "" if value is None else str(value)
+
+
+def _decode(model, dimension, value):
+    field = model._meta.get_field(dimension)
+    if value == "" and field.null:
+        return None
+    if field.get_internal_type() == "BooleanField":
+        return value == "True"
+    return value
+
+
+def rollup_delta(case_type, old=None, new=None):
+    """Per-bucket changes for a case going from `old` to `new` field values
+
+    Either side may be None for a created or deleted case. Each change is
+    [count, measure_count, measure_sum] with the sum in integer paise, so
+    applying deltas never drifts from a full recompute; buckets that end
+    up unchanged are left out.
+    """
+    measure_field = ROLLUP_MEASURES.get(case_type)
+    deltas = defaultdict(lambda: [0, 0, 0])
+
+    for values, sign in ((old, -1), (new, 1)):
+        if values is None:
+            continue
+        measure = to_paise(values[measure_field]) if measure_field else None
+        buckets = [(TOTAL_DIMENSION, "")] + [
+            (dimension, _encode(values[dimension]))
+            for dimension in ROLLUP_DIMENSIONS[case_type]
+        ]
+        for bucket in buckets:
+            delta = deltas[bucket]
+            delta[0] += sign
+            if measure is not None:
+                delta[1] += sign
+                delta[2] += sign * measure
+
+    return {bucket: delta for bucket, delta in deltas.items() if any(delta)}
+
+
+def rollups_built(case_type):
+    """Whether a case type has rollup rows; compute_rollups() always emits its total"""
+    return CaseStatsRollup.objects.filter(case_type=case_type, dimension=TOTAL_DIMENSION).exists()
+
+
+def rebuild_rollups(case_type):
+    """Replace a case type's rollup rows with freshly computed ones"""
+    with transaction.atomic():
+        CaseStatsRollup.objects.filter(case_type=case_type).delete()
+        return CaseStatsRollup.objects.bulk_create(compute_rollups(case_type))
+
+
+def apply_rollup_delta(case_type, deltas):
+    """Add the changes from rollup_delta() to the stored rollup rows
+
+    A delta is only meaningful on top of a built rollup. When a bucket is
+    missing and so is the type's total, the type is rebuilt from its case
+    table instead (which already holds the change being applied).
+    """
+    for (dimension, value), (count, measure_count, measure_sum) in deltas.items():
+        lookup = {"case_type": case_type, "dimension": dimension, "value": value}
+        changes = {
+            "count": F("count") + count,
+            "measure_count": F("measure_count") + measure_count,
+            "measure_sum": F("measure_sum") + measure_sum,
+        }
+        if CaseStatsRollup.objects.filter(**lookup).update(**changes):
+            continue
+        if not rollups_built(case_type):
+            rebuild_rollups(case_type)
+            return
+        try:
+            with transaction.atomic():
+                CaseStatsRollup.objects.create(
+                    **lookup,
+                    count=count,
+                    measure_count=measure_count,
+                    measure_sum=measure_sum,
+                )
+        except IntegrityError:
+            # Another writer created the row since our update
+            CaseStatsRollup.objects.filter(**lookup).update(**changes)
+
+
+def _dimension_buckets(model, dimension):
+    """(encoded value, condition) for every value a dimension can take
+
+    Values come from the field's TextChoices (True/False for booleans),
+    plus a NULL bucket for nullable fields.
+    """
+    field = model._meta.get_field(dimension)
+    if field.get_internal_type() == "BooleanField":
+        values = [True, False]
+    else:
+        values = [value for value, _label in field.choices]
+
+    buckets = [(_encode(value), Q(**{dimension: value})) for value in values]
+    if field.null:
+        buckets.append(("", Q(**{f"{dimension}__isnull": True})))
+    return buckets
+
+
+def compute_rollups(case_type):
+    """Aggregate one case table into unsaved CaseStatsRollup rows
+
+    Every bucket is a filtered Count/Sum in a single aggregate() call, so
+    the case table is scanned once however many dimensions it has.
+    """
+    model = CASE_MODELS[case_type]
+    measure = ROLLUP_MEASURES.get(case_type)
+
+    buckets = [(TOTAL_DIMENSION, "", None)] + [
+        (dimension, value, condition)
+        for dimension in ROLLUP_DIMENSIONS[case_type]
+        for value, condition in _dimension_buckets(model, dimension)
+    ]
+
+    aggregates = {}
+    for index, (_dimension, _value, condition) in enumerate(buckets):
+        aggregates[f"count_{index}"] = Count("pk", filter=condition)
+        if measure:
+            aggregates[f"measure_count_{index}"] = Count(measure, filter=condition)
+            # Raw paise rather than MoneyField's Decimal rupees
+            aggregates[f"measure_sum_{index}"] = Sum(measure, filter=condition, output_field=BigIntegerField())
+    result = model.objects.aggregate(**aggregates)
+
+    rows = []
+    for index, (dimension, value, _condition) in enumerate(buckets):
+        # Keep the rollup sparse, like a GROUP BY, but always emit the total
+        if index and not result[f"count_{index}"]:
+            continue
+        rows.append(CaseStatsRollup(
+            case_type=case_type,
+            dimension=dimension,
+            value=value,
+            count=result[f"count_{index}"],
+            measure_count=result.get(f"measure_count_{index}") or 0,
+            measure_sum=result.get(f"measure_sum_{index}") or 0,
+        ))
+
+    for relation in ROLLUP_RELATED.get(case_type, ()):
+        related_model = model._meta.get_field(relation).related_model
+        rows.append(CaseStatsRollup(
+            case_type=case_type,
+            dimension=relation,
+            value="",
+            count=related_model.objects.count(),
+        ))
+    return rows
+
+
+# Rollup reads
+
+class CaseBreakdown:
+    """Dashboard statistics for one case type, built from rollup rows"""
+
+    def __init__(self, case_type, rows):
+        model = CASE_MODELS[case_type]
+        self.case_type = case_type
+        self.total = 0
+        self.measure = {"count": 0, "sum": 0}
+        self.related = {relation: 0 for relation in ROLLUP_RELATED.get(case_type, ())}
+        self.dimensions = {dimension: {} for dimension in ROLLUP_DIMENSIONS[case_type]}
+
+        for row in rows:
+            if row.dimension == TOTAL_DIMENSION:
+                self.total = row.count
+                self.measure = {"count": row.measure_count, "sum": row.measure_sum}
+            elif row.dimension in self.related:
+                self.related[row.dimension] = row.count
+            elif row.dimension in self.dimensions and row.count:
+                value = _decode(model, row.dimension, row.value)
+                self.dimensions[row.dimension][value] = row.count
+
+    def grouped(self, dimension):
+        """Counts per value, shaped like values(dimension).annotate(count=...)"""
+        return [
+            {dimension: value, "count": count}
+            for value, count in self.dimensions[dimension].items()
+        ]
+
+    def count(self, dimension, value):
+        return self.dimensions[dimension].get(value, 0)
+
+    @property
+    def measure_sum(self):
+        """Total of the measure in rupees, exact"""
+        return from_paise(self.measure["sum"]) if self.measure["count"] else None
+
+    @property
+    def measure_avg(self):
+        """Mean of the measure in rupees, rounded to the paisa"""
+        if not self.measure["count"]:
+            return None
+        mean = from_paise(self.measure["sum"]) / self.measure["count"]
+        return from_paise(to_paise(mean))
+
+
+def case_breakdown(case_type):
+    """Dashboard statistics for one case type
+
+    Read from CaseStatsRollup in a single query. Falls back to aggregating
+    the case table when the rollup has not been built for this type yet.
+    """
+    rows = list(CaseStatsRollup.objects.filter(case_type=case_type))
+    if not rows:
+        rows = compute_rollups(case_type)
+    return CaseBreakdown(case_type, rows)
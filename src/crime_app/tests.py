@@ -0,0 +1,476 @@
+from decimal import Decimal
+from functools import partial, wraps
+from io import StringIO
+from unittest import mock
+
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models import BigIntegerField, ExpressionWrapper, F, Sum
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from . import case_list, crime_matrix, instrumentation, search, stats, views
+from .admin import EstimatedCountPaginator
+from .case_details import DETAIL_FIELDS
+from .dataset import WORDS, generate_cases
+from .instrumentation import QueryBudgetExceeded
+from .main import case_to_dict
+from .models import (
+    CASE_MODELS,
+    CaseStatsRollup,
+    CaseTypeEnum,
+    CivilCase,
+    CriminalCase,
+    PropertyDetail,
+    PropertyLawCase,
+    PropertyLawCaseProperty,
+)
+
+
+def _with_queries(func, count):
+    @wraps(func)
+    def wrapped(*args, **kwargs):
+        for _ in range(count):
+            User.objects.exists()
+        return func(*args, **kwargs)
+    return wrapped
+
+
+@override_settings(QUERY_BUDGET_STRICT=True)
+class QueryBudgetTests(TestCase):
+    """Every view with a query_budget() stays within it, and raises past it"""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_cases", count=40, seed=1, stdout=StringIO())
+        cls.user = User.objects.create_user("budget", password="budget")
+
+    def setUp(self):
+        # Signed in, so rendered pages load the session and the user too
+        self.client.force_login(self.user)
+
+    def get(self, path):
+        # Cached views would skip their queries
+        cache.clear()
+        response = self.client.get(path)
+        if response.streaming:
+            # Streaming views read the cases while the content is consumed
+            b"".join(response.streaming_content)
+        return response
+
+    def assertQueryBudget(self, view, path, callee):
+        """`view` fits its budget at `path`, and raises once a query over it
+
+        `callee` is the (object, attribute name) of something the view
+        calls, made to run the extra queries.
+        """
+        response = self.get(path)
+        self.assertEqual(response.status_code, 200)
+        request = response.wsgi_request
+        used = len(request._query_recorder.queries) - request._view_query_start
+        self.assertLessEqual(used, view.query_budget)
+
+        owner, name = callee
+        extra = _with_queries(getattr(owner, name), view.query_budget - used + 1)
+        with mock.patch.object(owner, name, extra), self.assertRaises(QueryBudgetExceeded):
+            self.get(path)
+
+    def test_home(self):
+        self.assertQueryBudget(views.home, reverse("legal_app:home"), (stats, "case_counts"))
+
+    def test_criminal_dashboard(self):
+        path = reverse("legal_app:criminal_dashboard")
+        self.assertQueryBudget(views.criminal_dashboard, path, (stats, "case_breakdown"))
+
+    def test_civil_dashboard(self):
+        path = reverse("legal_app:civil_dashboard")
+        self.assertQueryBudget(views.civil_dashboard, path, (stats, "case_breakdown"))
+
+    def test_family_law_dashboard(self):
+        path = reverse("legal_app:family_law_dashboard")
+        self.assertQueryBudget(views.family_law_dashboard, path, (stats, "case_breakdown"))
+
+    def test_property_law_dashboard(self):
+        path = reverse("legal_app:property_law_dashboard")
+        self.assertQueryBudget(views.property_law_dashboard, path, (stats, "case_breakdown"))
+
+    def test_consumer_dashboard(self):
+        path = reverse("legal_app:consumer_dashboard")
+        self.assertQueryBudget(views.consumer_dashboard, path, (stats, "case_breakdown"))
+
+    def test_labour_dashboard(self):
+        path = reverse("legal_app:labour_dashboard")
+        self.assertQueryBudget(views.labour_dashboard, path, (stats, "case_breakdown"))
+
+    def test_ip_dashboard(self):
+        path = reverse("legal_app:ip_dashboard")
+        self.assertQueryBudget(views.ip_dashboard, path, (stats, "case_breakdown"))
+
+    def test_public_law_dashboard(self):
+        path = reverse("legal_app:public_law_dashboard")
+        self.assertQueryBudget(views.public_law_dashboard, path, (stats, "case_breakdown"))
+
+    def test_case_type_distribution_api(self):
+        path = reverse("legal_app:case_type_distribution_api")
+        self.assertQueryBudget(views.case_type_distribution_api, path, (stats, "case_counts"))
+
+    def test_crime_state_totals_api(self):
+        path = reverse("legal_app:crime_state_totals_api") + "?window=3"
+        self.assertQueryBudget(views.crime_state_totals_api, path, (crime_matrix, "get_crime_matrix"))
+
+    def test_crime_yoy_api(self):
+        path = reverse("legal_app:crime_yoy_api")
+        self.assertQueryBudget(views.crime_yoy_api, path, (crime_matrix, "get_crime_matrix"))
+
+    def test_crime_shares_api(self):
+        path = reverse("legal_app:crime_shares_api")
+        self.assertQueryBudget(views.crime_shares_api, path, (crime_matrix, "get_crime_matrix"))
+
+    def test_export_cases_api(self):
+        path = reverse("legal_app:export_cases_api")
+        self.assertQueryBudget(views.export_cases_api, path, (stats, "case_fingerprint"))
+
+    def test_recent_cases_api(self):
+        path = reverse("legal_app:recent_cases_api")
+        self.assertQueryBudget(views.recent_cases_api, path, (case_list, "recent_cases"))
+
+    def test_case_list_api(self):
+        path = reverse("legal_app:case_list_api", kwargs={"case_type": CaseTypeEnum.CRIMINAL.value})
+        self.assertQueryBudget(views.case_list_api, path, (case_list, "case_page"))
+
+    def test_search_api(self):
+        path = reverse("legal_app:search_api") + "?q=notice+claim"
+        self.assertQueryBudget(views.search_api, path, (search, "search"))
+
+    def test_metrics_api(self):
+        path = reverse("legal_app:metrics_api")
+        self.assertQueryBudget(views.metrics_api, path, (instrumentation.metrics, "snapshot"))
+
+
+class CaseStatsRollupTests(TestCase):
+    """Signals keep the stored rollups equal to compute_rollups() through ORM writes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        generate_cases(80, seed="rollups")
+        # generate_cases bulk-creates, bypassing the rollup signals
+        call_command("rebuild_case_stats", stdout=StringIO())
+
+    def assertRollupsMatch(self):
+        def buckets(rows):
+            # Deltas can leave emptied buckets that a recompute leaves out
+            return {
+                (row.dimension, row.value): (row.count, row.measure_count, row.measure_sum)
+                for row in rows if row.count or row.measure_count or row.measure_sum
+            }
+
+        for case_type in CASE_MODELS:
+            with self.subTest(case_type=case_type):
+                stored = CaseStatsRollup.objects.filter(case_type=case_type)
+                self.assertEqual(buckets(stored), buckets(stats.compute_rollups(case_type)))
+
+    def other_choice(self, case, dimension):
+        field = case._meta.get_field(dimension)
+        if field.get_internal_type() == "BooleanField":
+            return not getattr(case, dimension)
+        return next(value for value, _label in field.choices if value != getattr(case, dimension))
+
+    def test_create(self):
+        for case_type, model in CASE_MODELS.items():
+            # A copy of an existing case, without its one-to-one detail
+            case = model.objects.order_by("pk").first()
+            case.pk = None
+            case._state.adding = True
+            for name in DETAIL_FIELDS[case_type]:
+                setattr(case, name, None)
+            case.save()
+        self.assertRollupsMatch()
+
+    def test_edit(self):
+        for case_type, model in CASE_MODELS.items():
+            for case in model.objects.order_by("pk")[:3]:
+                for dimension in stats.ROLLUP_DIMENSIONS[case_type]:
+                    setattr(case, dimension, self.other_choice(case, dimension))
+                measure = stats.ROLLUP_MEASURES.get(case_type)
+                if measure:
+                    setattr(case, measure, None if getattr(case, measure) else Decimal("1250.75"))
+                case.save()
+        self.assertRollupsMatch()
+
+    def test_change_case_type(self):
+        # The subtype is a case's type within its table
+        for model in CASE_MODELS.values():
+            case = model.objects.order_by("-pk").first()
+            case.subtype = self.other_choice(case, "subtype")
+            case.save(update_fields=["subtype"])
+        self.assertRollupsMatch()
+
+    def test_delete(self):
+        for model in CASE_MODELS.values():
+            for case in model.objects.order_by("pk")[:2]:
+                case.delete()
+        self.assertRollupsMatch()
+
+    def test_related_rows(self):
+        case = PropertyLawCase.objects.order_by("pk").first()
+        detail = PropertyDetail.objects.create(address="rollup", value=Decimal("100.00"))
+        PropertyLawCaseProperty.objects.create(case=case, property_detail=detail)
+        self.assertRollupsMatch()
+        case.properties.first().delete()
+        self.assertRollupsMatch()
+
+
+class CaseSearchTests(TestCase):
+    """The FTS5 and postings backends find the same cases, and stay in sync with writes"""
+
+    backends = ("fts5", "postings")
+
+    @classmethod
+    def setUpTestData(cls):
+        generate_cases(150, seed="search")
+        # Both indexes are built; CASE_SEARCH_BACKEND picks the one searched
+        for backend in cls.backends:
+            with override_settings(CASE_SEARCH_BACKEND=backend):
+                call_command("rebuild_search_index", stdout=StringIO())
+
+    def found(self, query, case_type=None):
+        # Every match: the backends rank differently, so compare sets
+        results = search.search(query, case_type=case_type, limit=1000)
+        return {(result["case_type"], result["id"]) for result in results}
+
+    def test_backends_agree(self):
+        queries = [*WORDS, "notice claim", "contract payment delay", "Evidence, HEARING!", "unknownword"]
+        for query in queries:
+            for case_type in (None, CaseTypeEnum.CIVIL):
+                with self.subTest(query=query, case_type=case_type):
+                    results = []
+                    for backend in self.backends:
+                        with self.settings(CASE_SEARCH_BACKEND=backend):
+                            results.append(self.found(query, case_type))
+                    self.assertEqual(results[0], results[1])
+        with self.settings(CASE_SEARCH_BACKEND="fts5"):
+            self.assertTrue(self.found("notice"))
+            self.assertFalse(self.found("unknownword"))
+
+    def test_writes_keep_index_in_sync(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend), self.settings(CASE_SEARCH_BACKEND=backend):
+                case = CriminalCase.objects.order_by("pk").first()
+                key = (CaseTypeEnum.CRIMINAL.value, case.pk)
+
+                case.other_details = "Zanzibar notice"
+                case.save()
+                self.assertEqual(self.found("zanzibar"), {key})
+                case.other_details = "Quokka notice"
+                case.save()
+                self.assertFalse(self.found("zanzibar"))
+                self.assertEqual(self.found("quokka"), {key})
+
+                # Text held in a subtype detail row
+                civil = CivilCase.objects.filter(contract_dispute__isnull=False).order_by("pk").first()
+                civil.contract_dispute.breach_details = "Marmalade shipment"
+                civil.contract_dispute.save()
+                self.assertEqual(self.found("marmalade"), {(CaseTypeEnum.CIVIL.value, civil.pk)})
+
+                case.delete()
+                civil.delete()
+                self.assertFalse(self.found("quokka"))
+                self.assertFalse(self.found("marmalade"))
+                # Gone from the index itself, not just filtered from results
+                self.assertFalse(search.get_backend().search(["quokka"]))
+                self.assertFalse(search.get_backend().search(["marmalade"]))
+
+
+class EstimatedCountTests(TestCase):
+    """Admin changelists page through an overestimated table without empty pages"""
+
+    @classmethod
+    def setUpTestData(cls):
+        generate_cases(200, seed="admin")
+        # Deleted rows leave MAX(pk) well above the real count
+        pks = list(CriminalCase.objects.order_by("pk").values_list("pk", flat=True))
+        CriminalCase.objects.filter(pk__in=pks[:-7]).delete()
+        cls.estimate = pks[-1]
+        cls.user = User.objects.create_superuser("admin", password="admin")
+
+    def test_empty_page_counts_exactly(self):
+        paginator = EstimatedCountPaginator(CriminalCase.objects.order_by("pk"), 5, estimate_above=0)
+        self.assertEqual(paginator.count, self.estimate)
+        page = paginator.page(paginator.num_pages)
+        self.assertEqual(paginator.count, 7)
+        self.assertEqual(page.number, 2)
+        self.assertEqual(len(page.object_list), 2)
+
+    def test_changelist(self):
+        self.client.force_login(self.user)
+        model_admin = admin.site._registry[CriminalCase]
+        estimated = partial(EstimatedCountPaginator, estimate_above=0)
+        with mock.patch.object(model_admin, "paginator", estimated), \
+                mock.patch.object(model_admin, "list_per_page", 5):
+            path = reverse("admin:legal_app_criminalcase_changelist")
+            response = self.client.get(path)
+            self.assertEqual(response.context["cl"].result_count, self.estimate)
+
+            last_page = -(-self.estimate // 5)
+            response = self.client.get(path, {"p": last_page})
+        self.assertEqual(response.status_code, 200)
+        changelist = response.context["cl"]
+        self.assertEqual(changelist.result_count, 7)
+        self.assertEqual(changelist.page_num, 2)
+        self.assertEqual(len(changelist.result_list), 2)
+
+
+class CaseDetailStorageTests(TestCase):
+    """convert_case_details moves subtype details without changing how cases read"""
+
+    @classmethod
+    def setUpTestData(cls):
+        generate_cases(120, seed="case-details")
+
+    def convert(self, to, *case_types):
+        stdout = StringIO()
+        options = [f"--case-type={case_type.value}" for case_type in case_types]
+        call_command("convert_case_details", f"--to={to}", *options, stdout=stdout)
+        return stdout.getvalue()
+
+    def read_cases(self):
+        # Read in both storage modes, which must agree
+        results = []
+        for storage in ("tables", "inline"):
+            with self.settings(CASE_DETAIL_STORAGE=storage):
+                results.append({
+                    (case_type, case.pk): case_to_dict(case)
+                    for case_type, model in CASE_MODELS.items()
+                    for case in model.objects.order_by("pk")
+                })
+        self.assertEqual(results[0], results[1])
+        return results[0]
+
+    def search_documents(self):
+        return {
+            case_type: search._documents(case_type, {pk: pk for pk in model.objects.values_list("pk", flat=True)})
+            for case_type, model in CASE_MODELS.items()
+        }
+
+    def detail_rows(self):
+        return sum(
+            model._meta.get_field(name).related_model.objects.count()
+            for case_type, model in CASE_MODELS.items()
+            for name in DETAIL_FIELDS[case_type]
+        )
+
+    def test_round_trip(self):
+        cases = self.read_cases()
+        documents = self.search_documents()
+        self.assertTrue(self.detail_rows())
+
+        self.convert("inline")
+        self.assertEqual(self.detail_rows(), 0)
+        self.assertEqual(self.read_cases(), cases)
+        self.assertEqual(self.search_documents(), documents)
+
+        self.convert("tables")
+        self.assertFalse(any(model.objects.filter(details__isnull=False).exists() for model in CASE_MODELS.values()))
+        self.assertEqual(self.read_cases(), cases)
+        self.assertEqual(self.search_documents(), documents)
+
+    def test_conversion_is_idempotent(self):
+        cases = self.read_cases()
+        for to in ("inline", "tables"):
+            self.assertRegex(self.convert(to), r": [1-9]\d* cases converted")
+            self.assertNotRegex(self.convert(to), r": [1-9]\d* cases converted")
+            self.assertEqual(self.read_cases(), cases)
+
+    def test_partly_converted_cases(self):
+        # Cases of the other types keep their separate detail rows
+        cases = self.read_cases()
+        documents = self.search_documents()
+        self.convert("inline", CaseTypeEnum.CRIMINAL, CaseTypeEnum.FAMILY_LAW)
+        self.assertTrue(CASE_MODELS[CaseTypeEnum.CRIMINAL].objects.filter(details__isnull=False).exists())
+        self.assertTrue(self.detail_rows())
+        self.assertEqual(self.read_cases(), cases)
+        self.assertEqual(self.search_documents(), documents)
+
+
+class MoneyFieldTests(TestCase):
+    """Rupee amounts are stored as integer paise and read back exactly"""
+
+    def stored(self, pk):
+        # The raw column, bypassing MoneyField's conversion
+        raw = ExpressionWrapper(F("value"), output_field=BigIntegerField())
+        return PropertyDetail.objects.filter(pk=pk).values_list(raw, flat=True).get()
+
+    def test_round_trip(self):
+        cases = [
+            # (assigned, stored paise, read back)
+            (Decimal("1234.56"), 123456, Decimal("1234.56")),
+            ("0.10", 10, Decimal("0.10")),
+            (0.1, 10, Decimal("0.10")),
+            (7, 700, Decimal("7.00")),
+            (Decimal("10.005"), 1001, Decimal("10.01")),
+            (Decimal("10.004"), 1000, Decimal("10.00")),
+            (Decimal("-2.5"), -250, Decimal("-2.50")),
+            (Decimal("99999999999.99"), 9999999999999, Decimal("99999999999.99")),
+            (None, None, None),
+        ]
+        for assigned, paise, rupees in cases:
+            with self.subTest(assigned=assigned):
+                detail = PropertyDetail.objects.create(address="money", value=assigned)
+                self.assertEqual(self.stored(detail.pk), paise)
+                detail.refresh_from_db()
+                self.assertEqual(detail.value, rupees)
+                if rupees is not None:
+                    self.assertEqual(detail.value.as_tuple().exponent, -2)
+                    self.assertTrue(PropertyDetail.objects.filter(pk=detail.pk, value=rupees).exists())
+
+    def test_sum_is_exact(self):
+        for _ in range(3):
+            PropertyDetail.objects.create(address="sum", value=0.1)
+        total = PropertyDetail.objects.filter(address="sum").aggregate(total=Sum("value"))["total"]
+        self.assertEqual(total, Decimal("0.30"))
+
+    def test_invalid_amount(self):
+        with self.assertRaises(ValidationError) as context:
+            PropertyDetail(address="invalid", value="twelve").full_clean()
+        self.assertIn("value", context.exception.message_dict)
+
+
+class MoneyMigrationTests(TransactionTestCase):
+    """0007_money_paise converts stored rupees to paise, and back when reversed"""
+
+    before = ("legal_app", "0006_case_details")
+    after = ("legal_app", "0007_money_paise")
+    rupees = (1234.56, 0.1, 19.99, 0.0, None)
+    paise = (123456, 10, 1999, 0, None)
+
+    def migrate(self, *targets):
+        executor = MigrationExecutor(connection)
+        executor.migrate(list(targets))
+        # Models as of the targets, not the current model code
+        return executor.loader.project_state(list(targets)).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def values(self, apps):
+        model = apps.get_model("legal_app", "PropertyDetail")
+        return tuple(model.objects.order_by("pk").values_list("value", flat=True))
+
+    def test_forwards_and_backwards(self):
+        apps = self.migrate(self.before)
+        model = apps.get_model("legal_app", "PropertyDetail")
+        model.objects.bulk_create([model(address="migrated", value=value) for value in self.rupees])
+
+        self.assertEqual(self.values(self.migrate(self.after)), self.paise)
+        self.migrate(*MigrationExecutor(connection).loader.graph.leaf_nodes())
+        self.assertEqual(
+            list(PropertyDetail.objects.order_by("pk").values_list("value", flat=True)),
+            [None if value is None else Decimal(str(value)).quantize(Decimal("0.01")) for value in self.rupees],
+        )
+        self.assertEqual(self.values(self.migrate(self.before)), self.rupees)
@@ -16,5 +16,13 @@ urlpatterns = [
     
     # API endpoints
     path('api/case-type-distribution/', views.case_type_distribution_api, name='case_type_distribution_api'),
+    path('api/crime/state-totals/', views.crime_state_totals_api, name='crime_state_totals_api'),
+    path('api/crime/yoy/', views.crime_yoy_api, name='crime_yoy_api'),
+    path('api/crime/shares/', views.crime_shares_api, name='crime_shares_api'),
+    path('api/export/', views.export_cases_api, name='export_cases_api'),
+    path('api/recent-cases/', views.recent_cases_api, name='recent_cases_api'),
+    path('api/search/', views.search_api, name='search_api'),
+    path('api/cases/<str:case_type>/', views.case_list_api, name='case_list_api'),
+    path('api/metrics/', views.metrics_api, name='metrics_api'),
 ]
 
@@ -0,0 +1,88 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+
+from .models import CASE_MODELS
+
+
+def _version_key(case_type):
+    return f"case_version:{case_type}"
+
+
+def case_versions(case_types):
+    """Current cache version of each case type, in one get_many round trip
+
+    A missing version (never set, or evicted) starts from the clock rather
+    than 1, so it can never line up with a version an old entry was stored
+    under.
+    """
+    keys = [_version_key(case_type) for case_type in case_types]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_versions(*case_types):
+    """Invalidate every cached view that depends on these case types
+
+    Deferred until the current transaction commits (immediate outside
+    one): bumping earlier would let a concurrent request cache the rows
+    it can still see, the uncommitted change missing, under the new
+    version.
+    """
+    def bump():
+        for case_type in case_types or CASE_MODELS:
+            try:
+                cache.incr(_version_key(case_type))
+            except ValueError:
+                cache.set(_version_key(case_type), time.time_ns(), timeout=None)
+    transaction.on_commit(bump)
+
+
+def _user_key(request):
+    # base.html renders a different nav for signed-in users
+    user = getattr(request, "user", None)
+    return user.pk if user is not None and user.is_authenticated else "anon"
+
+
+def cache_per_case_type(*case_types, timeout=DEFAULT_TIMEOUT):
+    """Cache a view's response until a case of one of `case_types` changes
+
+    The key combines the view, the user, the full path and the current
+    version of each case type (all types if none are given). Requests with
+    pending flash messages bypass the cache, and only plain 200 responses
+    that set no cookies are stored.
+    """
+    case_types = case_types or tuple(CASE_MODELS)
+
+    def decorator(view):
+        def cache_key(request):
+            # None when the request must bypass the cache
+            if request.method not in ("GET", "HEAD") or get_messages(request):
+                return None
+            versions = ".".join(str(version) for version in case_versions(case_types))
+            path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+            return f"view:{view.__module__}.{view.__name__}:{_user_key(request)}:{versions}:{path}"
+
+        def store(key, response):
+            if key and response.status_code == 200 and not response.streaming and not response.cookies:
+                cache.set(key, response, timeout)
+
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            key = cache_key(request)
+            response = key and cache.get(key)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                store(key, response)
+            return response
+        return wrapped
+    return decorator
@@ -1,235 +1,235 @@
 # File: legal_app/views.py
+from datetime import UTC, datetime
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
 from django.shortcuts import render
-from django.db.models import Count, Avg, Sum
-from django.http import JsonResponse
-from .models import (
-    CriminalCase,
-    CivilCase,
-    FamilyLawCase,
-    PropertyLawCase,
-    ConsumerDisputeCase,
-    LabourDisputeCase,
-    IntellectualPropertyCase,
-    PublicLawCase,
-)
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import condition
+from . import case_list, crime_matrix, instrumentation, search, stats
+from .export import EXPORT_FORMATS, aiter_export, iter_export
+from .models import CaseTypeEnum
+from .instrumentation import query_budget
+from .view_cache import cache_per_case_type
 
 
+@query_budget(4)
+@cache_per_case_type()
 def home(request):
     """Home view with basic statistics for all case types"""
 
-    # Count cases by type
-    case_counts = {
-        "Criminal": CriminalCase.objects.count(),
-        "Civil": CivilCase.objects.count(),
-        "Family Law": FamilyLawCase.objects.count(),
-        "Property Law": PropertyLawCase.objects.count(),
-        "Consumer Dispute": ConsumerDisputeCase.objects.count(),
-        "Labour Dispute": LabourDisputeCase.objects.count(),
-        "Intellectual Property": IntellectualPropertyCase.objects.count(),
-        "Public Law": PublicLawCase.objects.count(),
-    }
+    # Count cases by type and fetch the 10 most recent cases across every
+    # type: one CaseIndex query each
+    case_counts = stats.case_counts()
+    recent_cases, _next_cursor = case_list.recent_cases(limit=10)
 
     # Total cases
     total_cases = sum(case_counts.values())
 
-    # Recent cases (last 10)
-    # We would need a common timestamp field to properly implement this
-    # Here's a conceptual implementation
-    recent_criminal_cases = CriminalCase.objects.all().order_by("-created_at")[:5]
-
     context = {
         "case_counts": case_counts,
         "total_cases": total_cases,
-        "recent_criminal_cases": recent_criminal_cases,
+        "recent_cases": recent_cases,
     }
 
     return render(request, "legal_app/home.html", context)
 
 
+@query_budget(4)
+@cache_per_case_type(CaseTypeEnum.CRIMINAL)
 def criminal_dashboard(request):
     """Dashboard for criminal cases"""
 
-    # Count cases by subtype
-    subtype_counts = CriminalCase.objects.values("subtype").annotate(count=Count("id"))
-
-    # Count cases by investigation status
-    investigation_status_counts = CriminalCase.objects.values(
-        "investigation_status"
-    ).annotate(count=Count("id"))
-
-    # Count cases by bail status
-    bail_status_counts = CriminalCase.objects.values("bail_status").annotate(
-        count=Count("id")
-    )
+    # Subtype, investigation status and bail status counts from the rollup
+    breakdown = stats.case_breakdown(CaseTypeEnum.CRIMINAL)
 
     # Chargesheet filed vs not filed
     chargesheet_counts = {
-        "Filed": CriminalCase.objects.filter(chargesheet_filed=True).count(),
-        "Not Filed": CriminalCase.objects.filter(chargesheet_filed=False).count(),
+        "Filed": breakdown.count("chargesheet_filed", True),
+        "Not Filed": breakdown.count("chargesheet_filed", False),
     }
 
     context = {
-        "subtype_counts": subtype_counts,
-        "investigation_status_counts": investigation_status_counts,
-        "bail_status_counts": bail_status_counts,
+        "subtype_counts": breakdown.grouped("subtype"),
+        "investigation_status_counts": breakdown.grouped("investigation_status"),
+        "bail_status_counts": breakdown.grouped("bail_status"),
         "chargesheet_counts": chargesheet_counts,
-        "total_cases": CriminalCase.objects.count(),
+        "total_cases": breakdown.total,
     }
 
     return render(request, "legal_app/criminal_dashboard.html", context)
 
 
+@query_budget(4)
+@cache_per_case_type(CaseTypeEnum.CIVIL)
 def civil_dashboard(request):
     """Dashboard for civil cases"""
 
-    # Count cases by subtype
-    subtype_counts = CivilCase.objects.values("subtype").annotate(count=Count("id"))
+    breakdown = stats.case_breakdown(CaseTypeEnum.CIVIL)
 
     # Average claim amount
-    avg_claim = CivilCase.objects.filter(claim_amount__isnull=False).aggregate(
-        Avg("claim_amount")
-    )
+    avg_claim = {"claim_amount__avg": breakdown.measure_avg}
 
     # Settlement attempts
     settlement_counts = {
-        "Attempted": CivilCase.objects.filter(settlement_attempts=True).count(),
-        "Not Attempted": CivilCase.objects.filter(settlement_attempts=False).count(),
+        "Attempted": breakdown.count("settlement_attempts", True),
+        "Not Attempted": breakdown.count("settlement_attempts", False),
     }
 
     context = {
-        "subtype_counts": subtype_counts,
+        "subtype_counts": breakdown.grouped("subtype"),
         "avg_claim": avg_claim,
         "settlement_counts": settlement_counts,
-        "total_cases": CivilCase.objects.count(),
+        "total_cases": breakdown.total,
     }
 
     return render(request, "legal_app/civil_dashboard.html", context)
 
 
+@query_budget(4)
+@cache_per_case_type(CaseTypeEnum.FAMILY_LAW)
 def family_law_dashboard(request):
     """Dashboard for family law cases"""
 
-    # Count cases by subtype
-    subtype_counts = FamilyLawCase.objects.values("subtype").annotate(count=Count("id"))
+    breakdown = stats.case_breakdown(CaseTypeEnum.FAMILY_LAW)
 
     # Children involved
     children_involved_counts = {
-        "Involved": FamilyLawCase.objects.filter(children_involved=True).count(),
-        "Not Involved": FamilyLawCase.objects.filter(children_involved=False).count(),
+        "Involved": breakdown.count("children_involved", True),
+        "Not Involved": breakdown.count("children_involved", False),
     }
 
     context = {
-        "subtype_counts": subtype_counts,
+        "subtype_counts": breakdown.grouped("subtype"),
         "children_involved_counts": children_involved_counts,
-        "total_cases": FamilyLawCase.objects.count(),
+        "total_cases": breakdown.total,
     }
 
     return render(request, "legal_app/family_law_dashboard.html", context)
 
 
+@query_budget(5)
+@cache_per_case_type(CaseTypeEnum.PROPERTY_LAW)
 def property_law_dashboard(request):
     """Dashboard for property law cases"""
 
-    # Count cases by subtype
-    subtype_counts = PropertyLawCase.objects.values("subtype").annotate(
-        count=Count("id")
-    )
+    breakdown = stats.case_breakdown(CaseTypeEnum.PROPERTY_LAW)
 
     # Total properties involved
-    property_count = PropertyLawCase.objects.aggregate(
-        total_properties=Count("properties")
-    )
+    property_count = {"total_properties": breakdown.related["properties"]}
 
     context = {
-        "subtype_counts": subtype_counts,
+        "subtype_counts": breakdown.grouped("subtype"),
         "property_count": property_count,
-        "total_cases": PropertyLawCase.objects.count(),
+        "total_cases": breakdown.total,
     }
 
     return render(request, "legal_app/property_law_dashboard.html", context)
 
 
+@query_budget(4)
+@cache_per_case_type(CaseTypeEnum.CONSUMER_DISPUTE)
 def consumer_dashboard(request):
     """Dashboard for consumer dispute cases"""
 
-    # Count cases by subtype
-    subtype_counts = ConsumerDisputeCase.objects.values("subtype").annotate(
-        count=Count("id")
-    )
+    breakdown = stats.case_breakdown(CaseTypeEnum.CONSUMER_DISPUTE)
 
     # Total compensation claimed
-    total_compensation = ConsumerDisputeCase.objects.filter(
-        compensation_claimed__isnull=False
-    ).aggregate(Sum("compensation_claimed"))
+    total_compensation = {"compensation_claimed__sum": breakdown.measure_sum}
 
     context = {
-        "subtype_counts": subtype_counts,
+        "subtype_counts": breakdown.grouped("subtype"),
         "total_compensation": total_compensation,
-        "total_cases": ConsumerDisputeCase.objects.count(),
+        "total_cases": breakdown.total,
     }
 
     return render(request, "legal_app/consumer_dashboard.html", context)
 
 
+@query_budget(4)
+@cache_per_case_type(CaseTypeEnum.LABOUR_DISPUTE)
 def labour_dashboard(request):
     """Dashboard for labour dispute cases"""
 
-    # Count cases by subtype
-    subtype_counts = LabourDisputeCase.objects.values("subtype").annotate(
-        count=Count("id")
-    )
+    breakdown = stats.case_breakdown(CaseTypeEnum.LABOUR_DISPUTE)
 
     context = {
-        "subtype_counts": subtype_counts,
-        "total_cases": LabourDisputeCase.objects.count(),
+        "subtype_counts": breakdown.grouped("subtype"),
+        "total_cases": breakdown.total,
     }
 
     return render(request, "legal_app/labour_dashboard.html", context)
 
 
+@query_budget(4)
+@cache_per_case_type(CaseTypeEnum.INTELLECTUAL_PROPERTY)
 def ip_dashboard(request):
     """Dashboard for intellectual property cases"""
 
-    # Count cases by subtype
-    subtype_counts = IntellectualPropertyCase.objects.values("subtype").annotate(
-        count=Count("id")
-    )
+    breakdown = stats.case_breakdown(CaseTypeEnum.INTELLECTUAL_PROPERTY)
 
     context = {
-        "subtype_counts": subtype_counts,
-        "total_cases": IntellectualPropertyCase.objects.count(),
+        "subtype_counts": breakdown.grouped("subtype"),
+        "total_cases": breakdown.total,
     }
 
     return render(request, "legal_app/ip_dashboard.html", context)
 
 
+@query_budget(4)
+@cache_per_case_type(CaseTypeEnum.PUBLIC_LAW)
 def public_law_dashboard(request):
     """Dashboard for public law cases"""
 
-    # Count cases by subtype
-    subtype_counts = PublicLawCase.objects.values("subtype").annotate(count=Count("id"))
+    breakdown = stats.case_breakdown(CaseTypeEnum.PUBLIC_LAW)
 
     context = {
-        "subtype_counts": subtype_counts,
-        "total_cases": PublicLawCase.objects.count(),
+        "subtype_counts": breakdown.grouped("subtype"),
+        "total_cases": breakdown.total,
     }
 
     return render(request, "legal_app/public_law_dashboard.html", context)
 
 
 # API endpoints for charts
+
+# Conditional GET. Case responses get an ETag only: MAX(updated_at) as a
+# Last-Modified would not move when a case is deleted
+
+def _case_tables_etag(request, *args, **kwargs):
+    # For views whose payload ?case_type= narrows
+    case_types = [
+        CaseTypeEnum(case_type)
+        for case_type in request.GET.getlist("case_type")
+        if case_type in CaseTypeEnum.values
+    ]
+    return stats.case_fingerprint(case_types)
+
+
+def _all_case_tables_etag(request, *args, **kwargs):
+    return stats.case_fingerprint()
+
+
+def _crime_csv_etag(request, *args, **kwargs):
+    source = crime_matrix.get_crime_matrix().source
+    return source and source["sha256"]
+
+
+def _crime_csv_last_modified(request, *args, **kwargs):
+    source = crime_matrix.get_crime_matrix().source
+    return source and datetime.fromtimestamp(source["mtime_ns"] / 1e9, tz=UTC)
+
+
+case_tables_condition = condition(etag_func=_case_tables_etag)
+all_case_tables_condition = condition(etag_func=_all_case_tables_etag)
+crime_csv_condition = condition(etag_func=_crime_csv_etag, last_modified_func=_crime_csv_last_modified)
+
+
+@query_budget(5)
+@all_case_tables_condition
+@cache_per_case_type()
 def case_type_distribution_api(request):
     """API endpoint for case type distribution chart"""
-    case_counts = {
-        "Criminal": CriminalCase.objects.count(),
-        "Civil": CivilCase.objects.count(),
-        "Family Law": FamilyLawCase.objects.count(),
-        "Property Law": PropertyLawCase.objects.count(),
-        "Consumer Dispute": ConsumerDisputeCase.objects.count(),
-        "Labour Dispute": LabourDisputeCase.objects.count(),
-        "Intellectual Property": IntellectualPropertyCase.objects.count(),
-        "Public Law": PublicLawCase.objects.count(),
-    }
+    case_counts = stats.case_counts()
 
     # Format for chart.js
     data = {
@@ -253,3 +253,203 @@ def case_type_distribution_api(request):
     }
 
     return JsonResponse(data)
+
+
+def _crime_query(request, matrix):
+    """Validate the crime/state query parameters shared by the crime APIs
+
+    Returns (crime, state indexes, error response or None).
+    """
+    crime = request.GET.get("crime", crime_matrix.TOTAL_CRIME)
+    states = request.GET.getlist("state")
+    if crime not in matrix.crime_index:
+        return None, None, JsonResponse({"error": f"Unknown crime: {crime}"}, status=400)
+    unknown = [state for state in states if state not in matrix.state_index]
+    if unknown:
+        return None, None, JsonResponse({"error": f"Unknown state: {', '.join(unknown)}"}, status=400)
+    return crime, [matrix.state_index[state] for state in states] or list(range(len(matrix.states))), None
+
+
+def _state_datasets(matrix, state_indexes, values):
+    return [
+        {"label": matrix.states[index], "data": crime_matrix.to_json(values[index])}
+        for index in state_indexes
+    ]
+
+
+@query_budget(0)
+@crime_csv_condition
+def crime_state_totals_api(request):
+    """API endpoint for yearly totals of one crime per state
+
+    Optional query parameters: crime (a crime column, default
+    total_ipc_crimes), state (repeatable) and window (trailing mean in years).
+    """
+    matrix = crime_matrix.get_crime_matrix()
+    crime, state_indexes, error = _crime_query(request, matrix)
+    if error:
+        return error
+
+    values = matrix.state_year_totals(crime)
+    years = matrix.years
+    window = request.GET.get("window")
+    if window:
+        if not window.isdigit() or not 1 <= int(window) <= len(years):
+            return JsonResponse({"error": f"Invalid window: {window}"}, status=400)
+        values = crime_matrix.rolling_mean(values, int(window))
+        years = years[int(window) - 1:]
+
+    return JsonResponse({
+        "labels": years,
+        "datasets": _state_datasets(matrix, state_indexes, values),
+    })
+
+
+@query_budget(0)
+@crime_csv_condition
+def crime_yoy_api(request):
+    """API endpoint for year-over-year change of one crime per state
+
+    Same crime/state parameters as crime_state_totals_api; changes are
+    fractions of the previous year, null where that year had no cases.
+    """
+    matrix = crime_matrix.get_crime_matrix()
+    crime, state_indexes, error = _crime_query(request, matrix)
+    if error:
+        return error
+
+    values = crime_matrix.yoy_change(matrix.state_year_totals(crime))
+    return JsonResponse({
+        "labels": matrix.years[1:],
+        "datasets": _state_datasets(matrix, state_indexes, values),
+    })
+
+
+@query_budget(0)
+@crime_csv_condition
+def crime_shares_api(request):
+    """API endpoint for each crime's share of total IPC crimes
+
+    Optional query parameters: state (default all of India) and year
+    (default the latest year in the data).
+    """
+    matrix = crime_matrix.get_crime_matrix()
+    state = request.GET.get("state")
+    year = request.GET.get("year", str(matrix.years[-1]))
+    if state is not None and state not in matrix.state_index:
+        return JsonResponse({"error": f"Unknown state: {state}"}, status=400)
+    if not year.isdigit() or int(year) not in matrix.year_index:
+        return JsonResponse({"error": f"Unknown year: {year}"}, status=400)
+
+    year_index = matrix.year_index[int(year)]
+    if state is None:
+        shares = matrix.national_shares()[year_index]
+    else:
+        shares = matrix.shares()[matrix.state_index[state], year_index]
+
+    crimes = [crime for crime in matrix.crimes if crime != crime_matrix.TOTAL_CRIME]
+    return JsonResponse({
+        "labels": crimes,
+        "datasets": [{
+            "label": f"{state or 'INDIA'} {year}",
+            "data": crime_matrix.to_json([shares[matrix.crime(crime)] for crime in crimes]),
+        }],
+    })
+
+
+@query_budget(2)
+@case_tables_condition
+def export_cases_api(request):
+    """Stream all cases as NDJSON (default) or a JSON array
+
+    Optional query parameters: format=ndjson|json and case_type (repeatable).
+    """
+    export_format = request.GET.get("format", "ndjson")
+    case_types = request.GET.getlist("case_type")
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({"error": f"Unknown format: {export_format}"}, status=400)
+    unknown = [case_type for case_type in case_types if case_type not in CaseTypeEnum.values]
+    if unknown:
+        return JsonResponse({"error": f"Unknown case type: {', '.join(unknown)}"}, status=400)
+
+    content_type = "application/x-ndjson" if export_format == "ndjson" else "application/json"
+    # Each handler only streams its own kind of iterator; it buffers the other
+    export = aiter_export if isinstance(request, ASGIRequest) else iter_export
+    response = StreamingHttpResponse(export(export_format, case_types), content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="legal_cases.{export_format}"'
+    return response
+
+
+@query_budget(2)
+def recent_cases_api(request):
+    """Newest cases across all case types, merged into one feed
+
+    Optional query parameters: cursor (the next_cursor of the previous
+    page) and limit (default 10, at most 200).
+    """
+    limit = request.GET.get("limit", "10")
+    if not limit.isdigit() or not 1 <= int(limit) <= case_list.MAX_PAGE_SIZE:
+        return JsonResponse({"error": f"Invalid limit: {limit}"}, status=400)
+    try:
+        results, next_cursor = case_list.recent_cases(int(limit), cursor=request.GET.get("cursor"))
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    return JsonResponse({"results": results, "next_cursor": next_cursor})
+
+
+@query_budget(4)
+def case_list_api(request, case_type):
+    """List cases of one type, newest first, with keyset pagination
+
+    Optional query parameters: cursor (the next_cursor of the previous
+    page), limit (default 50, at most 200) and one filter per dashboard
+    column, e.g. subtype=Theft or bail_status=Granted.
+    """
+    if case_type not in CaseTypeEnum.values:
+        return JsonResponse({"error": f"Unknown case type: {case_type}"}, status=404)
+    case_type = CaseTypeEnum(case_type)
+
+    limit = request.GET.get("limit", str(case_list.PAGE_SIZE))
+    if not limit.isdigit() or not 1 <= int(limit) <= case_list.MAX_PAGE_SIZE:
+        return JsonResponse({"error": f"Invalid limit: {limit}"}, status=400)
+    try:
+        filters = case_list.parse_filters(case_type, request.GET)
+        results, next_cursor = case_list.case_page(
+            case_type, filters, cursor=request.GET.get("cursor"), limit=int(limit)
+        )
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    return JsonResponse({"results": results, "next_cursor": next_cursor})
+
+
+@query_budget(4)
+def search_api(request):
+    """Ranked keyword search over the case free-text fields
+
+    Query parameters: q (every word must match), optional case_type and
+    limit (default 20, at most 200).
+    """
+    query = request.GET.get("q", "")
+    case_type = request.GET.get("case_type")
+    limit = request.GET.get("limit", "20")
+    if not search.tokenize(query):
+        return JsonResponse({"error": "Missing search query"}, status=400)
+    if case_type is not None and case_type not in CaseTypeEnum.values:
+        return JsonResponse({"error": f"Unknown case type: {case_type}"}, status=400)
+    if not limit.isdigit() or not 1 <= int(limit) <= case_list.MAX_PAGE_SIZE:
+        return JsonResponse({"error": f"Invalid limit: {limit}"}, status=400)
+
+    return JsonResponse({"results": search.search(query, case_type=case_type, limit=int(limit))})
+
+
+@query_budget(0)
+def metrics_api(request):
+    """Per-view query counts and timings recorded by RequestMetricsMiddleware
+
+    Process-local, and only served to INTERNAL_IPS or localhost.
+    """
+    if request.META.get("REMOTE_ADDR") not in {"127.0.0.1", "::1", *getattr(settings, "INTERNAL_IPS", ())}:
+        return JsonResponse({"error": "Forbidden"}, status=403)
+    return JsonResponse({"views": instrumentation.metrics.snapshot()})
@@ -24,6 +24,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its timings and query counts cover the whole stack
+    'crime_project.crime_app.instrumentation.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -52,15 +54,97 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'crime_project.wsgi.application'
+ASGI_APPLICATION = 'crime_project.asgi.application'
 
-# Database
-DATABASES = {
-    'default': {
+# Database profiles, picked with the DATABASE_PROFILE environment variable:
+#   development - SQLite as Django configures it, a connection per request
+#   production  - SQLite kept open between requests, in WAL mode so dashboard
+#                 reads don't block on generator writes, and with writers
+#                 waiting for the lock instead of failing "database is locked"
+#   postgres    - PostgreSQL from the POSTGRES_* variables with a psycopg
+#                 connection pool (pip install "psycopg[pool]")
+# PRAGMAS are run on every new SQLite connection (crime_app/database.py).
+DATABASE_PROFILES = {
+    'development': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+    },
+    'production': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Seconds a connection waits for a lock, and take the write lock
+            # when a transaction begins rather than failing to upgrade later
+            'timeout': 5,
+            'transaction_mode': 'IMMEDIATE',
+        },
+        'PRAGMAS': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'busy_timeout': 5000,
+            'mmap_size': 256 * 1024 * 1024,
+            'cache_size': -64 * 1024,  # KiB, i.e. 64MB of page cache
+            'temp_store': 'MEMORY',
+        },
+    },
+    'postgres': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('POSTGRES_DB', 'namma_suraksha'),
+        'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+        'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        # The pool replaces persistent connections, so CONN_MAX_AGE stays 0
+        'OPTIONS': {
+            'pool': {
+                'min_size': 2,
+                'max_size': int(os.environ.get('POSTGRES_POOL_SIZE', '10')),
+                'timeout': 10,
+            },
+        },
+    },
+}
+DATABASE_PROFILE = os.environ.get('DATABASE_PROFILE', 'development')
+DATABASES = {
+    'default': DATABASE_PROFILES[DATABASE_PROFILE],
+}
+
+# Cache (dashboard responses, see crime_app/view_cache.py)
+# Local memory is per process, so with several workers set CACHE_BACKEND
+# to "file" or "redis" for saves in one worker to invalidate the others.
+CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'namma-suraksha'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', str(BASE_DIR / 'data' / 'cache' / 'views')),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379/1'),
+}
+_cache_backend, _cache_location = CACHE_BACKENDS[os.environ.get('CACHE_BACKEND', 'locmem')]
+CACHES = {
+    'default': {
+        'BACKEND': _cache_backend,
+        'LOCATION': os.environ.get('CACHE_LOCATION', _cache_location),
+        'TIMEOUT': 300,
     }
 }
 
+# Request instrumentation (crime_app/instrumentation.py): raise instead of
+# logging when a view exceeds its query_budget(), and how many of the
+# slowest queries per view to keep for /api/metrics/. The test runner
+# turns strict budgets on.
+QUERY_BUDGET_STRICT = False
+REQUEST_METRICS_SLOW_QUERIES = 5
+TEST_RUNNER = 'crime_project.crime_app.test_runner.QueryBudgetTestRunner'
+
+# Case search backend: "auto" (SQLite FTS5 when available), "fts5" or
+# "postings" (portable inverted index in the SearchPosting table)
+CASE_SEARCH_BACKEND = 'auto'
+
+# Where case subtype details live (crime_app/case_details.py): "tables"
+# (the detail models, a row per case) or "inline" (a validated JSON column
+# on the case row). Switch with the convert_case_details command.
+CASE_DETAIL_STORAGE = 'tables'
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -91,3 +175,9 @@ STATICFILES_DIRS = [
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# District crime statistics (see the import_crime_csv command)
+CRIME_CSV_PATH = BASE_DIR / 'data' / 'crime.csv'
+
+# Memory-mapped binary copy of the crime CSV (see the compile_crime_cache command)
+CRIME_CACHE_DIR = BASE_DIR / 'data' / 'cache'